@@ -0,0 +1,47 @@
+import uuid
+
+import pytest
+
+from uuid_analysis import DistributionAccumulator, UUIDAnalyzer
+from uuid_array import UUIDArray
+
+
+def _sample():
+    sample = UUIDArray.random(3000)
+    edge_cases = UUIDArray.from_ints([0, (1 << 128) - 1, int("55" * 16, 16), int("0f" * 16, 16)])
+    return sample + edge_cases + sample[:7]
+
+
+@pytest.mark.parametrize("backend", ["python", "auto"])
+def test_analyze_distribution_leaves_per_uuid_state_alone(backend):
+    analyzer = UUIDAnalyzer()
+    analyzer.analyze_uuid(uuid.uuid4())
+    analyzer.analyze_distribution(_sample(), backend=backend)
+    assert len(analyzer.analyzed_uuids) == 1
+
+
+def test_numpy_backend_matches_python_backend():
+    pytest.importorskip("numpy")
+    sample = _sample()
+    python_stats = UUIDAnalyzer().analyze_distribution(sample, backend="python")
+    numpy_stats = UUIDAnalyzer().analyze_distribution(sample, backend="numpy")
+    assert numpy_stats.total_samples == python_stats.total_samples
+    assert numpy_stats.unique_count == python_stats.unique_count == len(sample) - 7
+    assert numpy_stats.collision_count == python_stats.collision_count == 7
+    assert numpy_stats.bit_distribution == python_stats.bit_distribution
+    assert numpy_stats.pattern_averages == python_stats.pattern_averages
+    assert numpy_stats.entropy == pytest.approx(python_stats.entropy, abs=1e-12)
+
+
+def test_numpy_backend_counts_duplicates_across_chunks():
+    pytest.importorskip("numpy")
+    sample = _sample()
+    accumulator = DistributionAccumulator("numpy")
+    for start in range(0, len(sample), 1000):
+        accumulator.feed(sample[start : start + 1000])
+    chunked = accumulator.result()
+    whole = UUIDAnalyzer().analyze_distribution(sample.tolist(), backend="numpy")
+    assert chunked.unique_count == whole.unique_count
+    assert chunked.bit_distribution == whole.bit_distribution
+    assert chunked.pattern_averages == whole.pattern_averages
+    assert chunked.entropy == pytest.approx(whole.entropy, abs=1e-12)
@@ -0,0 +1,76 @@
+import random
+import uuid
+
+import pytest
+
+from uuid_analysis import CollisionDetector, UUIDAnalyzer
+from uuid_array import UUIDArray
+
+
+def test_numpy_backend_rejects_approximate_collisions():
+    with pytest.raises(ValueError):
+        UUIDAnalyzer().analyze_distribution(
+            UUIDArray.random(10), backend="numpy", collision_mode="approximate"
+        )
+
+
+def test_invalid_collision_arguments_are_rejected_for_every_backend():
+    sample = UUIDArray.random(10)
+    for backend in ("python", "auto"):
+        with pytest.raises(ValueError):
+            UUIDAnalyzer().analyze_distribution(sample, backend, collision_mode="fuzzy")
+        with pytest.raises(ValueError):
+            UUIDAnalyzer().analyze_distribution(sample, backend, error_rate=1.5)
+
+
+def test_auto_backend_honours_approximate_collisions():
+    sample = [uuid.uuid4() for _ in range(200)]
+    stats = UUIDAnalyzer().analyze_distribution(
+        sample + sample[:10], backend="auto", collision_mode="approximate", error_rate=1e-6
+    )
+    assert stats.collision_count == 10
+
+
+def test_default_exact_detector_starts_small_and_grows():
+    detector = CollisionDetector()
+    assert len(detector._seen._high) <= 2048
+    values = [uuid.uuid4() for _ in range(5000)]
+    assert detector.feed(values + values[:3]) == 3
+
+
+def test_bloom_filter_false_positives_stay_near_error_rate():
+    rng = random.Random(0xB100)
+    false_positives = 0
+    for _ in range(200):
+        detector = CollisionDetector("approximate", 1e-6, expected_items=200)
+        for _ in range(200):
+            false_positives += detector.add_int(rng.getrandbits(128))
+    assert false_positives == 0
+
+
+def _reference_distribution(sample):
+    analyzer = UUIDAnalyzer()
+    analyses = [analyzer.analyze_uuid(u) for u in sample]
+    total = len(sample)
+    return {
+        "entropy": sum(a.bit_entropy for a in analyses) / total,
+        "bit_distribution": {
+            bit: sum((u.int >> (127 - bit)) & 1 for u in sample) / total for bit in range(128)
+        },
+        "pattern_averages": {
+            key: sum(a.bit_patterns[key] for a in analyses) / total
+            for key in ("consecutive_zeros", "consecutive_ones", "bit_transitions")
+        },
+    }
+
+
+def test_python_path_uses_running_totals_without_retaining_analyses():
+    sample = [uuid.uuid4() for _ in range(300)] + [uuid.UUID(int=0)]
+    analyzer = UUIDAnalyzer()
+    stats = analyzer.analyze_distribution(sample + sample[:5], backend="python")
+    expected = _reference_distribution(sample + sample[:5])
+    assert analyzer.analyzed_uuids == []
+    assert stats.collision_count == 5
+    assert stats.entropy == pytest.approx(expected["entropy"])
+    assert stats.bit_distribution == expected["bit_distribution"]
+    assert stats.pattern_averages == expected["pattern_averages"]
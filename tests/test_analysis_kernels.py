@@ -0,0 +1,80 @@
+import math
+import random
+import uuid
+from collections import Counter
+
+import pytest
+
+from uuid_analysis import UUIDAnalyzer
+from uuid_utils import generate_user_ids
+
+
+def _reference_bit_patterns(uuid_obj):
+    bits = bin(uuid_obj.int)[2:].zfill(128)
+    max_zero_run = max_one_run = current_zero_run = current_one_run = transitions = 0
+    for i in range(len(bits)):
+        if bits[i] == "0":
+            current_zero_run += 1
+            max_zero_run = max(max_zero_run, current_zero_run)
+            current_one_run = 0
+            if i > 0 and bits[i - 1] == "1":
+                transitions += 1
+        else:
+            current_one_run += 1
+            max_one_run = max(max_one_run, current_one_run)
+            current_zero_run = 0
+            if i > 0 and bits[i - 1] == "0":
+                transitions += 1
+    return {
+        "consecutive_zeros": max_zero_run,
+        "consecutive_ones": max_one_run,
+        "alternating": 0,
+        "bit_transitions": transitions,
+    }
+
+
+def _reference_bit_entropy(uuid_obj):
+    hex_str = uuid_obj.hex
+    entropy = 0.0
+    for count in Counter(hex_str).values():
+        probability = count / len(hex_str)
+        entropy -= probability * math.log2(probability)
+    return entropy
+
+
+@pytest.fixture(scope="module")
+def samples():
+    rng = random.Random(0xC0FFEE)
+    values = [0, (1 << 128) - 1, 1, 1 << 127, int("55" * 16, 16), int("0f" * 16, 16)]
+    values += [rng.getrandbits(rng.randint(1, 128)) for _ in range(5000)]
+    values += [rng.getrandbits(128) & rng.getrandbits(128) for _ in range(2500)]
+    values += [u.int for u in generate_user_ids(2500)]
+    return [uuid.UUID(int=value) for value in values]
+
+
+def test_bit_patterns_match_reference(samples):
+    analyzer = UUIDAnalyzer()
+    mismatches = [
+        u for u in samples if analyzer._analyze_bit_patterns(u) != _reference_bit_patterns(u)
+    ]
+    assert mismatches == []
+
+
+def test_bit_entropy_matches_reference(samples):
+    analyzer = UUIDAnalyzer()
+    mismatches = [
+        u
+        for u in samples
+        if not math.isclose(
+            analyzer._calculate_bit_entropy(u), _reference_bit_entropy(u), abs_tol=1e-12
+        )
+    ]
+    assert mismatches == []
+
+
+def test_analyze_uuid_entropy_matches_kernel(samples):
+    analyzer = UUIDAnalyzer()
+    for u in samples[:100]:
+        assert analyzer.analyze_uuid(u).bit_entropy == pytest.approx(
+            analyzer._calculate_bit_entropy(u), abs=1e-12
+        )
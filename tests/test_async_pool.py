@@ -0,0 +1,24 @@
+import asyncio
+
+from uuid_pool import AsyncUUIDPool, PoolConfig
+
+
+def _failing_generator(count: int) -> bytes:
+    raise RuntimeError("generator unavailable")
+
+
+def test_refill_loop_backs_off_when_generator_fails():
+    async def scenario():
+        config = PoolConfig(prefill=False, refill_interval=0.05, generator=_failing_generator)
+        ticks = 0
+        async with AsyncUUIDPool(config) as pool:
+            deadline = asyncio.get_running_loop().time() + 0.3
+            while asyncio.get_running_loop().time() < deadline:
+                ticks += 1
+                await asyncio.sleep(0.01)
+            assert await pool.aget(timeout=0.05) is None
+            return pool.get_stats(), ticks
+
+    stats, ticks = asyncio.run(scenario())
+    assert ticks >= 10
+    assert 1 <= stats.refill_errors <= 20
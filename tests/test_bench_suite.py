@@ -0,0 +1,90 @@
+import json
+
+import pytest
+
+from uuid_bench_suite import compare_results, load_baselines, save_baseline
+from uuid_benchmark import BenchmarkResult
+
+
+def _result(median_time):
+    return BenchmarkResult(
+        function_name="scenario",
+        iterations=100,
+        total_time=median_time * 100,
+        average_time=median_time,
+        min_time=median_time,
+        max_time=median_time,
+        median_time=median_time,
+        std_deviation=0.0,
+        operations_per_second=1e6 / median_time,
+        ci_lower=median_time,
+        ci_upper=median_time,
+        samples=5,
+    )
+
+
+def _record(tmp_path, medians):
+    filepath = str(tmp_path / "baseline.json")
+    key = save_baseline(filepath, [{"scenario": _result(m)} for m in medians])
+    return load_baselines(filepath)["baselines"][key]["results"]
+
+
+def test_baseline_requires_repeated_runs(tmp_path):
+    with pytest.raises(ValueError):
+        save_baseline(str(tmp_path / "baseline.json"), [{"scenario": _result(1.0)}])
+
+
+def test_baseline_stores_median_of_runs(tmp_path):
+    baseline = _record(tmp_path, [1.0, 1.4, 1.1])
+    assert baseline["scenario"]["median_time"] == 1.1
+    assert baseline["scenario"]["run_medians"] == [1.0, 1.4, 1.1]
+
+
+def test_change_within_baseline_spread_is_not_a_regression(tmp_path):
+    baseline = _record(tmp_path, [1.0, 1.4, 1.1])
+    [comparison] = compare_results(baseline, {"scenario": _result(1.3)})
+    assert comparison.change > 0.1
+    assert not comparison.regressed
+
+
+def test_tiny_absolute_change_is_not_a_regression(tmp_path):
+    baseline = _record(tmp_path, [0.10, 0.10, 0.10])
+    [comparison] = compare_results(baseline, {"scenario": _result(0.13)})
+    assert not comparison.regressed
+
+
+def test_slowdown_beyond_every_baseline_run_is_a_regression(tmp_path):
+    baseline = _record(tmp_path, [1.0, 1.05, 1.02])
+    [comparison] = compare_results(baseline, {"scenario": _result(1.5)})
+    assert comparison.regressed
+
+
+def test_old_single_run_baselines_are_rejected(tmp_path):
+    filepath = tmp_path / "baseline.json"
+    filepath.write_text(json.dumps({"version": 1, "baselines": {}}))
+    with pytest.raises(ValueError):
+        load_baselines(str(filepath))
+    with pytest.raises(ValueError):
+        compare_results({"scenario": {"median_time": 1.0}}, {"scenario": _result(2.0)})
+
+
+def test_save_replaces_only_older_baseline_formats(tmp_path):
+    filepath = tmp_path / "baseline.json"
+    runs = [{"scenario": _result(1.0)}] * 3
+    filepath.write_text(json.dumps({"version": 1, "baselines": {"old": {}}}))
+    key = save_baseline(str(filepath), runs)
+    assert list(load_baselines(str(filepath))["baselines"]) == [key]
+
+    newer = json.dumps({"version": 99, "baselines": {"future": {}}})
+    filepath.write_text(newer)
+    with pytest.raises(ValueError):
+        save_baseline(str(filepath), runs)
+    assert filepath.read_text() == newer
+
+
+def test_save_refuses_to_overwrite_corrupt_baselines(tmp_path):
+    filepath = tmp_path / "baseline.json"
+    filepath.write_text('{"version": 2, "baselines": {')
+    with pytest.raises(json.JSONDecodeError):
+        save_baseline(str(filepath), [{"scenario": _result(1.0)}] * 3)
+    assert filepath.read_text() == '{"version": 2, "baselines": {'
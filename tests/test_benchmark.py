@@ -0,0 +1,83 @@
+import itertools
+import statistics
+from types import SimpleNamespace
+
+import pytest
+
+import uuid_benchmark
+from uuid_benchmark import UUIDBenchmark
+
+
+class _FakeClock:
+    def __init__(self, costs_ns):
+        self.now_ns = 0
+        self.costs = itertools.cycle(costs_ns)
+
+    def perf_counter(self) -> float:
+        return self.now_ns / 1e9
+
+    def work(self):
+        self.now_ns += next(self.costs)
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    def install(costs_ns):
+        clock = _FakeClock(costs_ns)
+        monkeypatch.setattr(uuid_benchmark, "time", SimpleNamespace(perf_counter=clock.perf_counter))
+        return clock
+
+    return install
+
+
+def _benchmark(**kwargs) -> UUIDBenchmark:
+    options = dict(mode="calibrated", warmup_seconds=0, disable_gc=False, pin_cpu=False)
+    options.update(kwargs)
+    return UUIDBenchmark(**options)
+
+
+def test_calibration_scales_loops_to_the_sample_target(fake_clock):
+    clock = fake_clock([1000])
+    benchmark = _benchmark(target_sample_seconds=0.001, samples=5)
+    result = benchmark.measure_function(clock.work, 1)
+    assert result.loops_per_sample == 1200
+    assert result.samples == 5
+    assert result.iterations == 1200 * 5
+    assert result.median_time == pytest.approx(1.0)
+    assert result.operations_per_second == pytest.approx(1e6)
+
+
+def test_percentiles_and_bootstrap_interval(fake_clock):
+    costs = [50_000] + [k * 1000 for k in range(1, 101) if k != 50]
+    clock = fake_clock(costs)
+    benchmark = _benchmark(target_sample_seconds=1e-6, samples=100, max_seconds=10)
+    result = benchmark.measure_function(clock.work, 1)
+    assert result.loops_per_sample == 1
+    assert result.samples == 100
+    assert result.min_time == pytest.approx(1.0)
+    assert result.max_time == pytest.approx(100.0)
+    assert result.median_time == pytest.approx(50.5)
+    assert result.p95_time == pytest.approx(95.05)
+    assert result.p99_time == pytest.approx(99.01)
+    assert result.min_time <= result.ci_lower <= result.median_time <= result.ci_upper
+    assert result.ci_upper <= result.max_time
+    assert result.ci_lower < result.ci_upper
+
+
+def test_iterations_set_a_minimum_call_count(fake_clock):
+    clock = fake_clock([1000])
+    benchmark = _benchmark(target_sample_seconds=1e-6, samples=3, max_seconds=10)
+    result = benchmark.measure_function(clock.work, 50)
+    assert result.loops_per_sample == 1
+    assert result.samples == 50
+    assert result.iterations == 50
+
+    capped = _benchmark(target_sample_seconds=1e-6, samples=3, max_seconds=20e-6)
+    assert capped.measure_function(clock.work, 50).samples == 20
+
+
+def test_simple_mode_runs_exactly_the_requested_iterations(fake_clock):
+    clock = fake_clock([2000, 4000])
+    result = UUIDBenchmark().measure_function(clock.work, 10)
+    assert result.iterations == 10
+    assert result.median_time == pytest.approx(statistics.median([2.0, 4.0] * 5))
@@ -0,0 +1,84 @@
+import pytest
+
+from uuid_loadgen import (
+    LoadConfig,
+    LoadSample,
+    PoolLoadGenerator,
+    _latency_histogram,
+    _refill_lags,
+)
+from uuid_pool import PoolConfig, UUIDPool
+
+
+def _sample(elapsed: float, deficit: int) -> LoadSample:
+    return LoadSample(
+        elapsed=elapsed,
+        current_size=0,
+        deficit=deficit,
+        refill_count=0,
+        cache_misses=0,
+        total_consumed=0,
+    )
+
+
+def _run(config: LoadConfig):
+    pool = UUIDPool(PoolConfig(min_size=20, max_size=100, refill_batch_size=20))
+    try:
+        return PoolLoadGenerator(config).run(pool)
+    finally:
+        pool.shutdown()
+
+
+def _check_histogram(result):
+    assert sum(result.latency_histogram.values()) == result.gets
+    assert all(bucket & (bucket - 1) == 0 for bucket in result.latency_histogram)
+    assert list(result.latency_histogram) == sorted(result.latency_histogram)
+    lags = _refill_lags(result.samples)
+    assert result.refill_lag_max == max(lags, default=0.0)
+    assert result.refill_lag_mean == pytest.approx(sum(lags) / len(lags) if lags else 0.0)
+
+
+def test_closed_loop_thread_run():
+    result = _run(LoadConfig(consumers=2, duration_seconds=0.2, sample_interval=0.01))
+    assert result.mode == "closed"
+    assert (result.backend, result.consumers, result.producers) == ("thread", 2, 0)
+    assert result.gets > 0
+    assert result.items == result.gets - result.timeouts
+    assert result.stats.total_consumed >= result.items
+    assert result.samples
+    _check_histogram(result)
+
+
+def test_open_loop_thread_run_follows_the_schedule():
+    rate, duration = 200.0, 0.3
+    result = _run(
+        LoadConfig(consumers=2, duration_seconds=duration, rate=rate, batch_size=4, sample_interval=0.01)
+    )
+    assert result.mode == "open"
+    assert 0 < result.gets <= rate * duration + 2
+    assert 4 * (result.gets - result.timeouts) <= result.items <= 4 * result.gets
+    _check_histogram(result)
+
+
+def test_latency_histogram_uses_power_of_two_microsecond_buckets():
+    latencies = [0.0, 0.0000009, 0.000001, 0.000003, 0.000004, 0.0001, 0.0001]
+    histogram = _latency_histogram(latencies)
+    assert histogram == {1: 2, 2: 1, 4: 1, 8: 1, 128: 2}
+    assert sum(histogram.values()) == len(latencies)
+
+
+def test_refill_lag_spans_each_starved_stretch():
+    samples = [
+        _sample(0.0, 0),
+        _sample(0.1, 5),
+        _sample(0.2, 3),
+        _sample(0.4, 0),
+        _sample(0.5, 0),
+        _sample(0.6, 1),
+        _sample(0.7, 0),
+        _sample(0.9, 2),
+        _sample(1.2, 4),
+    ]
+    assert _refill_lags(samples) == pytest.approx([0.3, 0.1, 0.3])
+    assert _refill_lags([_sample(0.0, 0), _sample(0.1, 0)]) == []
+    assert _refill_lags([]) == []
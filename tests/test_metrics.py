@@ -0,0 +1,54 @@
+from uuid_array import UUIDArray
+from uuid_metrics import MetricsRegistry
+from uuid_migration import UUIDMigrator
+from uuid_pool import PoolConfig, UUIDPool
+
+
+def _counter(registry: MetricsRegistry, name: str, operation: str) -> int:
+    for metric_name, _, _, labels, value in registry.collect():
+        if metric_name == name and dict(labels).get("operation") == operation:
+            return value
+    raise KeyError(operation)
+
+
+def _histogram(registry: MetricsRegistry, name: str, operation: str):
+    for metric_name, _, _, labels, value in registry.collect():
+        if metric_name == name and dict(labels).get("operation") == operation:
+            return value
+    raise KeyError(operation)
+
+
+def test_nested_pool_calls_are_not_double_counted():
+    registry = MetricsRegistry()
+    pool = UUIDPool(PoolConfig(min_size=500, max_size=500), metrics=registry)
+    try:
+        assert len(pool.get_batch(100, timeout=1.0)) == 100
+        pool.get(timeout=1.0)
+    finally:
+        pool.shutdown()
+    assert _counter(registry, "uuid_pool_calls_total", "get_batch") == 1
+    assert _counter(registry, "uuid_pool_calls_total", "get") == 1
+
+
+def test_nested_migrator_calls_are_not_double_counted():
+    registry = MetricsRegistry()
+    migrator = UUIDMigrator(metrics=registry)
+    uuids = UUIDArray.random(20).tolist()
+    migrator.batch_migrate(uuids, migrator.migrate_v4_to_v5, "example.com", "name")
+    assert _counter(registry, "uuid_migrator_calls_total", "batch_migrate") == 1
+    assert _counter(registry, "uuid_migrator_calls_total", "migrate_v4_to_v5") == 0
+
+
+def test_generator_operations_time_iteration():
+    registry = MetricsRegistry()
+    migrator = UUIDMigrator(metrics=registry)
+    results = migrator.batch_migrate_parallel(
+        UUIDArray.random(200), "v4_to_v5", "example.com", workers=1, chunk_size=50
+    )
+    histogram = _histogram(registry, "uuid_migrator_operation_seconds", "batch_migrate_parallel")
+    assert histogram.count == 0
+    assert len(list(results)) == 200
+    histogram = _histogram(registry, "uuid_migrator_operation_seconds", "batch_migrate_parallel")
+    assert histogram.count == 1
+    assert histogram.sum_seconds > 0
+    assert _counter(registry, "uuid_migrator_calls_total", "batch_migrate_parallel") == 1
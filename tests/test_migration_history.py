@@ -0,0 +1,97 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from uuid_array import UUIDArray
+from uuid_migration import MigrationHistory, MigrationResult, UUIDMigrator
+
+
+def _result(source: int, target: int) -> MigrationResult:
+    return MigrationResult(
+        source_uuid=uuid.UUID(int=source),
+        target_uuid=uuid.UUID(int=target),
+        migration_type="v4_to_v5",
+        success=True,
+        timestamp=datetime(2024, 1, 1),
+    )
+
+
+def test_duplicate_sources_are_removed_individually():
+    history = MigrationHistory()
+    first, second, other = _result(1, 10), _result(1, 11), _result(2, 12)
+    for result in (first, second, other):
+        history.append(result)
+
+    history.remove(first)
+    assert first not in history
+    assert second in history
+    history.remove(second)
+    assert second not in history
+    with pytest.raises(ValueError):
+        history.remove(second)
+    assert list(history) == [other]
+
+
+def test_duplicates_survive_compaction_and_trim():
+    history = MigrationHistory(max_entries=8)
+    results = [_result(index % 3, index) for index in range(20)]
+    for result in results:
+        history.append(result)
+    kept = list(history)
+    assert kept == results[-len(kept):]
+    for result in kept:
+        history.remove(result)
+    assert len(history) == 0
+
+
+def test_missing_rollback_does_not_scan_history(monkeypatch):
+    history = MigrationHistory()
+    history.append_many(
+        b"".join(uuid.UUID(int=i).bytes for i in range(1000)),
+        b"".join(uuid.UUID(int=i + 1).bytes for i in range(1000)),
+        "v4_to_v5",
+    )
+    present = history[100]
+    history.remove(present)
+
+    def no_scan(*args):
+        raise AssertionError("history was scanned")
+
+    monkeypatch.setattr(MigrationHistory, "__iter__", no_scan)
+    monkeypatch.setattr(MigrationHistory, "_row", no_scan)
+    assert present not in history
+    assert _result(10**9, 1) not in history
+    with pytest.raises(ValueError):
+        history.remove(present)
+
+
+def test_aware_and_naive_timestamps_round_trip():
+    history = MigrationHistory()
+    aware = _result(1, 10)
+    aware.timestamp = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+    naive = _result(2, 20)
+    history.append(aware)
+    history.append(naive)
+
+    assert aware in history
+    assert naive in history
+    rows = list(history)
+    assert rows[0].timestamp.astimezone().timestamp() == aware.timestamp.timestamp()
+    assert rows[1].timestamp == naive.timestamp
+
+
+def test_batch_migrate_array_records_history(tmp_path):
+    sources = UUIDArray.random(50)
+    migrator = UUIDMigrator(journal_path=str(tmp_path / "journal.bin"))
+    targets = migrator.batch_migrate_array(sources, "v4_to_v5", "example.com")
+    assert len(migrator.migration_history) == 50
+    first = migrator.migration_history[0]
+    assert (first.source_uuid, first.target_uuid) == (sources[0], targets[0])
+    assert migrator.rollback_migration(first)
+
+    migrator.batch_migrate_array(sources, "v4_to_v5", "example.com", record_history=False)
+    assert len(migrator.migration_history) == 49
+    migrator.journal.commit()
+    assert migrator.journal.committed_records == 1 + 50 + 1 + 50
+    migrator.close()
@@ -0,0 +1,85 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from uuid_migration import MigrationHistory, MigrationJournal, MigrationResult, UUIDMigrator
+
+
+def _result(index: int) -> MigrationResult:
+    return MigrationResult(
+        source_uuid=uuid.UUID(int=index),
+        target_uuid=uuid.UUID(int=index + 1000),
+        migration_type="v4_to_v5",
+        success=True,
+        timestamp=datetime(2024, 1, 1),
+    )
+
+
+def test_replay_resumes_from_committed_offset(tmp_path):
+    path = str(tmp_path / "journal.bin")
+    journal = MigrationJournal(path)
+    for index in range(10):
+        journal.append(_result(index))
+    journal.commit()
+    total = journal.committed_records
+    assert total == 11
+
+    assert [row[0].int for row in journal.replay(0)] == list(range(10))
+    assert [row[0].int for row in journal.replay(6)] == list(range(5, 10))
+    assert list(journal.replay(total)) == []
+    journal.close()
+
+    reopened = MigrationJournal(path)
+    rows = list(reopened.replay(total - 2))
+    assert [row[0].int for row in rows] == [8, 9]
+    assert rows[0][2] == "v4_to_v5"
+    reopened.close()
+
+
+def test_aware_timestamps_are_journaled_as_utc(tmp_path):
+    journal = MigrationJournal(str(tmp_path / "journal.bin"))
+    moment = datetime(2024, 1, 1, 12, tzinfo=timezone(timedelta(hours=5)))
+    journal.append(
+        MigrationResult(
+            source_uuid=uuid.UUID(int=1),
+            target_uuid=uuid.UUID(int=2),
+            migration_type="v4_to_v5",
+            success=True,
+            timestamp=moment,
+        )
+    )
+    journal.append_many(uuid.UUID(int=3).bytes, uuid.UUID(int=4).bytes, "v4_to_v5", timestamp=moment)
+    journal.commit()
+    rows = list(journal.replay(0))
+    journal.close()
+    assert [row[5].astimezone().timestamp() for row in rows] == [moment.timestamp()] * 2
+
+
+def test_long_custom_names_are_rejected_before_recording(tmp_path):
+    migrator = UUIDMigrator(journal_path=str(tmp_path / "journal.bin"))
+    with pytest.raises(ValueError):
+        migrator.register_custom_migration("a" * 26, lambda value: value)
+    assert "a" * 26 not in migrator.custom_migrations
+
+    migrator.register_custom_migration("broken", lambda value: 1 / 0)
+    result = migrator.migrate_custom(uuid.UUID(int=1), "broken")
+    assert not result.success
+    assert len(migrator.migration_history) == 1
+
+
+def test_history_is_untouched_when_journal_rejects_a_row(tmp_path):
+    journal = MigrationJournal(str(tmp_path / "journal.bin"))
+    history = MigrationHistory(journal=journal)
+    result = MigrationResult(
+        source_uuid=uuid.UUID(int=1),
+        target_uuid=uuid.UUID(int=2),
+        migration_type="x" * 40,
+        success=True,
+        timestamp=datetime(2024, 1, 1),
+    )
+    with pytest.raises(ValueError):
+        history.append(result)
+    assert len(history) == 0
+    assert result not in history
+    journal.close()
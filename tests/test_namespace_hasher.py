@@ -0,0 +1,38 @@
+import uuid
+
+import pytest
+
+from uuid_utils import NamespaceHasher
+
+NAMES = ["", "user-1", "example.com", "ünïcødé", "日本語の名前", "emoji \U0001f600", "x" * 1000]
+NAMESPACES = [uuid.NAMESPACE_DNS, uuid.NAMESPACE_URL, uuid.UUID(int=0)]
+REFERENCE = {5: uuid.uuid5, 3: uuid.uuid3}
+
+
+@pytest.mark.parametrize("version", [3, 5])
+@pytest.mark.parametrize("namespace", NAMESPACES)
+def test_hash_matches_stdlib(version, namespace):
+    hasher = NamespaceHasher(namespace, version)
+    reference = REFERENCE[version]
+    for name in NAMES:
+        expected = reference(namespace, name)
+        assert hasher.hash(name) == expected
+        assert hasher.hash_bytes(name) == expected.bytes
+
+
+@pytest.mark.parametrize("version", [3, 5])
+@pytest.mark.parametrize("namespace", NAMESPACES)
+def test_hash_batch_matches_stdlib(version, namespace):
+    hasher = NamespaceHasher(namespace, version)
+    reference = REFERENCE[version]
+    expected = b"".join(reference(namespace, name).bytes for name in NAMES)
+    assert hasher.hash_batch(NAMES) == expected
+    assert hasher.hash_batch(iter(NAMES)) == expected
+    assert hasher.hash_batch([]) == b""
+
+
+def test_rejects_invalid_arguments():
+    with pytest.raises(ValueError):
+        NamespaceHasher("example.com")
+    with pytest.raises(ValueError):
+        NamespaceHasher(uuid.NAMESPACE_DNS, 4)
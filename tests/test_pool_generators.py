@@ -0,0 +1,51 @@
+import uuid
+
+import pytest
+
+from uuid_array import UUIDArray
+from uuid_pool import OUTPUT_FORMATS, PoolConfig, UUIDPool
+
+
+def test_v5_generator_requires_name_source():
+    with pytest.raises(ValueError):
+        UUIDPool(PoolConfig(generator="v5", namespace="example.com"))
+
+
+def test_v5_generator_hashes_supplied_names():
+    names = iter(f"user-{i}" for i in range(1000))
+    config = PoolConfig(
+        min_size=20,
+        generator="v5",
+        namespace="example.com",
+        name_source=lambda count: [next(names) for _ in range(count)],
+    )
+    pool = UUIDPool(config)
+    try:
+        first = pool.get(timeout=1)
+        assert first == uuid.uuid5(uuid.uuid5(uuid.NAMESPACE_DNS, "example.com"), "user-0")
+        assert first.version == 5
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.parametrize("output_format", OUTPUT_FORMATS)
+def test_slab_serves_preformatted_items_in_order(output_format):
+    config = PoolConfig(
+        max_size=64,
+        prefill=False,
+        refill_threshold=0.01,
+        storage="slab",
+        output_format=output_format,
+    )
+    pool = UUIDPool(config)
+    try:
+        expected = UUIDArray.random(90)
+        assert pool.put_array(expected[:50]) == 50
+        assert pool.get_batch(40, timeout=1) == expected[:40].format(output_format)
+        assert pool.put_array(expected[50:]) == 40
+        pool.update_capacity(60)
+        assert pool.get(timeout=1) == expected[40:41].format(output_format)[0]
+        assert pool.get_batch_bytes(1, timeout=1) == bytes(expected[41:42])
+        assert pool.get_batch(60, timeout=0) == expected[42:90].format(output_format)
+    finally:
+        pool.shutdown()
@@ -0,0 +1,72 @@
+import threading
+import uuid
+
+import pytest
+
+from uuid_array import UUIDArray
+from uuid_pool import STORAGE_MODES, PoolConfig, UUIDPool
+
+
+@pytest.mark.parametrize("storage", STORAGE_MODES)
+def test_exited_thread_magazines_are_returned_to_the_pool(storage):
+    pool = UUIDPool(
+        PoolConfig(min_size=2000, max_size=2000, storage=storage, thread_cache_size=64)
+    )
+    try:
+        taken = []
+
+        def consumer():
+            taken.append(pool.get(timeout=1.0))
+
+        for _ in range(50):
+            worker = threading.Thread(target=consumer)
+            worker.start()
+            worker.join()
+
+        stats = pool.get_stats()
+        assert len(pool._magazines) <= 1
+        assert stats.thread_cached == 0
+        assert stats.cache_hits == 50
+        assert stats.current_size == 2000 - 50
+        assert len(set(taken)) == 50
+    finally:
+        pool.shutdown()
+
+
+def test_thread_cache_rejects_ttl():
+    with pytest.raises(ValueError):
+        UUIDPool(PoolConfig(thread_cache_size=16, ttl_seconds=1.0))
+
+
+def _idle_queue_pool(**overrides):
+    config = PoolConfig(
+        max_size=64, prefill=False, refill_threshold=0.01, thread_cache_size=8, **overrides
+    )
+    return UUIDPool(config)
+
+
+def test_magazine_refill_waits_for_items_put_later():
+    pool = _idle_queue_pool()
+    try:
+        taken = []
+        consumer = threading.Thread(target=lambda: taken.append(pool.get(timeout=5.0)))
+        consumer.start()
+        item = uuid.uuid4()
+        assert pool.put(item)
+        consumer.join(5.0)
+        assert taken == [item]
+    finally:
+        pool.shutdown()
+
+
+def test_magazine_refill_releases_blocked_queue_puts():
+    pool = _idle_queue_pool()
+    try:
+        assert pool.put_array(UUIDArray.random(64)) == 64
+        blocked = threading.Thread(target=pool.pool.put, args=(uuid.uuid4(),))
+        blocked.start()
+        assert pool.get(timeout=1.0) is not None
+        blocked.join(5.0)
+        assert not blocked.is_alive()
+    finally:
+        pool.shutdown()
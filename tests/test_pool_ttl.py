@@ -0,0 +1,64 @@
+import threading
+import time
+
+import pytest
+
+from uuid_array import UUIDArray
+from uuid_pool import STORAGE_MODES, PoolConfig, UUIDPool
+
+
+def _ttl_pool(storage):
+    config = PoolConfig(
+        max_size=64,
+        prefill=False,
+        refill_threshold=0.01,
+        ttl_seconds=0.2,
+        eviction_segments=4,
+        storage=storage,
+        output_format="bytes",
+    )
+    return UUIDPool(config)
+
+
+@pytest.mark.parametrize("storage", STORAGE_MODES)
+def test_eviction_drops_only_expired_segments(storage):
+    pool = _ttl_pool(storage)
+    try:
+        stale, fresh = UUIDArray.random(10), UUIDArray.random(10)
+        pool.put_array(stale)
+        assert pool.get(timeout=0) == stale.get_bytes(0)
+        time.sleep(0.3)
+        pool.put_array(fresh)
+        pool._evict_expired()
+        stats = pool.get_stats()
+        assert stats.eviction_count == 9
+        assert stats.current_size == 10
+        assert pool.get_batch(20, timeout=0) == fresh.records()
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.parametrize("storage", STORAGE_MODES)
+def test_concurrent_gets_never_evict_fresh_items(storage):
+    pool = _ttl_pool(storage)
+    try:
+        stale, fresh = UUIDArray.random(30), UUIDArray.random(30)
+        pool.put_array(stale)
+        time.sleep(0.3)
+        pool.put_array(fresh)
+        taken = []
+        consumers = [
+            threading.Thread(target=lambda: taken.append(pool.get(timeout=0)))
+            for _ in range(20)
+        ]
+        for consumer in consumers:
+            consumer.start()
+        pool._evict_expired()
+        for consumer in consumers:
+            consumer.join()
+        remaining = pool.get_batch(64, timeout=0)
+        stats = pool.get_stats()
+        assert set(fresh.records()) <= set(taken) | set(remaining)
+        assert stats.eviction_count + stats.total_consumed == 60
+    finally:
+        pool.shutdown()
@@ -0,0 +1,86 @@
+import threading
+import time
+
+import pytest
+
+from uuid_pool import PoolConfig, UUIDPool
+
+
+def _wait_for(condition, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.005)
+    return condition()
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_watchdog_restarts_a_dead_refill_thread():
+    pool = UUIDPool(PoolConfig(min_size=10, max_size=100, refill_interval=0.01, watchdog_interval=0.01))
+    original = pool._refill_tick
+    calls = []
+
+    def crash_once():
+        calls.append(threading.current_thread())
+        if len(calls) == 1:
+            raise SystemExit
+        return original()
+
+    try:
+        pool._refill_tick = crash_once
+        assert _wait_for(lambda: pool.get_stats().refill_restarts == 1)
+        assert _wait_for(lambda: len(calls) > 1)
+        assert calls[-1] is not calls[0]
+        assert pool._refill_thread.is_alive()
+        assert pool.get_stats().refill_errors == 0
+    finally:
+        pool.shutdown()
+
+
+def test_idle_sleep_longer_than_stall_threshold_is_not_a_stall():
+    pool = UUIDPool(
+        PoolConfig(
+            min_size=10,
+            max_size=100,
+            refill_interval=0.3,
+            diagnostics=True,
+            watchdog_interval=0.01,
+            refill_stall_seconds=0.05,
+        )
+    )
+    try:
+        time.sleep(0.7)
+        assert pool.diagnostics.summary()["stalls"] == 0
+        assert pool.get_stats().refill_restarts == 0
+    finally:
+        pool.shutdown()
+
+
+def test_blocked_refill_tick_is_reported_with_its_stack():
+    pool = UUIDPool(
+        PoolConfig(
+            min_size=10,
+            max_size=100,
+            refill_interval=0.01,
+            diagnostics=True,
+            watchdog_interval=0.01,
+            refill_stall_seconds=0.05,
+        )
+    )
+    original = pool._refill_tick
+    release = threading.Event()
+
+    def blocked_refill_tick():
+        release.wait(2.0)
+        return original()
+
+    try:
+        pool._refill_tick = blocked_refill_tick
+        assert _wait_for(lambda: pool.diagnostics.summary()["stalls"] >= 1)
+        assert "blocked_refill_tick" in pool.diagnostics.summary()["last_stall_stack"]
+        release.set()
+        pool._refill_tick = original
+    finally:
+        release.set()
+        pool.shutdown()
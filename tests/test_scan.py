@@ -0,0 +1,46 @@
+import pytest
+
+from uuid_analysis import UUIDAnalyzer
+from uuid_array import UUIDArray
+from uuid_scan import UUIDFileScanner
+
+
+def test_binary_validate_reports_no_throughput(tmp_path):
+    filepath = str(tmp_path / "ids.bin")
+    UUIDArray.random(1000).tofile(filepath)
+    with UUIDFileScanner(filepath, "binary") as scanner:
+        stats = scanner.validate()
+    assert stats.valid == 1000
+    assert stats.bytes_scanned == 16000
+    assert stats.bytes_checked == 0
+    assert stats.throughput_mb_per_second is None
+
+
+def test_text_validate_reports_throughput_of_checked_bytes(tmp_path):
+    filepath = tmp_path / "ids.txt"
+    filepath.write_bytes(UUIDArray.random(1000).to_text())
+    with UUIDFileScanner(str(filepath), "text", chunk_records=100) as scanner:
+        stats = scanner.validate()
+    assert stats.valid == 1000
+    assert stats.bytes_checked == stats.bytes_scanned == 37000
+    assert stats.throughput_mb_per_second > 0
+
+
+def test_analyze_distribution_streams_chunks(tmp_path, monkeypatch):
+    sample = UUIDArray.random(1000)
+    sample = sample + sample[:3]
+    filepath = tmp_path / "ids.txt"
+    filepath.write_bytes(sample.to_text())
+    expected = UUIDAnalyzer().analyze_distribution(sample, backend="python")
+
+    def whole_file_analysis(*args, **kwargs):
+        raise AssertionError("the scanner must not analyze the whole file at once")
+
+    monkeypatch.setattr(UUIDAnalyzer, "analyze_distribution", whole_file_analysis)
+    with UUIDFileScanner(str(filepath), "text", chunk_records=64) as scanner:
+        stats = scanner.analyze_distribution(backend="python")
+    assert stats.total_samples == 1003
+    assert stats.collision_count == 3
+    assert stats.bit_distribution == expected.bit_distribution
+    assert stats.pattern_averages == expected.pattern_averages
+    assert stats.entropy == pytest.approx(expected.entropy)
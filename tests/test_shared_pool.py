@@ -0,0 +1,67 @@
+import os
+import time
+from multiprocessing import shared_memory
+
+import pytest
+
+import uuid_pool
+from uuid_pool import PoolConfig, SharedUUIDPool
+
+
+def _failing_generator(count: int) -> bytes:
+    raise RuntimeError("generator unavailable")
+
+
+def test_refill_worker_records_errors_and_backs_off():
+    config = PoolConfig(
+        prefill=False, refill_interval=0.05, diagnostics=True, generator=_failing_generator
+    )
+    pool = SharedUUIDPool(f"test_pool_{os.getpid()}", config, create=True)
+    try:
+        time.sleep(0.3)
+        consumer = SharedUUIDPool(pool.name)
+        try:
+            stats = consumer.get_stats()
+            assert 1 <= stats.refill_errors <= 20
+            assert consumer.seconds_since_refill_tick() < 0.3
+        finally:
+            consumer.shutdown()
+        assert pool.diagnostics.summary()["errors"]["RuntimeError"] >= 1
+    finally:
+        pool.shutdown()
+
+
+def _recording_open(opened):
+    def recording_open(*args, **kwargs):
+        handle = open(*args, **kwargs)
+        opened.append(handle)
+        return handle
+
+    return recording_open
+
+
+def test_failed_create_closes_the_lock_file(monkeypatch):
+    pool = SharedUUIDPool(f"test_dup_{os.getpid()}", PoolConfig(min_size=5), create=True)
+    opened = []
+    monkeypatch.setattr(uuid_pool, "open", _recording_open(opened), raising=False)
+    try:
+        with pytest.raises(FileExistsError):
+            SharedUUIDPool(pool.name, create=True)
+        assert [handle.closed for handle in opened] == [True]
+        assert pool.get(timeout=1) is not None
+    finally:
+        pool.shutdown()
+
+
+def test_attaching_to_a_foreign_segment_cleans_up(monkeypatch):
+    segment = shared_memory.SharedMemory(f"test_foreign_{os.getpid()}", create=True, size=256)
+    opened = []
+    monkeypatch.setattr(uuid_pool, "open", _recording_open(opened), raising=False)
+    try:
+        with pytest.raises(ValueError):
+            SharedUUIDPool(segment.name)
+        assert [handle.closed for handle in opened] == [True]
+        shared_memory.SharedMemory(segment.name).close()
+    finally:
+        segment.close()
+        segment.unlink()
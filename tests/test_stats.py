@@ -0,0 +1,18 @@
+import pytest
+
+from uuid_stats import percentile
+
+
+def test_percentile_interpolates_between_ranks():
+    values = [1.0, 2.0, 3.0, 4.0]
+    assert percentile(values, 0.0) == 1.0
+    assert percentile(values, 0.5) == 2.5
+    assert percentile(values, 1.0) == 4.0
+    assert percentile([7.0], 0.99) == 7.0
+
+
+def test_percentile_rejects_invalid_arguments():
+    with pytest.raises(ValueError):
+        percentile([], 0.5)
+    with pytest.raises(ValueError):
+        percentile([1.0], 1.5)
@@ -0,0 +1,52 @@
+import random
+import uuid
+
+from uuid_analysis import StreamingUUIDAnalyzer, UUIDAnalyzer
+
+
+def _sample():
+    rng = random.Random(0x5EED)
+    values = [uuid.UUID(int=rng.getrandbits(128)) for _ in range(2000)]
+    for position in (0, 3, 700, 1999):
+        values[position] = uuid.UUID(int=int("ab" * 16, 16) >> rng.randint(0, 8))
+    return values
+
+
+def _brute_force_top(values, top_k):
+    kernels = UUIDAnalyzer()
+    entropies = [kernels._calculate_bit_entropy(u) for u in values]
+    mean = sum(entropies) / len(entropies)
+    ranked = sorted(
+        range(len(values)), key=lambda i: (-abs(entropies[i] - mean), i)
+    )[:top_k]
+    return sorted(values[i].bytes for i in ranked)
+
+
+def test_top_k_is_scored_against_the_final_mean():
+    values = _sample()
+    analyzer = StreamingUUIDAnalyzer(top_k=8)
+    analyzer.feed(values)
+    candidates = sorted(raw for _, raw, _ in analyzer._anomaly_candidates())
+    assert candidates == _brute_force_top(values, 8)
+
+
+def test_merge_keeps_the_same_candidates():
+    values = _sample()
+    left, right = StreamingUUIDAnalyzer(top_k=8), StreamingUUIDAnalyzer(top_k=8)
+    left.feed(values[:1000])
+    right.feed(values[1000:])
+    whole = StreamingUUIDAnalyzer(top_k=8)
+    whole.feed(values)
+    assert left.merge(right)._anomaly_candidates() == whole._anomaly_candidates()
+    assert left.detect_anomalies() == whole.detect_anomalies()
+
+
+def test_first_item_does_not_hold_a_slot():
+    typical = uuid.UUID("0123456789abcdef0123456789abcdef")
+    analyzer = StreamingUUIDAnalyzer(top_k=1)
+    analyzer.add(typical)
+    analyzer.feed(uuid.uuid4() for _ in range(500))
+    outlier = uuid.UUID(int=0)
+    analyzer.add(outlier)
+    [(_, raw, _)] = analyzer._anomaly_candidates()
+    assert raw == outlier.bytes
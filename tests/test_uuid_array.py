@@ -0,0 +1,77 @@
+import sys
+import uuid
+
+import pytest
+
+from uuid_array import UUIDArray
+
+
+def test_contiguous_slices_share_the_buffer():
+    array = UUIDArray.random(100)
+    window = array[10:20]
+    assert len(window) == 10
+    assert window.buffer.obj is array.buffer.obj
+    assert list(window) == list(array)[10:20]
+    assert window[0] == array[10]
+    assert len(array[50:10]) == 0
+    assert list(array[::10]) == list(array)[::10]
+
+
+def test_sort_is_in_place_for_writable_buffers():
+    backing = bytearray(UUIDArray.random(200).buffer)
+    array = UUIDArray(backing)
+    view = array.buffer
+    array.sort()
+    assert array.buffer is view
+    assert array.records() == sorted(array.records())
+    assert bytes(backing) == bytes(array)
+
+    array.sort(reverse=True)
+    assert array.records() == sorted(array.records(), reverse=True)
+
+
+def test_sort_copies_read_only_buffers():
+    raw = bytes(UUIDArray.random(50))
+    array = UUIDArray(raw)
+    array.sort()
+    assert array.records() == sorted(array.records())
+    assert bytes(UUIDArray(raw)) == raw
+
+
+def test_unique_and_searchsorted():
+    array = UUIDArray.random(100)
+    doubled = array + array[:30]
+    unique = doubled.unique()
+    assert len(unique) == 100
+    assert unique.records() == sorted(array.records())
+    for position in (0, 37, 99):
+        assert unique.searchsorted(unique[position]) == position
+    assert unique.searchsorted(uuid.UUID(int=0)) == 0
+    assert unique.searchsorted(b"\xff" * 16) == 100
+
+
+def test_file_round_trip(tmp_path):
+    array = UUIDArray.random(500)
+    path = str(tmp_path / "uuids.bin")
+    array.tofile(path)
+    assert UUIDArray.fromfile(path) == array
+    array[100:200].tofile(path)
+    assert UUIDArray.fromfile(path) == array[100:200]
+
+
+@pytest.mark.parametrize("output_format", ["str", "hex", "upper_hex"])
+def test_text_round_trip(output_format):
+    array = UUIDArray.random(300)
+    assert UUIDArray.from_strings(array.to_text(output_format)) == array
+    assert UUIDArray.from_strings(array.format(output_format)) == array
+    assert UUIDArray().to_text() == b""
+
+
+def test_buffer_is_the_portable_interface():
+    array = UUIDArray.random(4)
+    assert bytes(array.buffer) == bytes(array)
+    if sys.version_info >= (3, 12):
+        assert bytes(memoryview(array)) == bytes(array)
+    else:
+        with pytest.raises(TypeError):
+            memoryview(array)
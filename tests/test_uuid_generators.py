@@ -0,0 +1,108 @@
+import time
+import uuid
+
+import pytest
+
+from uuid_utils import _UUID7_COUNTER_MASK, UUIDv6Generator, UUIDv7Generator
+
+
+class _Clock:
+    def __init__(self, ns: int):
+        self.ns = ns
+
+    def __call__(self) -> int:
+        return self.ns
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _Clock(1_700_000_000_000 * 1_000_000)
+    monkeypatch.setattr(time, "time_ns", fake)
+    return fake
+
+
+def _v7_ms(value: uuid.UUID) -> int:
+    return value.int >> 80
+
+
+def _v6_ticks(value: uuid.UUID) -> int:
+    high = value.int >> 64
+    return ((high >> 16) << 12) | (high & 0xFFF)
+
+
+def _strictly_increasing(values) -> bool:
+    return all(a.bytes < b.bytes for a, b in zip(values, values[1:]))
+
+
+@pytest.mark.parametrize("generator_cls", [UUIDv7Generator, UUIDv6Generator])
+def test_version_and_variant_bits(generator_cls):
+    generator = generator_cls()
+    version = 7 if generator_cls is UUIDv7Generator else 6
+    values = [generator.generate()] + generator.generate_batch(64)
+    values.append(uuid.UUID(bytes=generator.generate_bytes()))
+    for value in values:
+        assert value.version == version
+        assert value.variant == uuid.RFC_4122
+
+
+def test_v7_strictly_ordered_within_one_millisecond(clock):
+    generator = UUIDv7Generator()
+    values = [generator.generate() for _ in range(1000)]
+    assert _strictly_increasing(values)
+    assert {_v7_ms(value) for value in values} == {clock.ns // 1_000_000}
+
+
+def test_v7_counter_overflow_carries_into_timestamp(clock):
+    generator = UUIDv7Generator()
+    now_ms = clock.ns // 1_000_000
+    generator._last_ms = now_ms
+    generator._counter = _UUID7_COUNTER_MASK - 1
+    singles = [generator.generate() for _ in range(3)]
+    assert _strictly_increasing(singles)
+    assert [_v7_ms(value) for value in singles] == [now_ms, now_ms, now_ms + 1]
+
+    generator._last_ms = now_ms + 5
+    generator._counter = _UUID7_COUNTER_MASK - 1
+    batch = generator.generate_batch(4)
+    assert _strictly_increasing(batch)
+    assert [_v7_ms(value) for value in batch] == [now_ms + 5] * 2 + [now_ms + 6] * 2
+    assert _v7_ms(generator.generate()) == now_ms + 6
+
+
+@pytest.mark.parametrize("generator_cls", [UUIDv7Generator, UUIDv6Generator])
+def test_batches_and_single_calls_interleave_in_order(clock, generator_cls):
+    generator = generator_cls()
+    values = []
+    for round_index in range(20):
+        values.append(generator.generate())
+        values.extend(generator.generate_batch(round_index + 1))
+        values.append(uuid.UUID(bytes=generator.generate_bytes()))
+        if round_index % 5 == 4:
+            clock.ns += 1_000_000
+    assert _strictly_increasing(values)
+    assert len(set(values)) == len(values)
+
+
+def test_v7_clock_rollback_keeps_ordering(clock):
+    generator = UUIDv7Generator()
+    before = [generator.generate() for _ in range(10)]
+    high_ms = clock.ns // 1_000_000
+    clock.ns -= 5_000_000_000
+    after = generator.generate_batch(10) + [generator.generate() for _ in range(10)]
+    assert _strictly_increasing(before + after)
+    assert all(_v7_ms(value) >= high_ms for value in after)
+
+
+def test_v6_strictly_ordered_and_survives_clock_rollback(clock):
+    generator = UUIDv6Generator(node=0x123456789ABC, clock_seq=0x1234)
+    same_tick = [generator.generate() for _ in range(100)]
+    assert _strictly_increasing(same_tick)
+    ticks = [_v6_ticks(value) for value in same_tick]
+    assert ticks == list(range(ticks[0], ticks[0] + 100))
+
+    clock.ns -= 10_000_000_000
+    after = generator.generate_batch(10) + [generator.generate()]
+    assert _strictly_increasing(same_tick + after)
+    assert [_v6_ticks(value) for value in after] == list(range(ticks[-1] + 1, ticks[-1] + 12))
+    assert all(value.node == 0x123456789ABC for value in after)
+    assert all(value.clock_seq == 0x1234 for value in after)
@@ -0,0 +1,41 @@
+import uuid
+
+import pytest
+
+from uuid_utils import is_valid_uuid, is_valid_uuid_batch, uuid_from_string
+
+_VALUE = uuid.UUID("12345678-1234-5678-1234-567812345678")
+_FULL_WIDTH = str(_VALUE).translate({ord(c): 0xFF10 + int(c) for c in "0123456789"})
+_ARABIC_INDIC = _VALUE.hex.translate({ord(c): 0x0660 + int(c) for c in "0123456789"})
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        str(_VALUE),
+        _VALUE.hex,
+        f"{{{_VALUE}}}",
+        f"urn:uuid:{_VALUE}",
+        f"  {_VALUE}\t",
+        _FULL_WIDTH,
+        _ARABIC_INDIC,
+        f" {_VALUE}",
+        "g" * 32,
+        str(_VALUE)[:-1] + "é",
+        "not a uuid at all, but longer than 32 chars",
+    ],
+)
+def test_lenient_parsing_matches_stdlib(text):
+    try:
+        expected = uuid.UUID(text)
+    except ValueError:
+        expected = None
+    assert uuid_from_string(text) == expected
+    assert is_valid_uuid(text) == (expected is not None)
+    assert is_valid_uuid_batch([text])[0] == (expected is not None)
+
+
+def test_strict_mode_rejects_non_ascii_digits():
+    assert uuid_from_string(_FULL_WIDTH) == _VALUE
+    assert uuid_from_string(_FULL_WIDTH, strict=True) is None
+    assert not is_valid_uuid(_ARABIC_INDIC, strict=True)
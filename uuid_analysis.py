@@ -1,11 +1,62 @@
+import heapq
 import json
 import uuid
-from typing import Any, Dict, List, Set, Tuple
-from collections import Counter, defaultdict
-from dataclasses import dataclass
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+from collections import Counter
+from dataclasses import dataclass, field
 from statistics import mean, stdev
 import math
 
+from uuid_array import UUIDArray
+from uuid_metrics import MetricsRegistry, instrument_methods, uninstrumented_state
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+ANALYSIS_BACKENDS = ("python", "numpy", "auto")
+COLLISION_MODES = ("exact", "approximate")
+_MASK_64 = (1 << 64) - 1
+_MASK_128 = (1 << 128) - 1
+_TRANSITION_MASK = (1 << 127) - 1
+_GOLDEN_64 = 0x9E3779B97F4A7C15
+_PATTERN_KEYS = ("consecutive_zeros", "consecutive_ones", "bit_transitions")
+_NUMPY_CHUNK_ROWS = 1 << 16
+ANALYZER_OPERATIONS = ("analyze_distribution", "detect_anomalies")
+STREAMING_OPERATIONS = ("feed", "feed_file", "merge")
+
+
+def _byte_run_tables() -> Tuple[List[int], List[int], List[int], List[int]]:
+    leading, trailing, longest, transitions = [], [], [], []
+    for value in range(256):
+        bits = format(value, "08b")
+        leading.append(len(bits) - len(bits.lstrip("1")))
+        trailing.append(len(bits) - len(bits.rstrip("1")))
+        longest.append(max(len(run) for run in bits.split("0")))
+        transitions.append(sum(1 for i in range(7) if bits[i] != bits[i + 1]))
+    return leading, trailing, longest, transitions
+
+
+_LEADING_ONES, _TRAILING_ONES, _LONGEST_ONES, _BYTE_TRANSITIONS = _byte_run_tables()
+_ENTROPY_TERMS = [0.0] + [(c / 32) * math.log2(c / 32) for c in range(1, 33)]
+
+
+def _longest_run(value: int) -> int:
+    length = 0
+    while value:
+        value &= value << 1
+        length += 1
+    return length
+
+
+def _entropy_from_counts(counts: Iterable[int]) -> float:
+    entropy = 0.0
+    for count in counts:
+        entropy -= _ENTROPY_TERMS[count]
+    return entropy
+
 
 @dataclass
 class DistributionStats:
@@ -15,6 +66,7 @@ class DistributionStats:
     collision_rate: float
     entropy: float
     bit_distribution: Dict[int, float]
+    pattern_averages: Dict[str, float] = field(default_factory=dict)
 
 
 @dataclass
@@ -27,6 +79,157 @@ class UUIDAnalysis:
     bit_patterns: Dict[str, int]
 
 
+def _mix64(value: int) -> int:
+    value = (value ^ (value >> 30)) * 0xBF58476D1CE4E5B9 & _MASK_64
+    value = (value ^ (value >> 27)) * 0x94D049BB133111EB & _MASK_64
+    return value ^ (value >> 31)
+
+
+class PackedUUIDSet:
+    _MAX_LOAD = 0.7
+
+    def __init__(self, capacity: int = 1024):
+        size = 16
+        while size * self._MAX_LOAD < capacity:
+            size *= 2
+        self._allocate(size)
+        self._has_zero = False
+        self.count = 0
+
+    def _allocate(self, size: int):
+        self._high = array("Q", bytes(8 * size))
+        self._low = array("Q", bytes(8 * size))
+        self._mask = size - 1
+        self._limit = int(size * self._MAX_LOAD)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, value: int) -> bool:
+        if value == 0:
+            if self._has_zero:
+                return False
+            self._has_zero = True
+            self.count += 1
+            return True
+        high = value >> 64
+        low = value & _MASK_64
+        high_slots = self._high
+        low_slots = self._low
+        mask = self._mask
+        slot = ((high ^ low) * _GOLDEN_64 >> 32) & mask
+        while True:
+            slot_high = high_slots[slot]
+            slot_low = low_slots[slot]
+            if slot_high == high and slot_low == low:
+                return False
+            if slot_high == 0 and slot_low == 0:
+                break
+            slot = (slot + 1) & mask
+        high_slots[slot] = high
+        low_slots[slot] = low
+        self.count += 1
+        if self.count > self._limit:
+            self._grow()
+        return True
+
+    def _grow(self):
+        old_high, old_low = self._high, self._low
+        self._allocate(len(old_high) * 2)
+        has_zero, count = self._has_zero, self.count
+        self.count = 0
+        for high, low in zip(old_high, old_low):
+            if high or low:
+                self.add((high << 64) | low)
+        self._has_zero, self.count = has_zero, count
+
+
+class BloomFilter:
+    def __init__(self, expected_items: int, error_rate: float):
+        if not isinstance(expected_items, int) or expected_items < 1:
+            raise ValueError("expected_items must be a positive integer")
+        if not (0 < error_rate < 1):
+            raise ValueError("error_rate must be between 0 and 1")
+        self.bit_count = max(64, int(-expected_items * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.bit_count / expected_items * math.log(2)))
+        self.bits = bytearray((self.bit_count + 7) // 8)
+
+    def add(self, value: int) -> bool:
+        probe = _mix64((value >> 64) ^ (value & _MASK_64))
+        step = _mix64(probe ^ (value & _MASK_64)) | 1
+        bits = self.bits
+        bit_count = self.bit_count
+        present = True
+        for i in range(self.hash_count):
+            index = probe % bit_count
+            probe = (probe + step) & _MASK_64
+            step = (step + i) & _MASK_64
+            byte_index = index >> 3
+            bit = 1 << (index & 7)
+            if not bits[byte_index] & bit:
+                present = False
+                bits[byte_index] |= bit
+        return not present
+
+
+class CollisionDetector:
+    def __init__(
+        self,
+        mode: str = "exact",
+        error_rate: float = 0.001,
+        expected_items: Optional[int] = None,
+    ):
+        if mode not in COLLISION_MODES:
+            raise ValueError(f"mode must be one of {COLLISION_MODES}")
+        self.mode = mode
+        self.error_rate = error_rate
+        self.total = 0
+        self.collision_count = 0
+        if mode == "exact":
+            self._seen = PackedUUIDSet(expected_items or 1024)
+        else:
+            self._seen = BloomFilter(expected_items or 1_000_000, error_rate)
+
+    @property
+    def unique_count(self) -> int:
+        return self.total - self.collision_count
+
+    def add_int(self, value: int) -> bool:
+        self.total += 1
+        if self._seen.add(value):
+            return False
+        self.collision_count += 1
+        return True
+
+    def add(self, uuid_obj: uuid.UUID) -> bool:
+        return self.add_int(uuid_obj.int)
+
+    def add_bytes(self, data: bytes) -> int:
+        if len(data) % 16:
+            raise ValueError("data length must be a multiple of 16")
+        start = self.collision_count
+        for offset in range(0, len(data), 16):
+            self.add_int(int.from_bytes(data[offset : offset + 16], "big"))
+        return self.collision_count - start
+
+    def feed(self, uuids: Iterable[uuid.UUID]) -> int:
+        if isinstance(uuids, UUIDArray):
+            return self.add_bytes(uuids.buffer)
+        start = self.collision_count
+        for uuid_obj in uuids:
+            self.add_int(uuid_obj.int)
+        return self.collision_count - start
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "total": self.total,
+            "unique_count": self.unique_count,
+            "collision_count": self.collision_count,
+            "collision_rate": self.collision_count / self.total if self.total else 0.0,
+        }
+
+
 class UUIDAnalyzer:
     _VARIANT_MAP = {
         uuid.RESERVED_NCS: "reserved_ncs",
@@ -35,14 +238,21 @@ class UUIDAnalyzer:
         uuid.RESERVED_FUTURE: "reserved",
     }
 
-    def __init__(self):
+    def __init__(self, metrics: Optional[MetricsRegistry] = None):
         self.analyzed_uuids: List[UUIDAnalysis] = []
+        self.instrument(metrics)
+
+    def instrument(self, metrics: Optional[MetricsRegistry] = None, **labels: str):
+        instrument_methods(self, metrics, "analyzer", ANALYZER_OPERATIONS, **labels)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return uninstrumented_state(self)
 
     def analyze_uuid(self, uuid_obj: uuid.UUID) -> UUIDAnalysis:
         hex_str = uuid_obj.hex
         hex_dist = Counter(hex_str)
         bit_patterns = self._analyze_bit_patterns(uuid_obj)
-        bit_entropy = self._calculate_bit_entropy(uuid_obj)
+        bit_entropy = _entropy_from_counts(hex_dist.values())
         variant_str = self._VARIANT_MAP.get(uuid_obj.variant, "unknown")
 
         analysis = UUIDAnalysis(
@@ -57,89 +267,35 @@ class UUIDAnalyzer:
         return analysis
 
     def _analyze_bit_patterns(self, uuid_obj: uuid.UUID) -> Dict[str, int]:
-        bits = bin(uuid_obj.int)[2:].zfill(128)
-        patterns = {
-            "consecutive_zeros": 0,
-            "consecutive_ones": 0,
+        value = uuid_obj.int
+        return {
+            "consecutive_zeros": _longest_run(~value & _MASK_128),
+            "consecutive_ones": _longest_run(value),
             "alternating": 0,
-            "bit_transitions": 0,
+            "bit_transitions": bin((value ^ (value >> 1)) & _TRANSITION_MASK).count("1"),
         }
 
-        max_zero_run = 0
-        max_one_run = 0
-        current_zero_run = 0
-        current_one_run = 0
-        transitions = 0
-
-        for i in range(len(bits)):
-            if bits[i] == "0":
-                current_zero_run += 1
-                max_zero_run = max(max_zero_run, current_zero_run)
-                current_one_run = 0
-                if i > 0 and bits[i - 1] == "1":
-                    transitions += 1
-            else:
-                current_one_run += 1
-                max_one_run = max(max_one_run, current_one_run)
-                current_zero_run = 0
-                if i > 0 and bits[i - 1] == "0":
-                    transitions += 1
-
-        patterns["consecutive_zeros"] = max_zero_run
-        patterns["consecutive_ones"] = max_one_run
-        patterns["bit_transitions"] = transitions
-        return patterns
-
     def _calculate_bit_entropy(self, uuid_obj: uuid.UUID) -> float:
-        hex_str = uuid_obj.hex
-        char_freq = Counter(hex_str)
-        entropy = 0.0
-        length = len(hex_str)
-
-        for count in char_freq.values():
-            probability = count / length
-            if probability > 0:
-                entropy -= probability * math.log2(probability)
-
-        return entropy
-
-    def analyze_distribution(self, uuids: List[uuid.UUID]) -> DistributionStats:
-        if not isinstance(uuids, list) or not uuids:
-            raise ValueError("uuids must be a non-empty list")
-        unique_uuids = set()
-        collisions = 0
-        bit_distributions = defaultdict(list)
-
-        for u in uuids:
-            uuid_str = str(u)
-            if uuid_str in unique_uuids:
-                collisions += 1
-            else:
-                unique_uuids.add(uuid_str)
-
-            analysis = self.analyze_uuid(u)
-            for bit_pos in range(128):
-                bit_value = (u.int >> (127 - bit_pos)) & 1
-                bit_distributions[bit_pos].append(bit_value)
-
-        total = len(uuids)
-        unique_count = len(unique_uuids)
-        collision_rate = collisions / total if total > 0 else 0.0
-
-        bit_stats = {}
-        for bit_pos, values in bit_distributions.items():
-            bit_stats[bit_pos] = mean(values)
-
-        overall_entropy = mean([a.bit_entropy for a in self.analyzed_uuids[-total:]])
-
-        return DistributionStats(
-            total_samples=total,
-            unique_count=unique_count,
-            collision_count=collisions,
-            collision_rate=collision_rate,
-            entropy=overall_entropy,
-            bit_distribution=bit_stats,
+        counts = [0] * 16
+        for byte in uuid_obj.int.to_bytes(16, "big"):
+            counts[byte >> 4] += 1
+            counts[byte & 15] += 1
+        return _entropy_from_counts(counts)
+
+    def analyze_distribution(
+        self,
+        uuids: Union[List[uuid.UUID], UUIDArray],
+        backend: str = "python",
+        collision_mode: str = "exact",
+        error_rate: float = 0.001,
+    ) -> DistributionStats:
+        if not isinstance(uuids, (list, UUIDArray)) or not len(uuids):
+            raise ValueError("uuids must be a non-empty list or UUIDArray")
+        accumulator = DistributionAccumulator(
+            backend, collision_mode, error_rate, expected_items=len(uuids)
         )
+        accumulator.feed(uuids)
+        return accumulator.result()
 
     def detect_anomalies(self, threshold: float = 2.0) -> List[Tuple[uuid.UUID, str]]:
         if len(self.analyzed_uuids) < 10:
@@ -217,9 +373,335 @@ class UUIDAnalyzer:
         return json.dumps(summary, indent=2) if summary else "{}"
 
 
+class StreamingUUIDAnalyzer:
+    def __init__(
+        self,
+        top_k: int = 100,
+        anomaly_threshold: float = 2.0,
+        metrics: Optional[MetricsRegistry] = None,
+    ):
+        if not isinstance(top_k, int) or top_k < 1:
+            raise ValueError("top_k must be a positive integer")
+        self.top_k = top_k
+        self.anomaly_threshold = anomaly_threshold
+        self._kernels = UUIDAnalyzer()
+        self.clear_analysis()
+        self.instrument(metrics)
+
+    def instrument(self, metrics: Optional[MetricsRegistry] = None, **labels: str):
+        instrument_methods(self, metrics, "streaming_analyzer", STREAMING_OPERATIONS, **labels)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return uninstrumented_state(self)
+
+    def clear_analysis(self):
+        self.total = 0
+        self.invalid_count = 0
+        self.byte_counts: List[List[int]] = [[0] * 256 for _ in range(16)]
+        self.entropy_mean = 0.0
+        self._entropy_m2 = 0.0
+        self.version_counts: Counter = Counter()
+        self.variant_counts: Counter = Counter()
+        self._lowest: List[Tuple[float, int, bytes]] = []
+        self._highest: List[Tuple[float, int, bytes]] = []
+
+    def add(self, uuid_obj: uuid.UUID):
+        self.total += 1
+        for position, value in enumerate(uuid_obj.bytes):
+            self.byte_counts[position][value] += 1
+        self.version_counts[uuid_obj.version] += 1
+        self.variant_counts[UUIDAnalyzer._VARIANT_MAP.get(uuid_obj.variant, "unknown")] += 1
+
+        entropy = self._kernels._calculate_bit_entropy(uuid_obj)
+        delta = entropy - self.entropy_mean
+        self.entropy_mean += delta / self.total
+        self._entropy_m2 += delta * (entropy - self.entropy_mean)
+
+        raw = uuid_obj.bytes
+        self._keep_extreme(self._highest, (entropy, -self.total, raw))
+        self._keep_extreme(self._lowest, (-entropy, -self.total, raw))
+
+    def _keep_extreme(self, heap: List[Tuple[float, int, bytes]], entry: Tuple[float, int, bytes]):
+        if len(heap) < self.top_k:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+
+    def feed(self, uuids: Iterable[uuid.UUID]) -> int:
+        start = self.total
+        for uuid_obj in uuids:
+            self.add(uuid_obj)
+        return self.total - start
+
+    def merge(self, other: "StreamingUUIDAnalyzer") -> "StreamingUUIDAnalyzer":
+        if not isinstance(other, StreamingUUIDAnalyzer):
+            raise ValueError("other must be a StreamingUUIDAnalyzer")
+        self.invalid_count += other.invalid_count
+        if not other.total:
+            return self
+        offset = self.total
+        combined = self.total + other.total
+        delta = other.entropy_mean - self.entropy_mean
+        self._entropy_m2 += other._entropy_m2 + delta * delta * self.total * other.total / combined
+        self.entropy_mean += delta * other.total / combined
+        self.total = combined
+        for counts, other_counts in zip(self.byte_counts, other.byte_counts):
+            for value, count in enumerate(other_counts):
+                counts[value] += count
+        self.version_counts.update(other.version_counts)
+        self.variant_counts.update(other.variant_counts)
+        for heap, other_heap in ((self._highest, other._highest), (self._lowest, other._lowest)):
+            entries = heap + [(key, seq - offset, raw) for key, seq, raw in other_heap]
+            heap[:] = heapq.nlargest(self.top_k, entries)
+            heapq.heapify(heap)
+        return self
+
+    def _anomaly_candidates(self) -> List[Tuple[int, bytes, float]]:
+        candidates = {-seq: (raw, entropy) for entropy, seq, raw in self._highest}
+        candidates.update((-seq, (raw, -entropy)) for entropy, seq, raw in self._lowest)
+        ranked = heapq.nlargest(
+            self.top_k,
+            candidates.items(),
+            key=lambda item: (abs(item[1][1] - self.entropy_mean), -item[0]),
+        )
+        return sorted((seq, raw, entropy) for seq, (raw, entropy) in ranked)
+
+    def feed_file(self, filepath: str, binary: bool = False, chunk_size: int = 65536) -> int:
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+        start = self.total
+        if binary:
+            with open(filepath, "rb") as handle:
+                while True:
+                    chunk = handle.read(chunk_size * 16)
+                    if not chunk:
+                        break
+                    usable = len(chunk) - len(chunk) % 16
+                    if usable < len(chunk):
+                        self.invalid_count += 1
+                    for offset in range(0, usable, 16):
+                        self.add(uuid.UUID(bytes=chunk[offset : offset + 16]))
+        else:
+            with open(filepath, "r") as handle:
+                for line in handle:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        self.add(uuid.UUID(line))
+                    except ValueError:
+                        self.invalid_count += 1
+        return self.total - start
+
+    def get_entropy_stddev(self) -> float:
+        return math.sqrt(self._entropy_m2 / (self.total - 1)) if self.total > 1 else 0.0
+
+    def get_bit_distribution(self) -> Dict[int, float]:
+        if not self.total:
+            return {}
+        distribution = {}
+        for position, counts in enumerate(self.byte_counts):
+            for bit in range(8):
+                mask = 0x80 >> bit
+                ones = sum(count for value, count in enumerate(counts) if value & mask)
+                distribution[position * 8 + bit] = ones / self.total
+        return distribution
+
+    def detect_anomalies(self, threshold: Optional[float] = None) -> List[Tuple[uuid.UUID, str]]:
+        if self.total < 10:
+            return []
+        threshold = self.anomaly_threshold if threshold is None else threshold
+        std_entropy = self.get_entropy_stddev()
+        anomalies = []
+        for _, raw, entropy in self._anomaly_candidates():
+            z_score = (entropy - self.entropy_mean) / std_entropy if std_entropy > 0 else 0
+            if abs(z_score) > threshold:
+                anomalies.append((uuid.UUID(bytes=raw), f"entropy_z_score: {z_score:.2f}"))
+        return anomalies
+
+    def get_version_distribution(self) -> Dict[int, int]:
+        return dict(self.version_counts)
+
+    def get_variant_distribution(self) -> Dict[str, int]:
+        return dict(self.variant_counts)
+
+    def generate_report(self) -> str:
+        if not self.total:
+            return "No UUIDs analyzed"
+
+        report = ["UUID Streaming Analysis Report", "=" * 60]
+        report.append(f"Total UUIDs analyzed: {self.total}")
+        report.append(f"\nVersion distribution: {self.get_version_distribution()}")
+        report.append(f"Variant distribution: {self.get_variant_distribution()}")
+        report.append(f"\nAverage bit entropy: {self.entropy_mean:.4f}")
+
+        anomalies = self.detect_anomalies()
+        if anomalies:
+            report.append(f"\nAnomalies detected: {len(anomalies)}")
+            for uuid_obj, reason in anomalies[:5]:
+                report.append(f"  {uuid_obj}: {reason}")
+
+        return "\n".join(report)
+
+    def get_summary(self) -> Dict[str, Any]:
+        if not self.total:
+            return {}
+        return {
+            "total": self.total,
+            "invalid": self.invalid_count,
+            "version_distribution": self.get_version_distribution(),
+            "variant_distribution": self.get_variant_distribution(),
+            "average_entropy": self.entropy_mean,
+            "entropy_stddev": self.get_entropy_stddev(),
+            "bit_distribution": self.get_bit_distribution(),
+            "anomalies": [
+                {"uuid": str(uuid_obj), "reason": reason}
+                for uuid_obj, reason in self.detect_anomalies()
+            ],
+        }
+
+    def to_json(self) -> str:
+        summary = self.get_summary()
+        return json.dumps(summary, indent=2) if summary else "{}"
+
+
+class DistributionAccumulator:
+    def __init__(
+        self,
+        backend: str = "python",
+        collision_mode: str = "exact",
+        error_rate: float = 0.001,
+        expected_items: Optional[int] = None,
+    ):
+        if backend not in ANALYSIS_BACKENDS:
+            raise ValueError(f"backend must be one of {ANALYSIS_BACKENDS}")
+        if collision_mode not in COLLISION_MODES:
+            raise ValueError(f"collision_mode must be one of {COLLISION_MODES}")
+        if not (0 < error_rate < 1):
+            raise ValueError("error_rate must be between 0 and 1")
+        if backend == "numpy" and collision_mode != "exact":
+            raise ValueError("the numpy backend only supports exact collision detection")
+        if backend == "numpy" and np is None:
+            raise ImportError("the numpy backend requires numpy to be installed")
+        self.use_numpy = backend == "numpy" or (
+            backend == "auto" and np is not None and collision_mode == "exact"
+        )
+        self.total = 0
+        self.entropy_sum = 0.0
+        self.pattern_sums = dict.fromkeys(_PATTERN_KEYS, 0)
+        if self.use_numpy:
+            self._bit_counts = np.zeros(128, dtype=np.int64)
+            self._unique_chunks: List = []
+            self._detector = None
+        else:
+            self._byte_counts = [[0] * 256 for _ in range(16)]
+            self._detector = CollisionDetector(collision_mode, error_rate, expected_items)
+
+    def feed(self, uuids: Union[Iterable[uuid.UUID], UUIDArray]) -> int:
+        if isinstance(uuids, UUIDArray):
+            return self.feed_bytes(uuids.buffer)
+        if self.use_numpy:
+            return self.feed_bytes(b"".join(u.bytes for u in uuids))
+        start = self.total
+        for u in uuids:
+            self._add(u.bytes, u.int)
+        return self.total - start
+
+    def feed_bytes(self, data: Union[bytes, bytearray, memoryview]) -> int:
+        if len(data) % 16:
+            raise ValueError("data length must be a multiple of 16")
+        if self.use_numpy:
+            rows = np.frombuffer(data, dtype=np.uint8).reshape(-1, 16)
+            for start in range(0, len(rows), _NUMPY_CHUNK_ROWS):
+                self._add_rows(rows[start : start + _NUMPY_CHUNK_ROWS])
+            return len(rows)
+        raw = bytes(data)
+        for offset in range(0, len(raw), 16):
+            record = raw[offset : offset + 16]
+            self._add(record, int.from_bytes(record, "big"))
+        return len(raw) // 16
+
+    def _add(self, record: bytes, value: int):
+        self.total += 1
+        self._detector.add_int(value)
+        nibbles = [0] * 16
+        for counts, byte in zip(self._byte_counts, record):
+            counts[byte] += 1
+            nibbles[byte >> 4] += 1
+            nibbles[byte & 15] += 1
+        self.entropy_sum += _entropy_from_counts(nibbles)
+        sums = self.pattern_sums
+        sums["consecutive_zeros"] += _longest_run(~value & _MASK_128)
+        sums["consecutive_ones"] += _longest_run(value)
+        sums["bit_transitions"] += bin((value ^ (value >> 1)) & _TRANSITION_MASK).count("1")
+
+    def _add_rows(self, chunk):
+        size = len(chunk)
+        self.total += size
+        per_byte_bits = self._bit_counts.reshape(16, 8)
+        for shift in range(8):
+            per_byte_bits[:, shift] += ((chunk >> (7 - shift)) & 1).sum(axis=0, dtype=np.int64)
+
+        nibbles = np.stack((chunk >> 4, chunk & 0x0F), axis=2).reshape(size, 32)
+        offsets = nibbles.astype(np.int64) + (np.arange(size, dtype=np.int64) * 16)[:, None]
+        nibble_counts = np.bincount(offsets.ravel(), minlength=size * 16).reshape(size, 16)
+        self.entropy_sum -= float(np.array(_ENTROPY_TERMS)[nibble_counts].sum())
+
+        leading = np.array(_LEADING_ONES, dtype=np.int64)
+        trailing = np.array(_TRAILING_ONES, dtype=np.int64)
+        longest_in_byte = np.array(_LONGEST_ONES, dtype=np.int64)
+        self.pattern_sums["bit_transitions"] += int(
+            np.array(_BYTE_TRANSITIONS, dtype=np.int64)[chunk].sum()
+        ) + int(np.count_nonzero((chunk[:, :-1] & 1) != (chunk[:, 1:] >> 7)))
+        for key, run_bytes in (("consecutive_ones", chunk), ("consecutive_zeros", chunk ^ 0xFF)):
+            best = np.zeros(size, dtype=np.int64)
+            current = np.zeros(size, dtype=np.int64)
+            for column in run_bytes.T:
+                best = np.maximum(best, np.maximum(current + leading[column], longest_in_byte[column]))
+                current = np.where(column == 0xFF, current + 8, trailing[column])
+            self.pattern_sums[key] += int(np.maximum(best, current).sum())
+
+        self._unique_chunks.append(np.unique(chunk.view(np.dtype((np.void, 16))).ravel()))
+
+    def _bit_ones(self) -> List[int]:
+        if self.use_numpy:
+            return [int(count) for count in self._bit_counts]
+        ones = []
+        for counts in self._byte_counts:
+            for bit in range(8):
+                mask = 0x80 >> bit
+                ones.append(sum(count for value, count in enumerate(counts) if value & mask))
+        return ones
+
+    def result(self) -> DistributionStats:
+        total = self.total
+        if self.use_numpy:
+            if self._unique_chunks:
+                self._unique_chunks = [np.unique(np.concatenate(self._unique_chunks))]
+                unique_count = len(self._unique_chunks[0])
+            else:
+                unique_count = 0
+        else:
+            unique_count = self._detector.unique_count
+        collisions = total - unique_count
+        if not total:
+            return DistributionStats(0, 0, 0, 0.0, 0.0, {}, dict.fromkeys(_PATTERN_KEYS, 0.0))
+        return DistributionStats(
+            total_samples=total,
+            unique_count=unique_count,
+            collision_count=collisions,
+            collision_rate=collisions / total,
+            entropy=self.entropy_sum / total,
+            bit_distribution={pos: ones / total for pos, ones in enumerate(self._bit_ones())},
+            pattern_averages={key: value / total for key, value in self.pattern_sums.items()},
+        )
+
+
 if __name__ == "__main__":
     analyzer = UUIDAnalyzer()
     test_uuids = [uuid.uuid4() for _ in range(1000)]
+    for test_uuid in test_uuids:
+        analyzer.analyze_uuid(test_uuid)
     stats = analyzer.analyze_distribution(test_uuids)
     print(analyzer.generate_report())
     print(f"\nDistribution Stats:")
@@ -0,0 +1,223 @@
+import sys
+import uuid
+from typing import Iterable, Iterator, List, Union
+
+from uuid_utils import OUTPUT_FORMATS, format_uuid_buffer, generate_uuid4_bytes, parse_uuids_batch
+
+RECORD_SIZE = 16
+
+
+class UUIDArray:
+    def __init__(self, data: Union[bytes, bytearray, memoryview, Iterable[uuid.UUID]] = b""):
+        if isinstance(data, UUIDArray):
+            view = data._view
+        elif isinstance(data, (bytes, bytearray, memoryview)):
+            view = memoryview(data).cast("B")
+        else:
+            try:
+                view = memoryview(b"".join(u.bytes for u in data))
+            except (AttributeError, TypeError):
+                raise ValueError("data must be a bytes-like buffer or an iterable of UUID objects")
+        if view.nbytes % RECORD_SIZE:
+            raise ValueError("buffer length must be a multiple of 16")
+        self._view = view
+
+    @classmethod
+    def random(cls, count: int) -> "UUIDArray":
+        return cls(generate_uuid4_bytes(count))
+
+    @classmethod
+    def from_ints(cls, values: Iterable[int]) -> "UUIDArray":
+        try:
+            return cls(b"".join(value.to_bytes(RECORD_SIZE, "big") for value in values))
+        except (AttributeError, OverflowError):
+            raise ValueError("values must be unsigned 128-bit integers")
+
+    @classmethod
+    def from_hex(cls, values: List[str]) -> "UUIDArray":
+        if any(not isinstance(value, str) or len(value) != 32 for value in values):
+            raise ValueError("values must be 32-character hex strings")
+        raw = bytes.fromhex("".join(values))
+        if len(raw) != len(values) * RECORD_SIZE:
+            raise ValueError("values must be 32-character hex strings")
+        return cls(raw)
+
+    @classmethod
+    def from_strings(
+        cls, values: Union[List[str], bytes, bytearray, memoryview], strict: bool = False
+    ) -> "UUIDArray":
+        mask, parsed = parse_uuids_batch(values, strict)
+        invalid = mask.find(0)
+        if invalid != -1:
+            raise ValueError(f"invalid UUID at index {invalid}")
+        return cls.from_ints(parsed)
+
+    @classmethod
+    def fromfile(cls, filepath: str) -> "UUIDArray":
+        with open(filepath, "rb") as handle:
+            return cls(handle.read())
+
+    @property
+    def buffer(self) -> memoryview:
+        return self._view
+
+    @property
+    def nbytes(self) -> int:
+        return self._view.nbytes
+
+    def __len__(self) -> int:
+        return self._view.nbytes // RECORD_SIZE
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[uuid.UUID, "UUIDArray"]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return UUIDArray(self._view[start * RECORD_SIZE : max(start, stop) * RECORD_SIZE])
+            view = self._view
+            return UUIDArray(
+                b"".join(view[i * RECORD_SIZE : (i + 1) * RECORD_SIZE] for i in range(start, stop, step))
+            )
+        return uuid.UUID(bytes=self.get_bytes(index))
+
+    def get_bytes(self, index: int) -> bytes:
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("UUIDArray index out of range")
+        return self._view[index * RECORD_SIZE : (index + 1) * RECORD_SIZE].tobytes()
+
+    def __iter__(self) -> Iterator[uuid.UUID]:
+        view = self._view
+        for offset in range(0, view.nbytes, RECORD_SIZE):
+            yield uuid.UUID(bytes=view[offset : offset + RECORD_SIZE].tobytes())
+
+    def __contains__(self, value: Union[uuid.UUID, bytes]) -> bool:
+        return self.find(value) != -1
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, UUIDArray):
+            return NotImplemented
+        return self._view == other._view
+
+    __hash__ = None
+
+    def __add__(self, other: "UUIDArray") -> "UUIDArray":
+        if not isinstance(other, UUIDArray):
+            return NotImplemented
+        return UUIDArray(self._view.tobytes() + other._view.tobytes())
+
+    def __bytes__(self) -> bytes:
+        return self._view.tobytes()
+
+    if sys.version_info >= (3, 12):
+
+        def __buffer__(self, flags: int) -> memoryview:
+            return memoryview(self._view)
+
+        def __release_buffer__(self, view: memoryview):
+            view.release()
+
+    def __repr__(self) -> str:
+        preview = ", ".join(str(u) for u in self[:3])
+        suffix = ", ..." if len(self) > 3 else ""
+        return f"UUIDArray([{preview}{suffix}], len={len(self)})"
+
+    def _needle(self, value: Union[uuid.UUID, bytes]) -> bytes:
+        if isinstance(value, uuid.UUID):
+            return value.bytes
+        if isinstance(value, (bytes, bytearray)) and len(value) == RECORD_SIZE:
+            return bytes(value)
+        raise ValueError("value must be a UUID or 16 bytes")
+
+    def records(self) -> List[bytes]:
+        raw = self._view.tobytes()
+        return [raw[i : i + RECORD_SIZE] for i in range(0, len(raw), RECORD_SIZE)]
+
+    def find(self, value: Union[uuid.UUID, bytes]) -> int:
+        needle = self._needle(value)
+        raw = self._view.tobytes()
+        position = raw.find(needle)
+        while position != -1:
+            if position % RECORD_SIZE == 0:
+                return position // RECORD_SIZE
+            position = raw.find(needle, position + 1)
+        return -1
+
+    def index(self, value: Union[uuid.UUID, bytes]) -> int:
+        position = self.find(value)
+        if position == -1:
+            raise ValueError(f"{value} is not in UUIDArray")
+        return position
+
+    def count(self, value: Union[uuid.UUID, bytes]) -> int:
+        needle = self._needle(value)
+        return sum(1 for record in self.records() if record == needle)
+
+    def sort(self, reverse: bool = False):
+        ordered = b"".join(sorted(self.records(), reverse=reverse))
+        if self._view.readonly:
+            self._view = memoryview(bytearray(ordered))
+        else:
+            self._view[:] = ordered
+
+    def unique(self) -> "UUIDArray":
+        return UUIDArray(b"".join(sorted(set(self.records()))))
+
+    def dedup(self) -> "UUIDArray":
+        return UUIDArray(b"".join(dict.fromkeys(self.records())))
+
+    def searchsorted(self, value: Union[uuid.UUID, bytes]) -> int:
+        needle = self._needle(value)
+        view = self._view
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            if view[middle * RECORD_SIZE : (middle + 1) * RECORD_SIZE].tobytes() < needle:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def format(self, output_format: str = "uuid") -> List:
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"output_format must be one of {OUTPUT_FORMATS}")
+        return format_uuid_buffer(self._view, output_format)
+
+    def tolist(self) -> List[uuid.UUID]:
+        return self.format("uuid")
+
+    def to_hex(self) -> List[str]:
+        return self.format("hex")
+
+    def to_strings(self) -> List[str]:
+        return self.format("str")
+
+    def to_ints(self) -> List[int]:
+        return [int.from_bytes(record, "big") for record in self.records()]
+
+    def to_text(self, output_format: str = "str") -> bytes:
+        if output_format not in ("hex", "upper_hex", "str"):
+            raise ValueError("output_format must be one of ('hex', 'upper_hex', 'str')")
+        if not len(self):
+            return b""
+        return ("\n".join(self.format(output_format)) + "\n").encode("ascii")
+
+    def tofile(self, filepath: str):
+        with open(filepath, "wb") as handle:
+            handle.write(self._view)
+
+
+if __name__ == "__main__":
+    array = UUIDArray.random(10000)
+    print(f"Records: {len(array)} ({array.nbytes} bytes)")
+    print(f"First: {array[0]}")
+    window = array[100:200]
+    print(f"Slice shares buffer: {window.buffer.obj is array.buffer.obj}")
+    text = array.to_text()
+    print(f"Round trip through text: {UUIDArray.from_strings(text) == array}")
+    duplicated = array + array[:10]
+    print(f"Deduplicated: {len(duplicated)} -> {len(duplicated.dedup())}")
+    array.sort()
+    target = array[5000]
+    print(f"Sorted search: {array.searchsorted(target)}")
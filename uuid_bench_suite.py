@@ -0,0 +1,296 @@
+import argparse
+import hashlib
+import json
+import os
+import platform
+import statistics
+import sys
+import uuid
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from uuid_analysis import UUIDAnalyzer
+from uuid_array import UUIDArray
+from uuid_benchmark import BENCHMARK_MODES, BenchmarkResult, UUIDBenchmark
+from uuid_migration import UUIDMigrator
+from uuid_pool import PoolConfig, UUIDPool
+
+BASELINE_FORMAT_VERSION = 2
+MIN_BASELINE_RUNS = 3
+
+SCENARIOS: Dict[str, Callable[[UUIDBenchmark], Dict[str, BenchmarkResult]]] = {}
+
+
+def register_scenario(name: str):
+    def decorator(func: Callable[[UUIDBenchmark], Dict[str, BenchmarkResult]]):
+        if name in SCENARIOS:
+            raise ValueError(f"scenario {name!r} is already registered")
+        SCENARIOS[name] = func
+        return func
+
+    return decorator
+
+
+@register_scenario("generation.versions")
+def _versions_scenario(benchmark: UUIDBenchmark) -> Dict[str, BenchmarkResult]:
+    return benchmark.compare_versions(iterations=10000)
+
+
+@register_scenario("generation.bulk")
+def _bulk_generation_scenario(benchmark: UUIDBenchmark) -> Dict[str, BenchmarkResult]:
+    return benchmark.benchmark_bulk_generation(count=1000, iterations=100)
+
+
+@register_scenario("conversions")
+def _conversions_scenario(benchmark: UUIDBenchmark) -> Dict[str, BenchmarkResult]:
+    return benchmark.benchmark_conversions(iterations=10000)
+
+
+@register_scenario("validation")
+def _validation_scenario(benchmark: UUIDBenchmark) -> Dict[str, BenchmarkResult]:
+    results = benchmark.benchmark_validation(iterations=10000)
+    results.update(benchmark.benchmark_batch_validation(count=1000, iterations=100))
+    return results
+
+
+@register_scenario("pool")
+def _pool_scenario(benchmark: UUIDBenchmark) -> Dict[str, BenchmarkResult]:
+    results = {}
+    for storage in ("queue", "slab"):
+        pool = UUIDPool(PoolConfig(min_size=1000, max_size=5000, storage=storage))
+
+        def pool_get():
+            if pool.get(timeout=1.0) is not None:
+                pool.put(uuid.uuid4())
+
+        def pool_get_batch():
+            for item in pool.get_batch(100, timeout=1.0):
+                pool.put(item)
+
+        try:
+            for func in (pool_get, pool_get_batch):
+                func.__name__ = f"{func.__name__}_{storage}"
+                results[func.__name__] = benchmark.measure_function(func, 10000)
+        finally:
+            pool.shutdown()
+    return results
+
+
+@register_scenario("analyzer")
+def _analyzer_scenario(benchmark: UUIDBenchmark) -> Dict[str, BenchmarkResult]:
+    sample = UUIDArray.random(1000)
+    uuids = sample.tolist()
+
+    def analyze_distribution_python():
+        UUIDAnalyzer().analyze_distribution(uuids, backend="python")
+
+    def analyze_distribution_auto():
+        UUIDAnalyzer().analyze_distribution(sample, backend="auto")
+
+    results = {}
+    for func in (analyze_distribution_python, analyze_distribution_auto):
+        results[func.__name__] = benchmark.measure_function(func, 20)
+    results.update(benchmark.benchmark_analysis_kernels(iterations=5000))
+    return results
+
+
+@register_scenario("migrator")
+def _migrator_scenario(benchmark: UUIDBenchmark) -> Dict[str, BenchmarkResult]:
+    sample = UUIDArray.random(1000)
+    uuids = sample.tolist()
+
+    def migrate_v4_to_v5():
+        migrator = UUIDMigrator()
+        for u in uuids:
+            migrator.migrate_v4_to_v5(u, "example.com", str(u))
+
+    def batch_migrate_array():
+        UUIDMigrator().batch_migrate_array(sample, "v4_to_v5", "example.com")
+
+    results = {}
+    for func in (migrate_v4_to_v5, batch_migrate_array):
+        results[func.__name__] = benchmark.measure_function(func, 20)
+    return results
+
+
+def machine_fingerprint() -> Dict[str, str]:
+    return {
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "processor": platform.processor() or "unknown",
+        "cpu_count": str(os.cpu_count() or 0),
+        "implementation": platform.python_implementation(),
+        "python": platform.python_version(),
+    }
+
+
+def fingerprint_key(fingerprint: Dict[str, str]) -> str:
+    encoded = json.dumps(fingerprint, sort_keys=True).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest()[:16]
+
+
+@dataclass
+class ScenarioComparison:
+    name: str
+    baseline_time: float
+    current_time: float
+    change: float
+    regressed: bool
+
+
+def run_suite(
+    scenarios: Optional[List[str]] = None, benchmark: Optional[UUIDBenchmark] = None
+) -> Dict[str, BenchmarkResult]:
+    names = scenarios or sorted(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"unknown scenarios: {', '.join(unknown)}")
+    benchmark = benchmark or UUIDBenchmark(mode="calibrated", max_seconds=1.0)
+    results = {}
+    for name in names:
+        for function_name, result in SCENARIOS[name](benchmark).items():
+            results[f"{name}.{function_name}"] = result
+    return results
+
+
+def _read_baseline_file(filepath: str) -> Dict:
+    if not os.path.exists(filepath):
+        return {"version": BASELINE_FORMAT_VERSION, "baselines": {}}
+    with open(filepath, "r") as handle:
+        data = json.load(handle)
+    if not isinstance(data, dict) or not isinstance(data.get("baselines"), dict):
+        raise ValueError(f"{filepath} is not a baseline file")
+    return data
+
+
+def load_baselines(filepath: str) -> Dict:
+    data = _read_baseline_file(filepath)
+    if data.get("version") != BASELINE_FORMAT_VERSION:
+        raise ValueError(f"{filepath} has an unsupported baseline format; record it again")
+    return data
+
+
+def save_baseline(filepath: str, runs: List[Dict[str, BenchmarkResult]]) -> str:
+    if len(runs) < MIN_BASELINE_RUNS:
+        raise ValueError(f"a baseline needs at least {MIN_BASELINE_RUNS} runs")
+    data = _read_baseline_file(filepath)
+    version = data.get("version")
+    if version != BASELINE_FORMAT_VERSION:
+        if not isinstance(version, int) or version > BASELINE_FORMAT_VERSION:
+            raise ValueError(f"{filepath} has an unsupported baseline format")
+        data = {"version": BASELINE_FORMAT_VERSION, "baselines": {}}
+    fingerprint = machine_fingerprint()
+    key = fingerprint_key(fingerprint)
+    entry = data["baselines"].setdefault(key, {"fingerprint": fingerprint, "results": {}})
+    entry["recorded_at"] = datetime.now().isoformat()
+    for name, result in runs[-1].items():
+        run_medians = [run[name].median_time for run in runs if name in run]
+        record = asdict(result)
+        record["median_time"] = statistics.median(run_medians)
+        record["run_medians"] = run_medians
+        entry["results"][name] = record
+    temporary = f"{filepath}.tmp"
+    with open(temporary, "w") as handle:
+        json.dump(data, handle, indent=2, sort_keys=True)
+    os.replace(temporary, filepath)
+    return key
+
+
+def compare_results(
+    baseline: Dict[str, Dict],
+    current: Dict[str, BenchmarkResult],
+    threshold: float = 0.1,
+    min_effect: float = 0.05,
+) -> List[ScenarioComparison]:
+    if threshold < 0:
+        raise ValueError("threshold must be non-negative")
+    if min_effect < 0:
+        raise ValueError("min_effect must be non-negative")
+    comparisons = []
+    for name, result in sorted(current.items()):
+        reference = baseline.get(name)
+        if reference is None or reference["median_time"] <= 0:
+            continue
+        run_medians = reference.get("run_medians", [])
+        if len(run_medians) < MIN_BASELINE_RUNS:
+            raise ValueError(f"baseline for {name} has fewer than {MIN_BASELINE_RUNS} runs")
+        change = result.median_time / reference["median_time"] - 1.0
+        regressed = (
+            change > threshold
+            and result.median_time - reference["median_time"] >= min_effect
+            and result.median_time > max(run_medians)
+        )
+        comparisons.append(
+            ScenarioComparison(
+                name=name,
+                baseline_time=reference["median_time"],
+                current_time=result.median_time,
+                change=change,
+                regressed=regressed,
+            )
+        )
+    return comparisons
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="UUID benchmark regression suite")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("list", help="list registered scenarios")
+    for command, help_text in [
+        ("run", "run scenarios and print results"),
+        ("record", "run scenarios and store them as the baseline for this machine"),
+        ("compare", "run scenarios and compare them with the stored baseline"),
+    ]:
+        command_parser = subparsers.add_parser(command, help=help_text)
+        command_parser.add_argument("--scenario", action="append", dest="scenarios")
+        command_parser.add_argument("--mode", choices=BENCHMARK_MODES, default="calibrated")
+        command_parser.add_argument("--max-seconds", type=float, default=1.0)
+        command_parser.add_argument("--baseline", default="uuid_benchmark_baseline.json")
+        command_parser.add_argument("--threshold", type=float, default=0.1)
+        command_parser.add_argument("--min-effect", type=float, default=0.05)
+        if command == "record":
+            command_parser.add_argument("--repeat", type=int, default=MIN_BASELINE_RUNS)
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for name in sorted(SCENARIOS):
+            print(name)
+        return 0
+
+    benchmark = UUIDBenchmark(mode=args.mode, max_seconds=args.max_seconds)
+    if args.command == "record":
+        if args.repeat < MIN_BASELINE_RUNS:
+            parser.error(f"--repeat must be at least {MIN_BASELINE_RUNS}")
+        runs = [run_suite(args.scenarios, benchmark) for _ in range(args.repeat)]
+        key = save_baseline(args.baseline, runs)
+        print(
+            f"Recorded {len(runs[-1])} results from {len(runs)} runs "
+            f"for fingerprint {key} in {args.baseline}"
+        )
+        return 0
+
+    results = run_suite(args.scenarios, benchmark)
+    if args.command == "run":
+        for name, result in sorted(results.items()):
+            print(f"{name}: {result.median_time:.4f} μs ({result.operations_per_second:,.0f} ops/s)")
+        return 0
+    key = fingerprint_key(machine_fingerprint())
+    entry = load_baselines(args.baseline)["baselines"].get(key)
+    if entry is None:
+        print(f"No baseline for fingerprint {key} in {args.baseline}", file=sys.stderr)
+        return 2
+    comparisons = compare_results(entry["results"], results, args.threshold, args.min_effect)
+    for comparison in comparisons:
+        marker = "REGRESSION" if comparison.regressed else "ok"
+        print(
+            f"{marker:>10}  {comparison.name}: {comparison.baseline_time:.4f} -> "
+            f"{comparison.current_time:.4f} μs ({comparison.change:+.1%})"
+        )
+    regressions = sum(1 for comparison in comparisons if comparison.regressed)
+    print(f"{regressions} regression(s) across {len(comparisons)} compared results")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,31 @@
+import asyncio
 import csv
+import gc
+import os
+import random
 import statistics
+import threading
 import time
 import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Callable, Dict, List
+from typing import Callable, Dict, Iterator, List
+
+from uuid_analysis import UUIDAnalyzer, np
+from uuid_migration import UUIDMigrator
+from uuid_pool import AsyncUUIDPool, PoolConfig, PoolStats, STORAGE_MODES, UUIDPool
+from uuid_stats import percentile
+from uuid_utils import (
+    NamespaceHasher,
+    generate_session_tokens,
+    generate_user_ids,
+    generate_uuid4_bytes,
+    generate_uuid6,
+    generate_uuid7,
+    generate_uuid7_bytes,
+    is_valid_uuid,
+    is_valid_uuid_batch,
+)
 
 
 @dataclass
@@ -17,17 +39,135 @@ class BenchmarkResult:
     median_time: float
     std_deviation: float
     operations_per_second: float
+    p95_time: float = 0.0
+    p99_time: float = 0.0
+    ci_lower: float = 0.0
+    ci_upper: float = 0.0
+    samples: int = 0
+    loops_per_sample: int = 0
+
+
+BENCHMARK_MODES = ("simple", "calibrated")
 
 
 class UUIDBenchmark:
-    def __init__(self):
+    def __init__(
+        self,
+        mode: str = "simple",
+        target_sample_seconds: float = 0.01,
+        samples: int = 30,
+        warmup_seconds: float = 0.05,
+        max_seconds: float = 2.0,
+        bootstrap_rounds: int = 1000,
+        confidence: float = 0.95,
+        disable_gc: bool = True,
+        pin_cpu: bool = True,
+    ):
+        if mode not in BENCHMARK_MODES:
+            raise ValueError(f"mode must be one of {BENCHMARK_MODES}")
+        if not isinstance(samples, int) or samples < 3:
+            raise ValueError("samples must be an integer >= 3")
+        if target_sample_seconds <= 0 or max_seconds <= 0 or warmup_seconds < 0:
+            raise ValueError("durations must be positive")
+        if not 0.0 < confidence < 1.0:
+            raise ValueError("confidence must be between 0 and 1")
         self.results: Dict[str, BenchmarkResult] = {}
+        self.mode = mode
+        self.target_sample_seconds = target_sample_seconds
+        self.samples = samples
+        self.warmup_seconds = warmup_seconds
+        self.max_seconds = max_seconds
+        self.bootstrap_rounds = bootstrap_rounds
+        self.confidence = confidence
+        self.disable_gc = disable_gc
+        self.pin_cpu = pin_cpu
+
+    @contextmanager
+    def _isolated(self) -> Iterator[None]:
+        gc_was_enabled = gc.isenabled()
+        affinity = None
+        if self.pin_cpu and hasattr(os, "sched_setaffinity"):
+            try:
+                affinity = os.sched_getaffinity(0)
+                os.sched_setaffinity(0, {min(affinity)})
+            except OSError:
+                affinity = None
+        if self.disable_gc:
+            gc.collect()
+            gc.disable()
+        try:
+            yield
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+            if affinity is not None:
+                os.sched_setaffinity(0, affinity)
+
+    def _time_block(self, func: Callable, loops: int, args: tuple, kwargs: dict) -> float:
+        repeat = range(loops)
+        start = time.perf_counter()
+        for _ in repeat:
+            func(*args, **kwargs)
+        return time.perf_counter() - start
+
+    def _calibrate(self, func: Callable, args: tuple, kwargs: dict) -> int:
+        deadline = time.perf_counter() + self.warmup_seconds
+        while time.perf_counter() < deadline:
+            func(*args, **kwargs)
+        loops = 1
+        while True:
+            elapsed = self._time_block(func, loops, args, kwargs)
+            if elapsed >= self.target_sample_seconds:
+                return loops
+            if elapsed <= 0:
+                loops *= 10
+            else:
+                loops = max(loops * 2, int(loops * self.target_sample_seconds * 1.2 / elapsed))
+
+    def _bootstrap_median_ci(self, values: List[float]) -> tuple:
+        rng = random.Random(0x5EED)
+        size = len(values)
+        medians = sorted(
+            statistics.median(rng.choices(values, k=size)) for _ in range(self.bootstrap_rounds)
+        )
+        tail = (1.0 - self.confidence) / 2
+        return percentile(medians, tail), percentile(medians, 1.0 - tail)
+
+    def _measure_calibrated(
+        self, func: Callable, iterations: int, args: tuple, kwargs: dict
+    ) -> BenchmarkResult:
+        with self._isolated():
+            loops = self._calibrate(func, args, kwargs)
+            sample_seconds = self._time_block(func, loops, args, kwargs)
+            budget = max(3, int(self.max_seconds / max(sample_seconds, 1e-9)))
+            wanted = max(self.samples, -(-iterations // loops))
+            per_call = []
+            for _ in range(min(wanted, budget)):
+                per_call.append(self._time_block(func, loops, args, kwargs) * 1000000 / loops)
+
+        result = self._build_result(func.__name__, per_call)
+        ordered = sorted(per_call)
+        result.iterations = loops * len(per_call)
+        result.total_time = sum(per_call) * loops / 1000
+        result.operations_per_second = (
+            result.iterations / (result.total_time / 1000) if result.total_time > 0 else 0
+        )
+        result.p95_time = percentile(ordered, 0.95)
+        result.p99_time = percentile(ordered, 0.99)
+        result.ci_lower, result.ci_upper = self._bootstrap_median_ci(per_call)
+        result.samples = len(per_call)
+        result.loops_per_sample = loops
+        return result
 
     def measure_function(
         self, func: Callable, iterations: int = 10000, *args, **kwargs
     ) -> BenchmarkResult:
         if not isinstance(iterations, int) or iterations < 1:
             raise ValueError("iterations must be a positive integer")
+        if self.mode == "calibrated":
+            result = self._measure_calibrated(func, iterations, args, kwargs)
+            self.results[func.__name__] = result
+            return result
         times = []
         for _ in range(iterations):
             start = time.perf_counter()
@@ -35,6 +175,12 @@ class UUIDBenchmark:
             end = time.perf_counter()
             times.append((end - start) * 1000000)
 
+        result = self._build_result(func.__name__, times)
+        self.results[func.__name__] = result
+        return result
+
+    def _build_result(self, function_name: str, times: List[float]) -> BenchmarkResult:
+        iterations = len(times)
         total_time = sum(times)
         avg_time = statistics.mean(times)
         min_time = min(times)
@@ -43,8 +189,8 @@ class UUIDBenchmark:
         std_dev = statistics.stdev(times) if len(times) > 1 else 0.0
         ops_per_sec = (iterations / total_time) * 1000000 if total_time > 0 else 0
 
-        result = BenchmarkResult(
-            function_name=func.__name__,
+        return BenchmarkResult(
+            function_name=function_name,
             iterations=iterations,
             total_time=total_time / 1000,
             average_time=avg_time,
@@ -54,8 +200,6 @@ class UUIDBenchmark:
             std_deviation=std_dev,
             operations_per_second=ops_per_sec,
         )
-        self.results[func.__name__] = result
-        return result
 
     def compare_versions(self, iterations: int = 10000) -> Dict[str, BenchmarkResult]:
         def generate_v1():
@@ -70,8 +214,14 @@ class UUIDBenchmark:
         def generate_v5():
             return uuid.uuid5(uuid.NAMESPACE_DNS, "test")
 
+        def generate_v6():
+            return generate_uuid6()
+
+        def generate_v7():
+            return generate_uuid7()
+
         results = {}
-        for func in [generate_v1, generate_v3, generate_v4, generate_v5]:
+        for func in [generate_v1, generate_v3, generate_v4, generate_v5, generate_v6, generate_v7]:
             result = self.measure_function(func, iterations)
             results[func.__name__] = result
 
@@ -123,13 +273,444 @@ class UUIDBenchmark:
             except ValueError:
                 return False
 
+        def fast_validate_valid():
+            return is_valid_uuid(valid_uuid_str)
+
+        def fast_validate_invalid():
+            return is_valid_uuid(invalid_uuid_str)
+
+        def strict_validate_valid():
+            return is_valid_uuid(valid_uuid_str, strict=True)
+
         results = {}
-        for func in [validate_valid, validate_invalid]:
+        for func in [
+            validate_valid,
+            validate_invalid,
+            fast_validate_valid,
+            fast_validate_invalid,
+            strict_validate_valid,
+        ]:
             result = self.measure_function(func, iterations)
             results[func.__name__] = result
 
         return results
 
+    def benchmark_bulk_generation(
+        self, count: int = 1000, iterations: int = 100
+    ) -> Dict[str, BenchmarkResult]:
+        if not isinstance(count, int) or count < 1:
+            raise ValueError("count must be a positive integer")
+
+        def per_call_user_ids():
+            return [uuid.uuid4() for _ in range(count)]
+
+        def batch_user_ids():
+            return generate_user_ids(count)
+
+        def per_call_session_tokens():
+            return [uuid.uuid4().hex for _ in range(count)]
+
+        def batch_session_tokens():
+            return generate_session_tokens(count)
+
+        def per_call_raw_bytes():
+            return b"".join(uuid.uuid4().bytes for _ in range(count))
+
+        def batch_raw_bytes():
+            return generate_uuid4_bytes(count)
+
+        def batch_v7_bytes():
+            return generate_uuid7_bytes(count)
+
+        results = {}
+        for func in [
+            per_call_user_ids,
+            batch_user_ids,
+            per_call_session_tokens,
+            batch_session_tokens,
+            per_call_raw_bytes,
+            batch_raw_bytes,
+            batch_v7_bytes,
+        ]:
+            result = self.measure_function(func, iterations)
+            results[func.__name__] = result
+
+        return results
+
+    def benchmark_pool_get(
+        self, threads: int = 16, gets_per_thread: int = 2000
+    ) -> Dict[str, BenchmarkResult]:
+        if not isinstance(threads, int) or threads < 1:
+            raise ValueError("threads must be a positive integer")
+        if not isinstance(gets_per_thread, int) or gets_per_thread < 1:
+            raise ValueError("gets_per_thread must be a positive integer")
+        total = threads * gets_per_thread
+
+        results = {}
+        for storage in STORAGE_MODES:
+            pool = UUIDPool(PoolConfig(min_size=total, max_size=total, storage=storage))
+            per_thread_times: List[List[float]] = [[] for _ in range(threads)]
+            barrier = threading.Barrier(threads)
+
+            def consumer(times: List[float]):
+                barrier.wait()
+                for _ in range(gets_per_thread):
+                    start = time.perf_counter()
+                    pool.get(timeout=1.0)
+                    end = time.perf_counter()
+                    times.append((end - start) * 1000000)
+
+            workers = [
+                threading.Thread(target=consumer, args=(times,))
+                for times in per_thread_times
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            pool.shutdown()
+
+            name = f"pool_get_{storage}"
+            result = self._build_result(
+                name, [t for times in per_thread_times for t in times]
+            )
+            self.results[name] = result
+            results[name] = result
+
+        return results
+
+    def benchmark_pool_thread_scaling(
+        self,
+        thread_counts: tuple = (1, 2, 4, 8, 16, 32),
+        gets_per_thread: int = 5000,
+        thread_cache_size: int = 256,
+    ) -> Dict[str, BenchmarkResult]:
+        if not isinstance(gets_per_thread, int) or gets_per_thread < 1:
+            raise ValueError("gets_per_thread must be a positive integer")
+        if not isinstance(thread_cache_size, int) or thread_cache_size < 1:
+            raise ValueError("thread_cache_size must be a positive integer")
+
+        results = {}
+        for storage in STORAGE_MODES:
+            for cache_size in (0, thread_cache_size):
+                for threads in thread_counts:
+                    total = threads * gets_per_thread
+                    capacity = total + threads * cache_size
+                    pool = UUIDPool(
+                        PoolConfig(
+                            min_size=capacity,
+                            max_size=capacity,
+                            storage=storage,
+                            thread_cache_size=cache_size,
+                        )
+                    )
+                    per_thread_times: List[float] = []
+                    barrier = threading.Barrier(threads + 1)
+
+                    def consumer():
+                        get = pool.get
+                        barrier.wait()
+                        start = time.perf_counter()
+                        for _ in range(gets_per_thread):
+                            get(timeout=1.0)
+                        per_thread_times.append(
+                            (time.perf_counter() - start) * 1000000 / gets_per_thread
+                        )
+
+                    workers = [threading.Thread(target=consumer) for _ in range(threads)]
+                    for worker in workers:
+                        worker.start()
+                    barrier.wait()
+                    start = time.perf_counter()
+                    for worker in workers:
+                        worker.join()
+                    elapsed = time.perf_counter() - start
+                    pool.shutdown()
+
+                    mode = "magazine" if cache_size else "shared"
+                    name = f"pool_{storage}_{mode}_{threads}_threads"
+                    result = self._build_result(name, per_thread_times)
+                    result.iterations = total
+                    result.operations_per_second = total / elapsed if elapsed > 0 else 0
+                    self.results[name] = result
+                    results[name] = result
+
+        return results
+
+    def benchmark_pool_output_formats(self, gets: int = 20000) -> Dict[str, BenchmarkResult]:
+        if not isinstance(gets, int) or gets < 1:
+            raise ValueError("gets must be a positive integer")
+        conversions = {"hex": lambda u: u.hex, "str": str}
+
+        results = {}
+        for storage in STORAGE_MODES:
+            for output_format, conversion in [
+                ("uuid", "hex"),
+                ("hex", None),
+                ("uuid", "str"),
+                ("str", None),
+            ]:
+                convert = conversions.get(conversion)
+                pool = UUIDPool(
+                    PoolConfig(
+                        min_size=gets,
+                        max_size=gets,
+                        storage=storage,
+                        output_format=output_format,
+                    )
+                )
+                times = []
+                for _ in range(gets):
+                    start = time.perf_counter()
+                    item = pool.get(timeout=1.0)
+                    if convert is not None:
+                        item = convert(item)
+                    end = time.perf_counter()
+                    times.append((end - start) * 1000000)
+                pool.shutdown()
+
+                suffix = f"{output_format}_to_{conversion}" if conversion else output_format
+                name = f"pool_get_{storage}_{suffix}"
+                result = self._build_result(name, times)
+                self.results[name] = result
+                results[name] = result
+
+        return results
+
+    def benchmark_bursty_refill(
+        self,
+        bursts: int = 20,
+        burst_size: int = 200,
+        pause: float = 0.05,
+        storage: str = "queue",
+    ) -> Dict[str, PoolStats]:
+        if not isinstance(bursts, int) or bursts < 1:
+            raise ValueError("bursts must be a positive integer")
+        if not isinstance(burst_size, int) or burst_size < 1:
+            raise ValueError("burst_size must be a positive integer")
+
+        results = {}
+        for mode, adaptive in [("fixed", False), ("adaptive", True)]:
+            pool = UUIDPool(
+                PoolConfig(
+                    min_size=burst_size // 2,
+                    max_size=burst_size * 4,
+                    storage=storage,
+                    adaptive_refill=adaptive,
+                )
+            )
+            for _ in range(bursts):
+                for _ in range(burst_size):
+                    pool.get(timeout=0)
+                time.sleep(pause)
+            results[mode] = pool.get_stats()
+            pool.shutdown()
+
+        return results
+
+    def benchmark_async_pool(
+        self, requests: int = 2000, concurrency: int = 16
+    ) -> Dict[str, BenchmarkResult]:
+        if not isinstance(requests, int) or requests < 1:
+            raise ValueError("requests must be a positive integer")
+        if not isinstance(concurrency, int) or concurrency < 1:
+            raise ValueError("concurrency must be a positive integer")
+        config = PoolConfig(min_size=requests, max_size=requests * 2)
+
+        async def run_requests(fetch: Callable) -> List[float]:
+            times: List[float] = []
+            per_task = max(1, requests // concurrency)
+
+            async def handler():
+                for _ in range(per_task):
+                    start = time.perf_counter()
+                    await fetch()
+                    end = time.perf_counter()
+                    times.append((end - start) * 1000000)
+
+            await asyncio.gather(*(handler() for _ in range(concurrency)))
+            return times
+
+        async def executor_get() -> List[float]:
+            pool = UUIDPool(config)
+            loop = asyncio.get_running_loop()
+            try:
+                return await run_requests(
+                    lambda: loop.run_in_executor(None, pool.get, 1.0)
+                )
+            finally:
+                pool.shutdown()
+
+        async def async_aget() -> List[float]:
+            async with AsyncUUIDPool(config) as pool:
+                return await run_requests(lambda: pool.aget(timeout=1.0))
+
+        results = {}
+        for name, scenario in [("executor_get", executor_get), ("async_aget", async_aget)]:
+            result = self._build_result(name, asyncio.run(scenario()))
+            self.results[name] = result
+            results[name] = result
+
+        return results
+
+    def benchmark_analysis_backends(
+        self, count: int = 100000, iterations: int = 3
+    ) -> Dict[str, BenchmarkResult]:
+        if not isinstance(count, int) or count < 1:
+            raise ValueError("count must be a positive integer")
+        sample = generate_user_ids(count)
+
+        def analyze_python():
+            return UUIDAnalyzer().analyze_distribution(sample, backend="python")
+
+        def analyze_numpy():
+            return UUIDAnalyzer().analyze_distribution(sample, backend="numpy")
+
+        funcs = [analyze_python] if np is None else [analyze_python, analyze_numpy]
+        results = {}
+        for func in funcs:
+            result = self.measure_function(func, iterations)
+            results[func.__name__] = result
+
+        return results
+
+    def benchmark_analysis_kernels(self, iterations: int = 10000) -> Dict[str, BenchmarkResult]:
+        analyzer = UUIDAnalyzer()
+        test_uuid = uuid.uuid4()
+
+        def bit_patterns():
+            return analyzer._analyze_bit_patterns(test_uuid)
+
+        def bit_entropy():
+            return analyzer._calculate_bit_entropy(test_uuid)
+
+        results = {}
+        for func in [bit_patterns, bit_entropy]:
+            result = self.measure_function(func, iterations)
+            results[func.__name__] = result
+
+        return results
+
+    def benchmark_parallel_migration(
+        self, count: int = 100000, worker_counts: tuple = (1, 2, 4), chunk_size: int = 5000
+    ) -> Dict[str, BenchmarkResult]:
+        if not isinstance(count, int) or count < 1:
+            raise ValueError("count must be a positive integer")
+        sample = generate_user_ids(count)
+
+        def sequential_migrate():
+            migrator = UUIDMigrator()
+            for u in sample:
+                migrator.migrate_v4_to_v5(u, "example.com", str(u))
+
+        funcs = [sequential_migrate]
+        for workers in worker_counts:
+            def parallel_migrate(workers=workers):
+                migrator = UUIDMigrator()
+                for _ in migrator.batch_migrate_parallel_packed(
+                    sample,
+                    "v4_to_v5",
+                    "example.com",
+                    workers=workers,
+                    chunk_size=chunk_size,
+                    record_history=False,
+                ):
+                    pass
+
+            parallel_migrate.__name__ = f"parallel_migrate_{workers}_workers"
+            funcs.append(parallel_migrate)
+
+        results = {}
+        for func in funcs:
+            result = self.measure_function(func, 1)
+            results[func.__name__] = result
+
+        return results
+
+    def benchmark_batch_validation(
+        self, count: int = 1000, iterations: int = 100, invalid_ratio: float = 0.5
+    ) -> Dict[str, BenchmarkResult]:
+        if not isinstance(count, int) or count < 1:
+            raise ValueError("count must be a positive integer")
+        if not 0.0 <= invalid_ratio <= 1.0:
+            raise ValueError("invalid_ratio must be between 0 and 1")
+        values = [str(u) for u in generate_user_ids(count)]
+        for i in random.sample(range(count), int(count * invalid_ratio)):
+            values[i] = values[i][:35] + "g"
+        buffer = "\n".join(values).encode("ascii")
+
+        def per_item_uuid_parse():
+            mask = bytearray(count)
+            for i, value in enumerate(values):
+                try:
+                    uuid.UUID(value)
+                    mask[i] = 1
+                except ValueError:
+                    pass
+            return mask
+
+        def batch_validate_list():
+            return is_valid_uuid_batch(values)
+
+        def batch_validate_buffer():
+            return is_valid_uuid_batch(buffer)
+
+        if batch_validate_list() != per_item_uuid_parse():
+            raise ValueError("batch validation does not match uuid.UUID")
+
+        results = {}
+        for func in [per_item_uuid_parse, batch_validate_list, batch_validate_buffer]:
+            result = self.measure_function(func, iterations)
+            results[func.__name__] = result
+
+        return results
+
+    def benchmark_namespace_hashing(
+        self, count: int = 1000, iterations: int = 100
+    ) -> Dict[str, BenchmarkResult]:
+        if not isinstance(count, int) or count < 1:
+            raise ValueError("count must be a positive integer")
+        names = [str(u) for u in generate_user_ids(count)]
+        namespace_uuid = uuid.uuid5(uuid.NAMESPACE_DNS, "example.com")
+        hasher = NamespaceHasher(namespace_uuid, 5)
+        migrator = UUIDMigrator()
+
+        def stdlib_uuid5():
+            return [uuid.uuid5(namespace_uuid, n) for n in names]
+
+        def stdlib_uuid5_with_namespace():
+            return [uuid.uuid5(uuid.uuid5(uuid.NAMESPACE_DNS, "example.com"), n) for n in names]
+
+        def primed_uuid5():
+            return [hasher.hash(n) for n in names]
+
+        def primed_uuid5_batch():
+            return hasher.hash_batch(names)
+
+        def migrator_get_hasher():
+            return [migrator.get_hasher("example.com").hash(n) for n in names]
+
+        results = {}
+        for func in [
+            stdlib_uuid5,
+            stdlib_uuid5_with_namespace,
+            primed_uuid5,
+            primed_uuid5_batch,
+            migrator_get_hasher,
+        ]:
+            result = self.measure_function(func, iterations)
+            results[func.__name__] = result
+
+        return results
+
+    def get_speedup(self, baseline_name: str, candidate_name: str) -> float:
+        if baseline_name not in self.results or candidate_name not in self.results:
+            raise ValueError("both benchmarks must have been run")
+        candidate_time = self.results[candidate_name].average_time
+        if candidate_time <= 0:
+            return 0.0
+        return self.results[baseline_name].average_time / candidate_time
+
     def get_comparison_report(self) -> str:
         if not self.results:
             return "No benchmark results available"
@@ -147,6 +728,15 @@ class UUIDBenchmark:
             report.append(f"  Max: {result.max_time:.4f} μs")
             report.append(f"  Std Dev: {result.std_deviation:.4f} μs")
             report.append(f"  Ops/sec: {result.operations_per_second:,.0f}")
+            if result.samples:
+                report.append(
+                    f"  P95/P99: {result.p95_time:.4f} / {result.p99_time:.4f} μs"
+                )
+                report.append(
+                    f"  Median {self.confidence:.0%} CI: "
+                    f"[{result.ci_lower:.4f}, {result.ci_upper:.4f}] μs "
+                    f"({result.samples} samples x {result.loops_per_sample} loops)"
+                )
 
         return "\n".join(report)
 
@@ -166,6 +756,12 @@ class UUIDBenchmark:
             "median_time_us",
             "std_deviation_us",
             "operations_per_second",
+            "p95_time_us",
+            "p99_time_us",
+            "ci_lower_us",
+            "ci_upper_us",
+            "samples",
+            "loops_per_sample",
         ]
         with open(filepath, "w", newline="") as csvfile:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
@@ -182,6 +778,12 @@ class UUIDBenchmark:
                         "median_time_us": result.median_time,
                         "std_deviation_us": result.std_deviation,
                         "operations_per_second": result.operations_per_second,
+                        "p95_time_us": result.p95_time,
+                        "p99_time_us": result.p99_time,
+                        "ci_lower_us": result.ci_lower,
+                        "ci_upper_us": result.ci_upper,
+                        "samples": result.samples,
+                        "loops_per_sample": result.loops_per_sample,
                     }
                 )
 
@@ -192,5 +794,33 @@ if __name__ == "__main__":
     version_results = benchmark.compare_versions(iterations=50000)
     print("\nBenchmarking UUID conversions...")
     conversion_results = benchmark.benchmark_conversions(iterations=50000)
+    calibrated = UUIDBenchmark(mode="calibrated")
+    for name, result in calibrated.benchmark_conversions().items():
+        print(
+            f"  {name}: {result.median_time:.4f} μs "
+            f"(95% CI {result.ci_lower:.4f}-{result.ci_upper:.4f}, p99 {result.p99_time:.4f})"
+        )
+    print("\nBenchmarking bulk generation...")
+    bulk_results = benchmark.benchmark_bulk_generation(count=1000, iterations=200)
+    for kind in ["user_ids", "session_tokens", "raw_bytes"]:
+        speedup = benchmark.get_speedup(f"per_call_{kind}", f"batch_{kind}")
+        print(f"  {kind}: {speedup:.1f}x faster in batch")
+    print("\nBenchmarking pool get() under 16 threads...")
+    pool_results = benchmark.benchmark_pool_get(threads=16, gets_per_thread=2000)
+    print("\nBenchmarking pool throughput versus thread count...")
+    scaling_results = benchmark.benchmark_pool_thread_scaling(thread_counts=(1, 4, 16, 32))
+    for name, result in scaling_results.items():
+        print(f"  {name}: {result.operations_per_second:,.0f} gets/s")
+    print("\nBenchmarking refill under bursty load...")
+    for mode, stats in benchmark.benchmark_bursty_refill().items():
+        total = stats.cache_hits + stats.cache_misses
+        print(f"  {mode}: hit rate {stats.cache_hits / total:.2%}")
+    print("\nBenchmarking asyncio pool access...")
+    async_results = benchmark.benchmark_async_pool()
+    print(f"  aget: {benchmark.get_speedup('executor_get', 'async_aget'):.1f}x faster")
+    print("\nBenchmarking namespace hashing...")
+    namespace_results = benchmark.benchmark_namespace_hashing(count=1000, iterations=100)
+    for name, result in namespace_results.items():
+        print(f"  {name}: {result.average_time / 1000:.3f} us per record")
     print("\n" + benchmark.get_comparison_report())
 
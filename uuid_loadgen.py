@@ -0,0 +1,454 @@
+import argparse
+import os
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from uuid_pool import STORAGE_MODES, PoolConfig, PoolStats, SharedUUIDPool, UUIDPool, UUIDPoolManager
+from uuid_stats import percentile
+
+LOAD_BACKENDS = ("thread", "process")
+LOAD_MODES = ("closed", "open")
+
+
+@dataclass
+class LoadConfig:
+    consumers: int = 4
+    producers: int = 0
+    duration_seconds: float = 2.0
+    rate: Optional[float] = None
+    producer_rate: float = 1000.0
+    batch_size: int = 1
+    timeout: float = 0.1
+    sample_interval: float = 0.05
+    claim_size: int = 64
+
+    @property
+    def mode(self) -> str:
+        return "closed" if self.rate is None else "open"
+
+
+@dataclass
+class LoadSample:
+    elapsed: float
+    current_size: int
+    deficit: int
+    refill_count: int
+    cache_misses: int
+    total_consumed: int
+
+
+@dataclass
+class LoadResult:
+    name: str
+    backend: str
+    mode: str
+    consumers: int
+    producers: int
+    duration_seconds: float
+    gets: int
+    items: int
+    timeouts: int
+    puts: int
+    throughput: float
+    latency_p50: float
+    latency_p95: float
+    latency_p99: float
+    latency_max: float
+    latency_histogram: Dict[int, int]
+    hit_rate: float
+    stats: PoolStats
+    refill_lag_max: float
+    refill_lag_mean: float
+    starved_fraction: float
+    samples: List[LoadSample] = field(default_factory=list)
+
+
+@dataclass
+class _WorkerReport:
+    latencies: List[float] = field(default_factory=list)
+    items: int = 0
+    timeouts: int = 0
+    puts: int = 0
+
+
+def _validate_config(config: LoadConfig, backend: str):
+    if backend not in LOAD_BACKENDS:
+        raise ValueError(f"backend must be one of {LOAD_BACKENDS}")
+    if not isinstance(config.consumers, int) or config.consumers < 1:
+        raise ValueError("consumers must be a positive integer")
+    if not isinstance(config.producers, int) or config.producers < 0:
+        raise ValueError("producers must be a non-negative integer")
+    if backend == "process" and config.producers:
+        raise ValueError("producers are only supported by the thread backend")
+    if config.duration_seconds <= 0:
+        raise ValueError("duration_seconds must be positive")
+    if config.rate is not None and config.rate <= 0:
+        raise ValueError("rate must be positive or None for closed-loop mode")
+    if config.producer_rate <= 0:
+        raise ValueError("producer_rate must be positive")
+    if not isinstance(config.batch_size, int) or config.batch_size < 1:
+        raise ValueError("batch_size must be a positive integer")
+    if config.timeout < 0:
+        raise ValueError("timeout must be non-negative")
+    if config.sample_interval <= 0:
+        raise ValueError("sample_interval must be positive")
+
+
+def _consume(
+    resolve: Callable,
+    config: LoadConfig,
+    interval: Optional[float],
+    start: float,
+    deadline: float,
+) -> _WorkerReport:
+    report = _WorkerReport()
+    latencies = report.latencies
+    batch_size = config.batch_size
+    timeout = config.timeout
+    clock = time.perf_counter
+    scheduled = start
+    while True:
+        now = clock()
+        if now >= deadline:
+            break
+        if interval is not None:
+            if scheduled > now:
+                time.sleep(scheduled - now)
+            issued = scheduled
+            scheduled += interval
+        else:
+            issued = now
+        pool = resolve()
+        if batch_size == 1:
+            taken = 0 if pool.get(timeout=timeout) is None else 1
+        else:
+            taken = len(pool.get_batch(batch_size, timeout=timeout))
+        latencies.append(clock() - issued)
+        report.items += taken
+        if taken < batch_size:
+            report.timeouts += 1
+    return report
+
+
+def _produce(resolve: Callable, config: LoadConfig, deadline: float) -> _WorkerReport:
+    report = _WorkerReport()
+    interval = 1.0 / config.producer_rate
+    scheduled = time.perf_counter()
+    while True:
+        now = time.perf_counter()
+        if now >= deadline:
+            break
+        if scheduled > now:
+            time.sleep(scheduled - now)
+        scheduled += interval
+        if resolve().put(uuid.uuid4()):
+            report.puts += 1
+    return report
+
+
+def _process_consumer(
+    name: str, pool_config: PoolConfig, config: LoadConfig, interval: Optional[float]
+) -> Tuple[_WorkerReport, float, float]:
+    pool = SharedUUIDPool(name, pool_config, claim_size=config.claim_size)
+    try:
+        start = time.perf_counter()
+        wall_start = time.time()
+        report = _consume(lambda: pool, config, interval, start, start + config.duration_seconds)
+        return report, wall_start, time.time()
+    finally:
+        pool.shutdown()
+
+
+def _low_water(pool) -> int:
+    return int(pool.config.max_size * pool.config.refill_threshold)
+
+
+def _refill_lags(samples: List[LoadSample]) -> List[float]:
+    lags = []
+    starved_at = None
+    for sample in samples:
+        if sample.deficit > 0:
+            if starved_at is None:
+                starved_at = sample.elapsed
+        elif starved_at is not None:
+            lags.append(sample.elapsed - starved_at)
+            starved_at = None
+    if starved_at is not None and samples:
+        lags.append(samples[-1].elapsed - starved_at)
+    return lags
+
+
+def _latency_histogram(latencies: List[float]) -> Dict[int, int]:
+    histogram: Dict[int, int] = {}
+    for latency in latencies:
+        bucket = 1 << int(latency * 1000000).bit_length()
+        histogram[bucket] = histogram.get(bucket, 0) + 1
+    return dict(sorted(histogram.items()))
+
+
+class PoolLoadGenerator:
+    def __init__(self, config: Optional[LoadConfig] = None):
+        self.config = config or LoadConfig()
+        _validate_config(self.config, "thread")
+
+    def _interval(self, consumers: int) -> Optional[float]:
+        if self.config.rate is None:
+            return None
+        return consumers / self.config.rate
+
+    def _sampler(
+        self, pools: Dict[str, object], samples: Dict[str, List[LoadSample]], stop: threading.Event
+    ) -> threading.Thread:
+        started = time.perf_counter()
+
+        def sample():
+            while True:
+                elapsed = time.perf_counter() - started
+                for name, pool in pools.items():
+                    stats = pool.get_stats()
+                    samples[name].append(
+                        LoadSample(
+                            elapsed=elapsed,
+                            current_size=stats.current_size,
+                            deficit=max(0, _low_water(pool) - stats.current_size),
+                            refill_count=stats.refill_count,
+                            cache_misses=stats.cache_misses,
+                            total_consumed=stats.total_consumed,
+                        )
+                    )
+                if stop.wait(self.config.sample_interval):
+                    break
+
+        thread = threading.Thread(target=sample, daemon=True)
+        thread.start()
+        return thread
+
+    def _build_result(
+        self,
+        name: str,
+        backend: str,
+        pool,
+        baseline: PoolStats,
+        reports: List[_WorkerReport],
+        producers: int,
+        elapsed: float,
+        samples: List[LoadSample],
+    ) -> LoadResult:
+        latencies = sorted(latency for report in reports for latency in report.latencies)
+        stats = pool.get_stats()
+        hits = stats.cache_hits - baseline.cache_hits
+        misses = stats.cache_misses - baseline.cache_misses
+        items = sum(report.items for report in reports)
+        lags = _refill_lags(samples)
+        starved = sum(1 for sample in samples if sample.deficit > 0)
+        return LoadResult(
+            name=name,
+            backend=backend,
+            mode=self.config.mode,
+            consumers=len(reports) - producers,
+            producers=producers,
+            duration_seconds=elapsed,
+            gets=len(latencies),
+            items=items,
+            timeouts=sum(report.timeouts for report in reports),
+            puts=sum(report.puts for report in reports),
+            throughput=items / elapsed if elapsed > 0 else 0.0,
+            latency_p50=percentile(latencies, 0.50) * 1000000 if latencies else 0.0,
+            latency_p95=percentile(latencies, 0.95) * 1000000 if latencies else 0.0,
+            latency_p99=percentile(latencies, 0.99) * 1000000 if latencies else 0.0,
+            latency_max=latencies[-1] * 1000000 if latencies else 0.0,
+            latency_histogram=_latency_histogram(latencies),
+            hit_rate=hits / (hits + misses) if hits + misses > 0 else 0.0,
+            stats=stats,
+            refill_lag_max=max(lags, default=0.0),
+            refill_lag_mean=sum(lags) / len(lags) if lags else 0.0,
+            starved_fraction=starved / len(samples) if samples else 0.0,
+            samples=samples,
+        )
+
+    def _run_threads(
+        self, pools: Dict[str, object], resolvers: Dict[str, Callable]
+    ) -> Dict[str, LoadResult]:
+        names = list(pools)
+        consumers = self.config.consumers
+        assignments = [names[i % len(names)] for i in range(consumers)]
+        producer_assignments = [names[i % len(names)] for i in range(self.config.producers)]
+        baselines = {name: pool.get_stats() for name, pool in pools.items()}
+        reports: Dict[str, List[_WorkerReport]] = {name: [] for name in names}
+        samples: Dict[str, List[LoadSample]] = {name: [] for name in names}
+        interval = self._interval(consumers)
+        barrier = threading.Barrier(consumers + len(producer_assignments) + 1)
+        window: Dict[str, float] = {}
+
+        def consumer(name: str):
+            barrier.wait()
+            reports[name].append(
+                _consume(resolvers[name], self.config, interval, window["start"], window["end"])
+            )
+
+        def producer(name: str):
+            barrier.wait()
+            reports[name].append(_produce(resolvers[name], self.config, window["end"]))
+
+        workers = [threading.Thread(target=consumer, args=(name,)) for name in assignments]
+        workers += [threading.Thread(target=producer, args=(name,)) for name in producer_assignments]
+        for worker in workers:
+            worker.start()
+        stop = threading.Event()
+        sampler = self._sampler(pools, samples, stop)
+        window["start"] = time.perf_counter()
+        window["end"] = window["start"] + self.config.duration_seconds
+        barrier.wait()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - window["start"]
+        stop.set()
+        sampler.join()
+
+        return {
+            name: self._build_result(
+                name,
+                "thread",
+                pools[name],
+                baselines[name],
+                reports[name],
+                producer_assignments.count(name),
+                elapsed,
+                samples[name],
+            )
+            for name in names
+        }
+
+    def run(self, pool: UUIDPool, name: str = "pool") -> LoadResult:
+        return self._run_threads({name: pool}, {name: lambda: pool})[name]
+
+    def run_manager(
+        self,
+        manager: UUIDPoolManager,
+        names: List[str],
+        pool_config: Optional[PoolConfig] = None,
+    ) -> Dict[str, LoadResult]:
+        if not names:
+            raise ValueError("names must not be empty")
+        pools = {name: manager.get_pool(name, pool_config) for name in names}
+        resolvers = {name: (lambda name=name: manager.get_pool(name)) for name in names}
+        return self._run_threads(pools, resolvers)
+
+    def run_processes(
+        self, pool_config: Optional[PoolConfig] = None, name: Optional[str] = None
+    ) -> LoadResult:
+        _validate_config(self.config, "process")
+        pool_config = pool_config or PoolConfig()
+        name = name or f"uuid_load_{os.getpid()}_{time.monotonic_ns()}"
+        pool = SharedUUIDPool(name, pool_config, create=True)
+        samples: Dict[str, List[LoadSample]] = {name: []}
+        try:
+            baseline = pool.get_stats()
+            interval = self._interval(self.config.consumers)
+            with ProcessPoolExecutor(max_workers=self.config.consumers) as executor:
+                stop = threading.Event()
+                sampler = self._sampler({name: pool}, samples, stop)
+                futures = [
+                    executor.submit(_process_consumer, name, pool_config, self.config, interval)
+                    for _ in range(self.config.consumers)
+                ]
+                outcomes = [future.result() for future in futures]
+                stop.set()
+                sampler.join()
+            reports = [report for report, _, _ in outcomes]
+            elapsed = max(end for _, _, end in outcomes) - min(start for _, start, _ in outcomes)
+            return self._build_result(
+                name, "process", pool, baseline, reports, 0, elapsed, samples[name]
+            )
+        finally:
+            pool.shutdown()
+
+
+def format_result(result: LoadResult) -> str:
+    lines = [
+        f"{result.name} [{result.backend}, {result.mode}-loop, {result.consumers} consumers, "
+        f"{result.producers} producers]",
+        f"  throughput: {result.throughput:,.0f} UUIDs/s over {result.duration_seconds:.2f}s "
+        f"({result.gets} gets, {result.timeouts} timeouts, {result.puts} puts)",
+        f"  get latency: p50 {result.latency_p50:.1f} μs, p95 {result.latency_p95:.1f} μs, "
+        f"p99 {result.latency_p99:.1f} μs, max {result.latency_max:.1f} μs",
+        f"  hit rate: {result.hit_rate:.2%}, refills: {result.stats.refill_count}",
+        f"  refill lag: max {result.refill_lag_max * 1000:.1f} ms, "
+        f"mean {result.refill_lag_mean * 1000:.1f} ms, "
+        f"below low water {result.starved_fraction:.1%} of samples",
+        "  latency histogram:",
+    ]
+    total = sum(result.latency_histogram.values()) or 1
+    for bucket, count in result.latency_histogram.items():
+        lines.append(f"    <= {bucket:>8} μs: {count:>9} ({count / total:.1%})")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="UUID pool load generator")
+    parser.add_argument("--backend", choices=LOAD_BACKENDS, default="thread")
+    parser.add_argument("--consumers", type=int, default=4)
+    parser.add_argument("--producers", type=int, default=0)
+    parser.add_argument("--duration", type=float, default=2.0)
+    parser.add_argument("--rate", type=float, default=None, help="total gets/s; omit for closed loop")
+    parser.add_argument("--producer-rate", type=float, default=1000.0)
+    parser.add_argument("--batch-size", type=int, default=1)
+    parser.add_argument("--timeout", type=float, default=0.1)
+    parser.add_argument("--pools", type=int, default=1, help="named pools served by a UUIDPoolManager")
+    parser.add_argument("--storage", choices=STORAGE_MODES, default="queue")
+    parser.add_argument("--min-size", type=int, default=1000)
+    parser.add_argument("--max-size", type=int, default=10000)
+    parser.add_argument("--refill-batch-size", type=int, default=500)
+    parser.add_argument("--adaptive-refill", action="store_true")
+    parser.add_argument("--thread-cache-size", type=int, default=0)
+    parser.add_argument("--series", action="store_true", help="print the sampled pool level series")
+    args = parser.parse_args(argv)
+
+    pool_config = PoolConfig(
+        min_size=args.min_size,
+        max_size=args.max_size,
+        refill_batch_size=args.refill_batch_size,
+        storage=args.storage,
+        adaptive_refill=args.adaptive_refill,
+        thread_cache_size=args.thread_cache_size,
+    )
+    config = LoadConfig(
+        consumers=args.consumers,
+        producers=args.producers,
+        duration_seconds=args.duration,
+        rate=args.rate,
+        producer_rate=args.producer_rate,
+        batch_size=args.batch_size,
+        timeout=args.timeout,
+    )
+    generator = PoolLoadGenerator(config)
+    if args.backend == "process":
+        results = [generator.run_processes(pool_config)]
+    else:
+        manager = UUIDPoolManager()
+        names = [f"pool-{index}" for index in range(args.pools)]
+        try:
+            results = list(generator.run_manager(manager, names, pool_config).values())
+        finally:
+            for name in names:
+                manager.remove_pool(name)
+
+    for result in results:
+        print(format_result(result))
+        if args.series:
+            for sample in result.samples:
+                print(
+                    f"    t={sample.elapsed:6.2f}s size={sample.current_size:>7} "
+                    f"deficit={sample.deficit:>7} refills={sample.refill_count:>5} "
+                    f"misses={sample.cache_misses}"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
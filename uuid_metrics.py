@@ -0,0 +1,546 @@
+import inspect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+EXPORT_FORMATS = ("prometheus", "json")
+SUMMARY_QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class ShardedCounter:
+    def __init__(self):
+        self._local = threading.local()
+        self._cells: List[List[int]] = []
+        self._lock = threading.Lock()
+
+    def _cell(self) -> List[int]:
+        cell = [0]
+        with self._lock:
+            self._cells.append(cell)
+        self._local.cell = cell
+        return cell
+
+    def inc(self, amount: int = 1):
+        try:
+            self._local.cell[0] += amount
+        except AttributeError:
+            self._cell()[0] += amount
+
+    @property
+    def value(self) -> int:
+        with self._lock:
+            return sum(cell[0] for cell in self._cells)
+
+
+class _HistogramShard:
+    __slots__ = ("counts", "total", "max")
+
+    def __init__(self, size: int):
+        self.counts = [0] * size
+        self.total = 0
+        self.max = 0
+
+
+@dataclass
+class HistogramSnapshot:
+    precision_bits: int
+    count: int = 0
+    total_ns: int = 0
+    max_ns: int = 0
+    buckets: Dict[int, int] = field(default_factory=dict)
+
+    @property
+    def sum_seconds(self) -> float:
+        return self.total_ns / 1e9
+
+    @property
+    def max_seconds(self) -> float:
+        return self.max_ns / 1e9
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_ns / self.count / 1e9 if self.count else 0.0
+
+    def bucket_bounds(self, index: int) -> Tuple[int, int]:
+        linear = 1 << self.precision_bits
+        if index < linear:
+            return index, index
+        half = linear >> 1
+        offset = index - linear
+        shift = offset // half + 1
+        top = offset % half + half
+        return top << shift, ((top + 1) << shift) - 1
+
+    def percentile(self, fraction: float) -> float:
+        if not 0 <= fraction <= 1:
+            raise ValueError("fraction must be between 0 and 1")
+        if not self.count:
+            return 0.0
+        target = max(1, int(fraction * self.count + 0.5))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= target:
+                low, high = self.bucket_bounds(index)
+                return min(self.max_ns, (low + high) // 2) / 1e9
+        return self.max_seconds
+
+    def merge(self, other: "HistogramSnapshot") -> "HistogramSnapshot":
+        if other.precision_bits != self.precision_bits:
+            raise ValueError("cannot merge histograms with different precision")
+        self.count += other.count
+        self.total_ns += other.total_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        return self
+
+
+class LatencyHistogram:
+    def __init__(self, precision_bits: int = 7):
+        if not isinstance(precision_bits, int) or not 2 <= precision_bits <= 16:
+            raise ValueError("precision_bits must be an integer between 2 and 16")
+        self.precision_bits = precision_bits
+        self._linear = 1 << precision_bits
+        self._half_bits = precision_bits - 1
+        self._size = (66 - precision_bits) << self._half_bits
+        self._local = threading.local()
+        self._shards: List[_HistogramShard] = []
+        self._lock = threading.Lock()
+
+    def _shard(self) -> _HistogramShard:
+        shard = _HistogramShard(self._size)
+        with self._lock:
+            self._shards.append(shard)
+        self._local.shard = shard
+        return shard
+
+    def record_ns(self, value: int):
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._shard()
+        if value < self._linear:
+            shard.counts[max(0, value)] += 1
+        else:
+            shift = value.bit_length() - self.precision_bits
+            shard.counts[(shift << self._half_bits) + (value >> shift)] += 1
+        shard.total += value
+        if value > shard.max:
+            shard.max = value
+
+    def record(self, seconds: float):
+        self.record_ns(int(seconds * 1e9))
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record_ns(time.perf_counter_ns() - start)
+
+    def snapshot(self) -> HistogramSnapshot:
+        snapshot = HistogramSnapshot(self.precision_bits)
+        with self._lock:
+            shards = list(self._shards)
+        for shard in shards:
+            counts = list(shard.counts)
+            snapshot.merge(
+                HistogramSnapshot(
+                    self.precision_bits,
+                    sum(counts),
+                    shard.total,
+                    shard.max,
+                    {index: count for index, count in enumerate(counts) if count},
+                )
+            )
+        return snapshot
+
+
+class _NullCounter:
+    value = 0
+
+    def inc(self, amount: int = 1):
+        pass
+
+
+class _NullHistogram:
+    precision_bits = 0
+
+    def record_ns(self, value: int):
+        pass
+
+    def record(self, seconds: float):
+        pass
+
+    def time(self):
+        return _NULL_CONTEXT
+
+    def snapshot(self) -> HistogramSnapshot:
+        return HistogramSnapshot(self.precision_bits)
+
+
+_NULL_CONTEXT = nullcontext()
+_NULL_COUNTER = _NullCounter()
+_NULL_HISTOGRAM = _NullHistogram()
+
+
+def _label_key(labels: Optional[Dict[str, str]]) -> LabelKey:
+    return tuple(sorted((str(name), str(value)) for name, value in (labels or {}).items()))
+
+
+class MetricsRegistry:
+    enabled = True
+
+    def __init__(self, precision_bits: int = 7):
+        self.precision_bits = precision_bits
+        self._families: Dict[str, Tuple[str, str]] = {}
+        self._metrics: Dict[Tuple[str, LabelKey], object] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, kind: str, name: str, labels: Optional[Dict[str, str]], help_text: str, factory):
+        key = (name, _label_key(labels))
+        metric = self._metrics.get(key)
+        if metric is not None:
+            return metric
+        with self._lock:
+            family = self._families.setdefault(name, (kind, help_text))
+            if family[0] != kind:
+                raise ValueError(f"metric {name!r} is already registered as a {family[0]}")
+            if key not in self._metrics:
+                self._metrics[key] = factory()
+            return self._metrics[key]
+
+    def counter(
+        self, name: str, labels: Optional[Dict[str, str]] = None, help_text: str = ""
+    ) -> ShardedCounter:
+        return self._get("counter", name, labels, help_text, ShardedCounter)
+
+    def histogram(
+        self, name: str, labels: Optional[Dict[str, str]] = None, help_text: str = ""
+    ) -> LatencyHistogram:
+        return self._get(
+            "summary", name, labels, help_text, lambda: LatencyHistogram(self.precision_bits)
+        )
+
+    def collect(self) -> List[Tuple[str, str, str, LabelKey, object]]:
+        with self._lock:
+            items = list(self._metrics.items())
+            families = dict(self._families)
+        collected = []
+        for (name, labels), metric in sorted(items, key=lambda item: item[0]):
+            kind, help_text = families[name]
+            value = metric.value if kind == "counter" else metric.snapshot()
+            collected.append((name, kind, help_text, labels, value))
+        return collected
+
+    def clear(self):
+        with self._lock:
+            self._families.clear()
+            self._metrics.clear()
+
+
+class NullRegistry(MetricsRegistry):
+    enabled = False
+
+    def counter(
+        self, name: str, labels: Optional[Dict[str, str]] = None, help_text: str = ""
+    ) -> ShardedCounter:
+        return _NULL_COUNTER
+
+    def histogram(
+        self, name: str, labels: Optional[Dict[str, str]] = None, help_text: str = ""
+    ) -> LatencyHistogram:
+        return _NULL_HISTOGRAM
+
+
+NULL_REGISTRY = NullRegistry()
+_registry: MetricsRegistry = NULL_REGISTRY
+
+
+def get_registry() -> MetricsRegistry:
+    return _registry
+
+
+def set_registry(registry: Optional[MetricsRegistry]) -> MetricsRegistry:
+    global _registry
+    previous = _registry
+    _registry = registry or NULL_REGISTRY
+    return previous
+
+
+def _timed(
+    method: Callable,
+    active: threading.local,
+    histogram: LatencyHistogram,
+    calls: ShardedCounter,
+    empty: ShardedCounter,
+    errors: ShardedCounter,
+) -> Callable:
+    clock = time.perf_counter_ns
+    record = histogram.record_ns
+    count = calls.inc
+
+    def timed(*args, **kwargs):
+        if getattr(active, "depth", 0):
+            return method(*args, **kwargs)
+        active.depth = 1
+        start = clock()
+        try:
+            result = method(*args, **kwargs)
+        except BaseException:
+            errors.inc()
+            raise
+        finally:
+            record(clock() - start)
+            count()
+            active.depth = 0
+        if result is None or (isinstance(result, (bytes, list)) and not result):
+            empty.inc()
+        return result
+
+    return timed
+
+
+def _timed_iteration(
+    method: Callable,
+    active: threading.local,
+    histogram: LatencyHistogram,
+    calls: ShardedCounter,
+    empty: ShardedCounter,
+    errors: ShardedCounter,
+) -> Callable:
+    clock = time.perf_counter_ns
+
+    def timed(*args, **kwargs):
+        if getattr(active, "depth", 0):
+            yield from method(*args, **kwargs)
+            return
+        iterator = method(*args, **kwargs)
+        elapsed = 0
+        produced = 0
+        try:
+            while True:
+                active.depth = 1
+                start = clock()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    break
+                finally:
+                    elapsed += clock() - start
+                    active.depth = 0
+                produced += 1
+                yield item
+        except GeneratorExit:
+            iterator.close()
+            raise
+        except BaseException:
+            errors.inc()
+            raise
+        finally:
+            histogram.record_ns(elapsed)
+            calls.inc()
+            if not produced:
+                empty.inc()
+
+    return timed
+
+
+def instrument_methods(
+    target,
+    registry: Optional[MetricsRegistry],
+    subsystem: str,
+    operations: Tuple[str, ...],
+    **labels: str,
+):
+    for operation in target.__dict__.get("_instrumented_operations", ()):
+        target.__dict__.pop(operation, None)
+    target._instrumented_operations = ()
+    registry = registry or get_registry()
+    if not registry.enabled:
+        return
+    prefix = f"uuid_{subsystem}"
+    active = threading.local()
+    for operation in operations:
+        method = getattr(target, operation)
+        wrap = _timed_iteration if inspect.isgeneratorfunction(method) else _timed
+        labels_for = dict(labels, operation=operation.lstrip("_"))
+        target.__dict__[operation] = wrap(
+            method,
+            active,
+            registry.histogram(f"{prefix}_operation_seconds", labels_for, "Operation latency"),
+            registry.counter(f"{prefix}_calls_total", labels_for, "Operation calls"),
+            registry.counter(f"{prefix}_empty_total", labels_for, "Calls that returned nothing"),
+            registry.counter(f"{prefix}_errors_total", labels_for, "Calls that raised"),
+        )
+    target._instrumented_operations = operations
+
+
+def uninstrumented_state(target) -> Dict:
+    state = dict(target.__dict__)
+    for operation in state.pop("_instrumented_operations", ()):
+        state.pop(operation, None)
+    return state
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: LabelKey, extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+    pairs = labels + extra
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def render_prometheus(registry: MetricsRegistry) -> str:
+    lines = []
+    declared = set()
+    for name, kind, help_text, labels, value in registry.collect():
+        if name not in declared:
+            declared.add(name)
+            if help_text:
+                lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+        if kind == "counter":
+            lines.append(f"{name}{_format_labels(labels)} {value}")
+            continue
+        for quantile in SUMMARY_QUANTILES:
+            lines.append(
+                f"{name}{_format_labels(labels, (('quantile', str(quantile)),))} "
+                f"{value.percentile(quantile):.9g}"
+            )
+        lines.append(f"{name}_sum{_format_labels(labels)} {value.sum_seconds:.9g}")
+        lines.append(f"{name}_count{_format_labels(labels)} {value.count}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def render_json(registry: MetricsRegistry) -> str:
+    counters = []
+    histograms = []
+    for name, kind, _, labels, value in registry.collect():
+        if kind == "counter":
+            counters.append({"name": name, "labels": dict(labels), "value": value})
+            continue
+        entry = {
+            "name": name,
+            "labels": dict(labels),
+            "count": value.count,
+            "sum_seconds": value.sum_seconds,
+            "mean_seconds": value.mean_seconds,
+            "max_seconds": value.max_seconds,
+        }
+        for quantile in SUMMARY_QUANTILES:
+            entry[f"p{quantile * 100:g}"] = value.percentile(quantile)
+        histograms.append(entry)
+    return json.dumps(
+        {"timestamp": time.time(), "counters": counters, "histograms": histograms}, indent=2
+    )
+
+
+class MetricsExporter:
+    def __init__(
+        self, registry: Optional[MetricsRegistry] = None, export_format: str = "prometheus"
+    ):
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"export_format must be one of {EXPORT_FORMATS}")
+        self.registry = registry or get_registry()
+        self.export_format = export_format
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._writer: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def render(self, export_format: Optional[str] = None) -> str:
+        if (export_format or self.export_format) == "json":
+            return render_json(self.registry)
+        return render_prometheus(self.registry)
+
+    def write(self, filepath: str):
+        temporary = f"{filepath}.tmp"
+        with open(temporary, "w") as handle:
+            handle.write(self.render())
+        os.replace(temporary, filepath)
+
+    def start_file_writer(self, filepath: str, interval: float = 10.0):
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        if self._writer is not None:
+            raise RuntimeError("file writer is already running")
+        self._stop.clear()
+
+        def write_loop():
+            while not self._stop.wait(interval):
+                self.write(filepath)
+            self.write(filepath)
+
+        self._writer = threading.Thread(target=write_loop, daemon=True)
+        self._writer.start()
+
+    def serve(self, host: str = "127.0.0.1", port: int = 9464) -> Tuple[str, int]:
+        if self._server is not None:
+            raise RuntimeError("HTTP endpoint is already running")
+        exporter = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split("?", 1)[0]
+                if path == "/metrics":
+                    body = exporter.render("prometheus")
+                    content_type = "text/plain; version=0.0.4; charset=utf-8"
+                elif path == "/metrics.json":
+                    body = exporter.render("json")
+                    content_type = "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                encoded = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(encoded)))
+                self.end_headers()
+                self.wfile.write(encoded)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), MetricsHandler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self._server.server_address[:2]
+
+    def stop(self):
+        if self._writer is not None:
+            self._stop.set()
+            self._writer.join()
+            self._writer = None
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+if __name__ == "__main__":
+    from uuid_pool import PoolConfig, UUIDPool
+
+    registry = MetricsRegistry()
+    pool = UUIDPool(PoolConfig(min_size=5000, max_size=5000), metrics=registry)
+    for _ in range(4000):
+        pool.get(timeout=0.1)
+    pool.get_batch(100, timeout=0.1)
+    pool.shutdown()
+
+    exporter = MetricsExporter(registry)
+    print(exporter.render())
+    host, port = exporter.serve(port=0)
+    print(f"Serving metrics on http://{host}:{port}/metrics")
+    exporter.stop()
@@ -1,8 +1,54 @@
+import argparse
+import mmap
+import os
+import struct
+import sys
 import uuid
-from typing import Optional, Dict, List, Tuple, Callable
+from array import array
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Optional, Dict, Iterable, Iterator, List, Tuple, Callable, Union
 from enum import Enum
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+
+from uuid_array import UUIDArray
+from uuid_metrics import MetricsRegistry, instrument_methods
+from uuid_utils import NamespaceHasher, UUIDv6Generator, UUIDv7Generator, uuid7_from_entropy
+
+PARALLEL_MIGRATIONS = ("v4_to_v5", "v5_to_v3")
+MIGRATOR_OPERATIONS = (
+    "migrate_v4_to_v5",
+    "migrate_v4_to_v7",
+    "migrate_v5_to_v3",
+    "preserve_identity_migration",
+    "migrate_custom",
+    "batch_migrate",
+    "batch_migrate_parallel",
+    "batch_migrate_parallel_packed",
+    "batch_migrate_array",
+    "rollback_migration",
+)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+_MAX_TYPE_NAME_BYTES = 32
+
+
+def _epoch_micros(moment: datetime) -> int:
+    return (moment.astimezone(timezone.utc) - _EPOCH) // _MICROSECOND
+
+
+def _from_epoch_micros(micros: int) -> datetime:
+    return (_EPOCH + timedelta(microseconds=micros)).astimezone().replace(tzinfo=None)
+
+
+def _check_type_name(migration_type: str) -> bytes:
+    encoded = migration_type.encode("utf-8")
+    if len(encoded) > _MAX_TYPE_NAME_BYTES:
+        raise ValueError("migration type names longer than 32 bytes cannot be journaled")
+    return encoded
 
 
 class UUIDVersion(Enum):
@@ -10,6 +56,8 @@ class UUIDVersion(Enum):
     V3 = 3
     V4 = 4
     V5 = 5
+    V6 = 6
+    V7 = 7
 
 
 @dataclass
@@ -22,18 +70,474 @@ class MigrationResult:
     metadata: Optional[Dict] = None
 
 
+class MigrationJournal:
+    MAGIC = b"UUIDJRNL"
+    VERSION = 1
+    HEADER = struct.Struct("<8sII")
+    RECORD = struct.Struct("<16s16sHB5xq")
+    FLAG_SUCCESS = 1
+    FLAG_TYPE_DEFINITION = 2
+    FLAG_ROLLBACK = 4
+
+    def __init__(self, path: str, commit_every: int = 65536):
+        if not isinstance(commit_every, int) or commit_every < 1:
+            raise ValueError("commit_every must be a positive integer")
+        self.path = path
+        self.commit_every = commit_every
+        self.type_names: List[str] = []
+        self._type_codes: Dict[str, int] = {}
+        self._buffer = bytearray()
+        self._pending = 0
+        exists = os.path.exists(path) and os.path.getsize(path) >= self.HEADER.size
+        self._file = open(path, "r+b" if exists else "w+b")
+        if exists:
+            magic, version, record_size = self.HEADER.unpack(self._file.read(self.HEADER.size))
+            if magic != self.MAGIC or version != self.VERSION or record_size != self.RECORD.size:
+                self._file.close()
+                raise ValueError(f"{path} is not a compatible migration journal")
+            self._file.truncate(self.HEADER.size + self.committed_records * self.RECORD.size)
+            for _ in self._scan(0):
+                pass
+        else:
+            self._file.write(self.HEADER.pack(self.MAGIC, self.VERSION, self.RECORD.size))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self._file.seek(0, os.SEEK_END)
+
+    @property
+    def committed_records(self) -> int:
+        size = os.fstat(self._file.fileno()).st_size
+        return max(0, size - self.HEADER.size) // self.RECORD.size
+
+    def _type_code(self, migration_type: str) -> int:
+        code = self._type_codes.get(migration_type)
+        if code is None:
+            encoded = _check_type_name(migration_type)
+            code = len(self.type_names)
+            self.type_names.append(migration_type)
+            self._type_codes[migration_type] = code
+            padded = encoded.ljust(_MAX_TYPE_NAME_BYTES, b"\x00")
+            self._write(padded[:16], padded[16:], code, self.FLAG_TYPE_DEFINITION, 0)
+        return code
+
+    def _write(self, source: bytes, target: bytes, code: int, flags: int, timestamp: int):
+        self._buffer += self.RECORD.pack(source, target, code, flags, timestamp)
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self.commit()
+
+    def append(self, result: MigrationResult, rollback: bool = False):
+        flags = (self.FLAG_SUCCESS if result.success else 0) | (
+            self.FLAG_ROLLBACK if rollback else 0
+        )
+        self._write(
+            result.source_uuid.bytes,
+            result.target_uuid.bytes,
+            self._type_code(result.migration_type),
+            flags,
+            _epoch_micros(result.timestamp),
+        )
+
+    def append_many(
+        self,
+        sources: bytes,
+        targets: bytes,
+        migration_type: str,
+        success: bool = True,
+        timestamp: Optional[datetime] = None,
+    ) -> int:
+        if len(sources) != len(targets) or len(sources) % 16:
+            raise ValueError("sources and targets must be equal-length packed 16-byte records")
+        count = len(sources) // 16
+        trailer = self.RECORD.pack(
+            b"",
+            b"",
+            self._type_code(migration_type),
+            self.FLAG_SUCCESS if success else 0,
+            _epoch_micros(timestamp or datetime.now()),
+        )[32:]
+        size = self.RECORD.size
+        records = bytearray(count * size)
+        for i in range(16):
+            records[i::size] = sources[i::16]
+            records[16 + i :: size] = targets[i::16]
+            records[32 + i :: size] = trailer[i : i + 1] * count
+        self._buffer += records
+        self._pending += count
+        if self._pending >= self.commit_every:
+            self.commit()
+        return count
+
+    def commit(self):
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer = bytearray()
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = 0
+
+    def close(self):
+        if not self._file.closed:
+            self.commit()
+            self._file.close()
+
+    def _scan(self, start_record: int) -> Iterator[Tuple[bytes, bytes, int, int, int]]:
+        if not isinstance(start_record, int) or start_record < 0:
+            raise ValueError("start_record must be a non-negative integer")
+        committed = self.committed_records
+        if committed <= start_record:
+            return
+        with mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                start = self.HEADER.size + start_record * self.RECORD.size
+                end = self.HEADER.size + committed * self.RECORD.size
+                for record in self.RECORD.iter_unpack(view[start:end]):
+                    if record[3] & self.FLAG_TYPE_DEFINITION:
+                        name = (record[0] + record[1]).rstrip(b"\x00").decode("utf-8")
+                        if record[2] == len(self.type_names):
+                            self.type_names.append(name)
+                            self._type_codes[name] = record[2]
+                    else:
+                        yield record
+            finally:
+                view.release()
+
+    def replay(
+        self, start_record: int = 0
+    ) -> Iterator[Tuple[uuid.UUID, uuid.UUID, str, bool, bool, datetime]]:
+        for source, target, code, flags, timestamp in self._scan(start_record):
+            yield (
+                uuid.UUID(bytes=source),
+                uuid.UUID(bytes=target),
+                self.type_names[code],
+                bool(flags & self.FLAG_SUCCESS),
+                bool(flags & self.FLAG_ROLLBACK),
+                _from_epoch_micros(timestamp),
+            )
+
+    def build_rollback_map(self) -> Dict[bytes, bytes]:
+        reverse: Dict[bytes, bytes] = {}
+        for source, target, _, flags, _ in self._scan(0):
+            if flags & self.FLAG_ROLLBACK:
+                if reverse.get(target) == source:
+                    del reverse[target]
+            elif flags & self.FLAG_SUCCESS:
+                reverse[target] = source
+        return reverse
+
+
+class MigrationHistory:
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        spill_path: Optional[str] = None,
+        store_metadata: bool = True,
+        journal: Optional[MigrationJournal] = None,
+    ):
+        if max_entries is not None and (not isinstance(max_entries, int) or max_entries < 1):
+            raise ValueError("max_entries must be a positive integer")
+        self.max_entries = max_entries
+        self.spill_path = spill_path
+        self.store_metadata = store_metadata
+        self.journal = journal
+        self.type_names: List[str] = []
+        self._type_codes: Dict[str, int] = {}
+        self.clear()
+
+    def clear(self):
+        self.sources = bytearray()
+        self.targets = bytearray()
+        self.timestamps = array("q")
+        self.type_codes = array("H")
+        self.success_flags = bytearray()
+        self.live_flags = bytearray()
+        self.metadata: Dict[int, Dict] = {}
+        self._index: Dict[bytes, int] = {}
+        self._chains: Dict[bytes, List[int]] = {}
+        self._base = 0
+        self._live = 0
+        self.spilled_count = 0
+        self._successful = 0
+        self._by_type: Counter = Counter()
+
+    def _type_code(self, migration_type: str) -> int:
+        code = self._type_codes.get(migration_type)
+        if code is None:
+            code = len(self.type_names)
+            self.type_names.append(migration_type)
+            self._type_codes[migration_type] = code
+        return code
+
+    def __len__(self) -> int:
+        return self._live
+
+    def _link(self, source: bytes, row_id: int):
+        previous = self._index.get(source)
+        if previous is not None:
+            chain = self._chains.get(source)
+            if chain is None:
+                self._chains[source] = [previous, row_id]
+            else:
+                chain.append(row_id)
+        self._index[source] = row_id
+
+    def _unlink(self, source: bytes, row_id: int):
+        chain = self._chains.get(source)
+        if chain is None:
+            if self._index.get(source) == row_id:
+                del self._index[source]
+            return
+        if row_id in chain:
+            chain.remove(row_id)
+        self._index[source] = chain[-1]
+        if len(chain) == 1:
+            del self._chains[source]
+
+    def append(self, result: MigrationResult):
+        if self.journal is not None:
+            self.journal.append(result)
+        row_id = self._base + len(self.type_codes)
+        source = result.source_uuid.bytes
+        self.sources += source
+        self.targets += result.target_uuid.bytes
+        self.timestamps.append(_epoch_micros(result.timestamp))
+        self.type_codes.append(self._type_code(result.migration_type))
+        self.success_flags.append(1 if result.success else 0)
+        self.live_flags.append(1)
+        if self.store_metadata and result.metadata is not None:
+            self.metadata[row_id] = result.metadata
+        self._link(source, row_id)
+        self._live += 1
+        self._successful += 1 if result.success else 0
+        self._by_type[result.migration_type] += 1
+        if self.max_entries is not None and self._live > self.max_entries + self.max_entries // 4:
+            self._compact()
+            self._trim(len(self.type_codes) - self.max_entries)
+
+    def append_many(
+        self,
+        sources: bytes,
+        targets: bytes,
+        migration_type: str,
+        success: bool = True,
+        timestamp: Optional[datetime] = None,
+    ) -> int:
+        if len(sources) != len(targets) or len(sources) % 16:
+            raise ValueError("sources and targets must be equal-length packed 16-byte records")
+        count = len(sources) // 16
+        if not count:
+            return 0
+        timestamp = timestamp or datetime.now()
+        if self.journal is not None:
+            self.journal.append_many(sources, targets, migration_type, success, timestamp)
+        row_id = self._base + len(self.type_codes)
+        self.sources += sources
+        self.targets += targets
+        self.timestamps.extend([_epoch_micros(timestamp)] * count)
+        self.type_codes.extend([self._type_code(migration_type)] * count)
+        self.success_flags += (b"\x01" if success else b"\x00") * count
+        self.live_flags += b"\x01" * count
+        for offset in range(count):
+            self._link(bytes(sources[offset * 16 : offset * 16 + 16]), row_id + offset)
+        self._live += count
+        self._successful += count if success else 0
+        self._by_type[migration_type] += count
+        if self.max_entries is not None and self._live > self.max_entries + self.max_entries // 4:
+            self._compact()
+            self._trim(len(self.type_codes) - self.max_entries)
+        return count
+
+    def _row(self, row: int) -> MigrationResult:
+        offset = row * 16
+        return MigrationResult(
+            source_uuid=uuid.UUID(bytes=bytes(self.sources[offset : offset + 16])),
+            target_uuid=uuid.UUID(bytes=bytes(self.targets[offset : offset + 16])),
+            migration_type=self.type_names[self.type_codes[row]],
+            success=bool(self.success_flags[row]),
+            timestamp=_from_epoch_micros(self.timestamps[row]),
+            metadata=self.metadata.get(self._base + row),
+        )
+
+    def _matches(self, row: int, result: MigrationResult) -> bool:
+        if self.timestamps[row] != _epoch_micros(result.timestamp):
+            return False
+        candidate = self._row(row)
+        candidate.timestamp = result.timestamp
+        if not self.store_metadata:
+            candidate.metadata = result.metadata
+        return candidate == result
+
+    def _find(self, result: MigrationResult) -> Optional[int]:
+        source = result.source_uuid.bytes
+        chain = self._chains.get(source)
+        if chain is None:
+            row_id = self._index.get(source)
+            chain = () if row_id is None else (row_id,)
+        for row_id in reversed(chain):
+            row = row_id - self._base
+            if row >= 0 and self.live_flags[row] and self._matches(row, result):
+                return row
+        return None
+
+    def __contains__(self, result: MigrationResult) -> bool:
+        return self._find(result) is not None
+
+    def remove(self, result: MigrationResult):
+        row = self._find(result)
+        if row is None:
+            raise ValueError("migration result not in history")
+        if self.journal is not None:
+            self.journal.append(result, rollback=True)
+        self.live_flags[row] = 0
+        self._live -= 1
+        self._successful -= self.success_flags[row]
+        self._by_type[self.type_names[self.type_codes[row]]] -= 1
+        if not self._by_type[self.type_names[self.type_codes[row]]]:
+            del self._by_type[self.type_names[self.type_codes[row]]]
+        self.metadata.pop(self._base + row, None)
+        self._unlink(bytes(self.sources[row * 16 : row * 16 + 16]), self._base + row)
+        dead = len(self.type_codes) - self._live
+        if dead > 1024 and dead > self._live:
+            self._compact()
+
+    def _compact(self):
+        rows = [row for row in range(len(self.type_codes)) if self.live_flags[row]]
+        if len(rows) == len(self.type_codes):
+            return
+        base = self._base + len(self.type_codes)
+        sources, targets = bytearray(), bytearray()
+        metadata = {}
+        for position, row in enumerate(rows):
+            sources += self.sources[row * 16 : row * 16 + 16]
+            targets += self.targets[row * 16 : row * 16 + 16]
+            if self._base + row in self.metadata:
+                metadata[base + position] = self.metadata[self._base + row]
+        self.sources, self.targets = sources, targets
+        self.timestamps = array("q", (self.timestamps[row] for row in rows))
+        self.type_codes = array("H", (self.type_codes[row] for row in rows))
+        self.success_flags = bytearray(self.success_flags[row] for row in rows)
+        self.live_flags = bytearray(b"\x01" * len(rows))
+        self.metadata = metadata
+        self._base = base
+        self._index = {}
+        self._chains = {}
+        for position in range(len(rows)):
+            self._link(bytes(sources[position * 16 : position * 16 + 16]), base + position)
+
+    def __iter__(self) -> Iterator[MigrationResult]:
+        for row in range(len(self.type_codes)):
+            if self.live_flags[row]:
+                yield self._row(row)
+
+    def __getitem__(self, position: int) -> MigrationResult:
+        if position < 0:
+            position += self._live
+        if not 0 <= position < self._live:
+            raise IndexError("migration history index out of range")
+        if self._live == len(self.type_codes):
+            return self._row(position)
+        for row in range(len(self.type_codes)):
+            if self.live_flags[row]:
+                if not position:
+                    return self._row(row)
+                position -= 1
+        raise IndexError("migration history index out of range")
+
+    def _trim(self, count: int):
+        if self.spill_path:
+            with open(self.spill_path, "a") as spill:
+                for row in range(count):
+                    if self.live_flags[row]:
+                        result = self._row(row)
+                        spill.write(
+                            f"{result.source_uuid},{result.target_uuid},"
+                            f"{result.migration_type},{int(result.success)},"
+                            f"{result.timestamp.isoformat()}\n"
+                        )
+        for row in range(count):
+            if self.live_flags[row]:
+                self._unlink(bytes(self.sources[row * 16 : row * 16 + 16]), self._base + row)
+            self.metadata.pop(self._base + row, None)
+            if self.live_flags[row]:
+                self._live -= 1
+                self.spilled_count += 1
+        del self.sources[: count * 16]
+        del self.targets[: count * 16]
+        del self.timestamps[:count]
+        del self.type_codes[:count]
+        del self.success_flags[:count]
+        del self.live_flags[:count]
+        self._base += count
+
+    def get_statistics(self) -> Dict:
+        total = self._live + self.spilled_count
+        successful = self._successful
+        return {
+            "total": total,
+            "successful": successful,
+            "failed": total - successful,
+            "success_rate": successful / total if total > 0 else 0,
+            "by_type": dict(self._by_type),
+        }
+
+
+def _migrate_chunk(
+    migration_type: str, namespace: str, name: Optional[str], sources: bytes
+) -> bytes:
+    hasher = NamespaceHasher(
+        uuid.uuid5(uuid.NAMESPACE_DNS, namespace), 5 if migration_type == "v4_to_v5" else 3
+    )
+    count = len(sources) // 16
+    if name is not None:
+        return hasher.hash_bytes(name) * count
+    hex_str = sources.hex()
+    return hasher.hash_batch(
+        f"{hex_str[i:i + 8]}-{hex_str[i + 8:i + 12]}-{hex_str[i + 12:i + 16]}-"
+        f"{hex_str[i + 16:i + 20]}-{hex_str[i + 20:i + 32]}"
+        for i in range(0, len(hex_str), 32)
+    )
+
+
 class UUIDMigrator:
-    def __init__(self):
-        self.migration_history: List[MigrationResult] = []
-        self.namespace_cache: Dict[str, uuid.UUID] = {}
+    def __init__(
+        self,
+        history_limit: Optional[int] = None,
+        spill_path: Optional[str] = None,
+        store_metadata: bool = True,
+        journal_path: Optional[str] = None,
+        namespace_cache_size: int = 128,
+        metrics: Optional[MetricsRegistry] = None,
+    ):
+        if not isinstance(namespace_cache_size, int) or namespace_cache_size < 1:
+            raise ValueError("namespace_cache_size must be a positive integer")
+        self.journal = MigrationJournal(journal_path) if journal_path else None
+        self.migration_history = MigrationHistory(
+            history_limit, spill_path, store_metadata, self.journal
+        )
+        self.namespace_cache_size = namespace_cache_size
+        self.namespace_cache: OrderedDict[Tuple[str, int], NamespaceHasher] = OrderedDict()
         self.custom_migrations: Dict[str, Callable[[uuid.UUID], uuid.UUID]] = {}
+        self._time_ordered = {UUIDVersion.V6: UUIDv6Generator(), UUIDVersion.V7: UUIDv7Generator()}
+        self.instrument(metrics)
+
+    def instrument(self, metrics: Optional[MetricsRegistry] = None, **labels: str):
+        instrument_methods(self, metrics, "migrator", MIGRATOR_OPERATIONS, **labels)
+
+    def get_hasher(self, namespace_name: str, version: int = 5) -> NamespaceHasher:
+        key = (namespace_name, version)
+        hasher = self.namespace_cache.get(key)
+        if hasher is None:
+            hasher = NamespaceHasher(uuid.uuid5(uuid.NAMESPACE_DNS, namespace_name), version)
+            self.namespace_cache[key] = hasher
+            if len(self.namespace_cache) > self.namespace_cache_size:
+                self.namespace_cache.popitem(last=False)
+        else:
+            self.namespace_cache.move_to_end(key)
+        return hasher
 
     def get_namespace(self, namespace_name: str) -> uuid.UUID:
-        if namespace_name not in self.namespace_cache:
-            self.namespace_cache[namespace_name] = uuid.uuid5(
-                uuid.NAMESPACE_DNS, namespace_name
-            )
-        return self.namespace_cache[namespace_name]
+        return self.get_hasher(namespace_name).namespace
 
     def migrate_v4_to_v5(
         self, source_uuid: uuid.UUID, namespace: str, name: str
@@ -48,8 +552,7 @@ class UUIDMigrator:
                 metadata={"error": "namespace and name must be strings"},
             )
         try:
-            namespace_uuid = self.get_namespace(namespace)
-            target_uuid = uuid.uuid5(namespace_uuid, name)
+            target_uuid = self.get_hasher(namespace, 5).hash(name)
             result = MigrationResult(
                 source_uuid=source_uuid,
                 target_uuid=target_uuid,
@@ -70,6 +573,44 @@ class UUIDMigrator:
                 metadata={"error": str(e)},
             )
 
+    def migrate_v4_to_v7(
+        self, source_uuid: uuid.UUID, timestamp: Optional[datetime] = None
+    ) -> MigrationResult:
+        if not isinstance(source_uuid, uuid.UUID) or (
+            timestamp is not None and not isinstance(timestamp, datetime)
+        ):
+            return MigrationResult(
+                source_uuid=source_uuid,
+                target_uuid=source_uuid,
+                migration_type="v4_to_v7",
+                success=False,
+                timestamp=datetime.now(),
+                metadata={"error": "source_uuid must be a UUID and timestamp a datetime"},
+            )
+        try:
+            moment = timestamp or datetime.now()
+            timestamp_ms = int(moment.timestamp() * 1000)
+            target_uuid = uuid7_from_entropy(timestamp_ms, source_uuid.bytes[6:])
+            result = MigrationResult(
+                source_uuid=source_uuid,
+                target_uuid=target_uuid,
+                migration_type="v4_to_v7",
+                success=True,
+                timestamp=datetime.now(),
+                metadata={"timestamp_ms": timestamp_ms},
+            )
+            self.migration_history.append(result)
+            return result
+        except Exception as e:
+            return MigrationResult(
+                source_uuid=source_uuid,
+                target_uuid=source_uuid,
+                migration_type="v4_to_v7",
+                success=False,
+                timestamp=datetime.now(),
+                metadata={"error": str(e)},
+            )
+
     def migrate_v5_to_v3(
         self, source_uuid: uuid.UUID, namespace: str, name: str
     ) -> MigrationResult:
@@ -83,8 +624,7 @@ class UUIDMigrator:
                 metadata={"error": "namespace and name must be strings"},
             )
         try:
-            namespace_uuid = self.get_namespace(namespace)
-            target_uuid = uuid.uuid3(namespace_uuid, name)
+            target_uuid = self.get_hasher(namespace, 3).hash(name)
             result = MigrationResult(
                 source_uuid=source_uuid,
                 target_uuid=target_uuid,
@@ -108,25 +648,33 @@ class UUIDMigrator:
     def preserve_identity_migration(
         self, source_uuid: uuid.UUID, target_version: UUIDVersion
     ) -> Optional[MigrationResult]:
-        if target_version == UUIDVersion.V4:
-            new_uuid = uuid.uuid4()
+        if target_version in (UUIDVersion.V4, UUIDVersion.V6, UUIDVersion.V7):
+            if target_version == UUIDVersion.V4:
+                new_uuid = uuid.uuid4()
+            else:
+                new_uuid = self._time_ordered[target_version].generate()
             result = MigrationResult(
                 source_uuid=source_uuid,
                 target_uuid=new_uuid,
                 migration_type="identity_preserve",
                 success=True,
                 timestamp=datetime.now(),
-                metadata={"source_version": source_uuid.version, "target_version": 4},
+                metadata={
+                    "source_version": source_uuid.version,
+                    "target_version": target_version.value,
+                },
             )
             self.migration_history.append(result)
             return result
         return None
 
     def batch_migrate(
-        self, uuids: List[uuid.UUID], migration_func: Callable, *args, **kwargs
+        self, uuids: Union[List[uuid.UUID], UUIDArray], migration_func: Callable, *args, **kwargs
     ) -> List[MigrationResult]:
-        if not isinstance(uuids, list) or not all(isinstance(u, uuid.UUID) for u in uuids):
-            raise ValueError("uuids must be a list of UUID objects")
+        if not isinstance(uuids, UUIDArray) and (
+            not isinstance(uuids, list) or not all(isinstance(u, uuid.UUID) for u in uuids)
+        ):
+            raise ValueError("uuids must be a list of UUID objects or a UUIDArray")
         if not callable(migration_func):
             raise ValueError("migration_func must be callable")
         results = []
@@ -135,20 +683,141 @@ class UUIDMigrator:
             results.append(result)
         return results
 
+    def _parallel_chunks(
+        self,
+        uuids: Union[Iterable[uuid.UUID], UUIDArray],
+        migration_type: str,
+        namespace: str,
+        name: Optional[str],
+        workers: Optional[int],
+        chunk_size: int,
+        ordered: bool,
+        max_pending: Optional[int],
+    ) -> Iterator[Tuple[UUIDArray, bytes]]:
+        if migration_type not in PARALLEL_MIGRATIONS:
+            raise ValueError(f"migration_type must be one of {PARALLEL_MIGRATIONS}")
+        if not isinstance(namespace, str) or (name is not None and not isinstance(name, str)):
+            raise ValueError("namespace and name must be strings")
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+
+        workers = workers or os.cpu_count() or 1
+        limit = max_pending or workers * 2
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending: deque = deque()
+            source_iter = iter(uuids)
+            offset = 0
+
+            def submit_next() -> bool:
+                nonlocal offset
+                if isinstance(uuids, UUIDArray):
+                    packed = bytes(uuids[offset : offset + chunk_size])
+                    offset += chunk_size
+                else:
+                    packed = b"".join(u.bytes for u in islice(source_iter, chunk_size))
+                if not packed:
+                    return False
+                future = executor.submit(_migrate_chunk, migration_type, namespace, name, packed)
+                pending.append((future, packed))
+                return True
+
+            exhausted = False
+            while pending or not exhausted:
+                while not exhausted and len(pending) < limit:
+                    exhausted = not submit_next()
+                if not pending:
+                    break
+                if ordered:
+                    future, packed = pending.popleft()
+                else:
+                    done, _ = wait([entry[0] for entry in pending], return_when=FIRST_COMPLETED)
+                    index = next(i for i, entry in enumerate(pending) if entry[0] in done)
+                    future, packed = pending[index]
+                    del pending[index]
+                yield UUIDArray(packed), future.result()
+
+    def batch_migrate_parallel_packed(
+        self,
+        uuids: Union[Iterable[uuid.UUID], UUIDArray],
+        migration_type: str,
+        namespace: str,
+        name: Optional[str] = None,
+        workers: Optional[int] = None,
+        chunk_size: int = 10000,
+        ordered: bool = True,
+        max_pending: Optional[int] = None,
+        record_history: bool = True,
+    ) -> Iterator[Tuple[UUIDArray, UUIDArray]]:
+        for sources, targets in self._parallel_chunks(
+            uuids, migration_type, namespace, name, workers, chunk_size, ordered, max_pending
+        ):
+            if record_history:
+                self.migration_history.append_many(bytes(sources), targets, migration_type)
+            elif self.journal is not None:
+                self.journal.append_many(bytes(sources), targets, migration_type)
+            yield sources, UUIDArray(targets)
+
+    def batch_migrate_parallel(
+        self,
+        uuids: Union[Iterable[uuid.UUID], UUIDArray],
+        migration_type: str,
+        namespace: str,
+        name: Optional[str] = None,
+        workers: Optional[int] = None,
+        chunk_size: int = 10000,
+        ordered: bool = True,
+        max_pending: Optional[int] = None,
+        record_history: bool = True,
+    ) -> Iterator[MigrationResult]:
+        for sources, targets in self._parallel_chunks(
+            uuids, migration_type, namespace, name, workers, chunk_size, ordered, max_pending
+        ):
+            if not record_history and self.journal is not None:
+                self.journal.append_many(bytes(sources), targets, migration_type)
+            timestamp = datetime.now()
+            for position, source_uuid in enumerate(sources):
+                result = MigrationResult(
+                    source_uuid=source_uuid,
+                    target_uuid=uuid.UUID(bytes=targets[position * 16 : position * 16 + 16]),
+                    migration_type=migration_type,
+                    success=True,
+                    timestamp=timestamp,
+                    metadata={
+                        "namespace": namespace,
+                        "name": str(source_uuid) if name is None else name,
+                    },
+                )
+                if record_history:
+                    self.migration_history.append(result)
+                yield result
+
+    def batch_migrate_array(
+        self,
+        uuids: UUIDArray,
+        migration_type: str,
+        namespace: str,
+        name: Optional[str] = None,
+        record_history: bool = True,
+    ) -> UUIDArray:
+        if not isinstance(uuids, UUIDArray):
+            raise ValueError("uuids must be a UUIDArray")
+        if migration_type not in PARALLEL_MIGRATIONS:
+            raise ValueError(f"migration_type must be one of {PARALLEL_MIGRATIONS}")
+        if not isinstance(namespace, str) or (name is not None and not isinstance(name, str)):
+            raise ValueError("namespace and name must be strings")
+        hasher = self.get_hasher(namespace, 5 if migration_type == "v4_to_v5" else 3)
+        if name is not None:
+            targets = hasher.hash_bytes(name) * len(uuids)
+        else:
+            targets = hasher.hash_batch(uuids.to_strings())
+        if record_history:
+            self.migration_history.append_many(bytes(uuids), targets, migration_type)
+        elif self.journal is not None and targets:
+            self.journal.append_many(bytes(uuids), targets, migration_type)
+        return UUIDArray(targets)
+
     def get_migration_statistics(self) -> Dict:
-        total = len(self.migration_history)
-        successful = sum(1 for r in self.migration_history if r.success)
-        failed = total - successful
-        by_type = {}
-        for result in self.migration_history:
-            by_type[result.migration_type] = by_type.get(result.migration_type, 0) + 1
-        return {
-            "total": total,
-            "successful": successful,
-            "failed": failed,
-            "success_rate": successful / total if total > 0 else 0,
-            "by_type": by_type,
-        }
+        return self.migration_history.get_statistics()
 
     def rollback_migration(self, result: MigrationResult) -> bool:
         if result in self.migration_history:
@@ -156,6 +825,10 @@ class UUIDMigrator:
             return True
         return False
 
+    def close(self):
+        if self.journal is not None:
+            self.journal.close()
+
     def clear_history(self):
         self.migration_history.clear()
         self.namespace_cache.clear()
@@ -166,6 +839,7 @@ class UUIDMigrator:
             raise ValueError("name must be a non-empty string")
         if not callable(handler):
             raise ValueError("handler must be callable")
+        _check_type_name(f"custom:{name}")
         self.custom_migrations[name] = handler
 
     def migrate_custom(self, source_uuid: uuid.UUID, name: str, **metadata) -> MigrationResult:
@@ -173,30 +847,75 @@ class UUIDMigrator:
             raise ValueError("custom migration is not registered")
         try:
             target_uuid = self.custom_migrations[name](source_uuid)
+        except Exception as e:
             result = MigrationResult(
                 source_uuid=source_uuid,
-                target_uuid=target_uuid,
+                target_uuid=source_uuid,
                 migration_type=f"custom:{name}",
-                success=True,
+                success=False,
                 timestamp=datetime.now(),
-                metadata=metadata or {},
+                metadata={"error": str(e), **metadata},
             )
-            self.migration_history.append(result)
-            return result
-        except Exception as e:
+        else:
             result = MigrationResult(
                 source_uuid=source_uuid,
-                target_uuid=source_uuid,
+                target_uuid=target_uuid,
                 migration_type=f"custom:{name}",
-                success=False,
+                success=True,
                 timestamp=datetime.now(),
-                metadata={"error": str(e), **metadata},
+                metadata=metadata or {},
             )
-            self.migration_history.append(result)
-            return result
+        self.migration_history.append(result)
+        return result
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="UUID migration tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    migrate_parser = subparsers.add_parser("migrate", help="re-key UUIDs in parallel")
+    migrate_parser.add_argument("--type", choices=PARALLEL_MIGRATIONS, default="v4_to_v5")
+    migrate_parser.add_argument("--namespace", required=True)
+    migrate_parser.add_argument("--name", default=None)
+    migrate_parser.add_argument("--input", default="-")
+    migrate_parser.add_argument("--output", default="-")
+    migrate_parser.add_argument("--workers", type=int, default=None)
+    migrate_parser.add_argument("--chunk-size", type=int, default=10000)
+    migrate_parser.add_argument("--unordered", action="store_true")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == "-" else open(args.input, "r")
+    sink = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        uuids = (uuid.UUID(line.strip()) for line in source if line.strip())
+        migrator = UUIDMigrator()
+        chunks = migrator.batch_migrate_parallel_packed(
+            uuids,
+            args.type,
+            args.namespace,
+            name=args.name,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            ordered=not args.unordered,
+            record_history=False,
+        )
+        for sources, targets in chunks:
+            sink.write(
+                "".join(
+                    f"{source},{target}\n"
+                    for source, target in zip(sources.to_strings(), targets.to_strings())
+                )
+            )
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+    return 0
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(main())
     migrator = UUIDMigrator()
     test_uuid = uuid.uuid4()
     result = migrator.migrate_v4_to_v5(test_uuid, "example.com", "user123")
@@ -1,9 +1,43 @@
+import asyncio
+import json
+import os
+import struct
+import sys
+import tempfile
 import uuid
 import threading
+import weakref
 import time
-from typing import Optional, List, Dict
-from dataclasses import dataclass
-from queue import Queue, Empty
+import traceback
+from collections import Counter, deque
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Callable, Iterable, Optional, List, Dict, Union
+from dataclasses import asdict, dataclass, field, replace
+from queue import Queue, Empty, Full
+
+from uuid_array import UUIDArray
+from uuid_metrics import NULL_REGISTRY, MetricsRegistry, instrument_methods
+from uuid_utils import (
+    OUTPUT_FORMATS,
+    NamespaceHasher,
+    UUIDv6Generator,
+    UUIDv7Generator,
+    format_uuid_buffer,
+    generate_uuid4_bytes,
+)
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+STORAGE_MODES = ("queue", "slab")
+POOL_GENERATORS = ("v4", "v5", "v6", "v7")
+SHARED_POOL_OPERATIONS = ("get", "get_batch", "get_bytes", "get_batch_bytes", "put", "_refill")
+POOL_OPERATIONS = SHARED_POOL_OPERATIONS + ("_evict_expired",)
+
+PoolItem = Union[uuid.UUID, bytes, str]
+_SHM_ACCEPTS_TRACK = sys.version_info >= (3, 13)
 
 
 @dataclass
@@ -14,6 +48,22 @@ class PoolConfig:
     refill_threshold: float = 0.3
     refill_batch_size: int = 50
     ttl_seconds: Optional[float] = None
+    storage: str = "queue"
+    eviction_segments: int = 64
+    refill_interval: float = 0.1
+    adaptive_refill: bool = False
+    max_refill_interval: float = 1.0
+    refill_horizon: float = 0.5
+    ewma_alpha: float = 0.3
+    generator: Union[str, Callable[[int], Union[bytes, List[uuid.UUID]]]] = "v4"
+    namespace: Optional[str] = None
+    name_source: Optional[Callable[[int], Iterable[str]]] = None
+    output_format: str = "uuid"
+    thread_cache_size: int = 0
+    diagnostics: bool = False
+    diagnostics_size: int = 1024
+    watchdog_interval: Optional[float] = None
+    refill_stall_seconds: float = 5.0
 
 
 @dataclass
@@ -25,12 +75,358 @@ class PoolStats:
     cache_misses: int
     refill_count: int
     eviction_count: int
+    eviction_ticks: int = 0
+    last_eviction_seconds: float = 0.0
+    total_eviction_seconds: float = 0.0
+    consumption_rate: float = 0.0
+    thread_cached: int = 0
+    refill_errors: int = 0
+    refill_restarts: int = 0
+
+
+@dataclass(eq=False)
+class _ThreadMagazine:
+    items: List = field(default_factory=list)
+    hits: int = 0
+    misses: int = 0
+
+
+class _MagazineOwner:
+    __slots__ = ("magazine", "__weakref__")
+
+    def __init__(self, magazine: _ThreadMagazine):
+        self.magazine = magazine
+
+
+@dataclass
+class RefillTick:
+    started_at: float
+    work_seconds: float
+    generation_seconds: float
+    eviction_seconds: float
+    generated: int
+    gil_wait_seconds: float
+    planned_sleep: float
+    slept_seconds: float
+    sleep_drift: float
+    woken_early: bool
+    current_size: int
+    error: Optional[str] = None
+
+
+class RefillDiagnostics:
+    def __init__(self, size: int = 1024):
+        if not isinstance(size, int) or size < 1:
+            raise ValueError("diagnostics_size must be a positive integer")
+        self.ticks: deque = deque(maxlen=size)
+        self.errors: Counter = Counter()
+        self.last_error: Optional[str] = None
+        self.stalls = 0
+        self.last_stall_stack: Optional[str] = None
+        self.generation_seconds = 0.0
+        self.eviction_seconds = 0.0
+        self.generated = 0
+        self.lock = threading.Lock()
+
+    def begin_tick(self):
+        self.generation_seconds = 0.0
+        self.eviction_seconds = 0.0
+        self.generated = 0
+
+    def record(self, tick: RefillTick):
+        with self.lock:
+            self.ticks.append(tick)
+
+    def record_error(self, exc: BaseException):
+        with self.lock:
+            self.errors[type(exc).__name__] += 1
+            self.last_error = "".join(traceback.format_exception_only(type(exc), exc)).strip()
+
+    def record_stall(self, stack: Optional[str]):
+        with self.lock:
+            self.stalls += 1
+            self.last_stall_stack = stack
+
+    def snapshot(self) -> List[RefillTick]:
+        with self.lock:
+            return list(self.ticks)
+
+    def summary(self) -> Dict[str, Any]:
+        ticks = self.snapshot()
+        with self.lock:
+            errors = dict(self.errors)
+            stalls = self.stalls
+            last_error = self.last_error
+            last_stall_stack = self.last_stall_stack
+        drifts = sorted(tick.sleep_drift for tick in ticks if not tick.woken_early)
+        return {
+            "ticks": len(ticks),
+            "generated": sum(tick.generated for tick in ticks),
+            "mean_work_seconds": sum(tick.work_seconds for tick in ticks) / len(ticks)
+            if ticks
+            else 0.0,
+            "max_work_seconds": max((tick.work_seconds for tick in ticks), default=0.0),
+            "generation_seconds": sum(tick.generation_seconds for tick in ticks),
+            "eviction_seconds": sum(tick.eviction_seconds for tick in ticks),
+            "gil_wait_seconds": sum(tick.gil_wait_seconds for tick in ticks),
+            "median_sleep_drift": drifts[len(drifts) // 2] if drifts else 0.0,
+            "max_sleep_drift": drifts[-1] if drifts else 0.0,
+            "errors": errors,
+            "last_error": last_error,
+            "stalls": stalls,
+            "last_stall_stack": last_stall_stack,
+        }
+
+    def clear(self):
+        with self.lock:
+            self.ticks.clear()
+            self.errors.clear()
+            self.last_error = None
+            self.stalls = 0
+            self.last_stall_stack = None
+
+
+def _batch_generator(config: PoolConfig) -> Callable[[int], bytes]:
+    if config.output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"output_format must be one of {OUTPUT_FORMATS}")
+    generator = config.generator
+    if callable(generator):
+        def generate_custom(count: int) -> bytes:
+            data = generator(count)
+            if not isinstance(data, (bytes, bytearray, memoryview)):
+                data = b"".join(u.bytes for u in data)
+            if len(data) != count * 16:
+                raise ValueError("custom generator must return exactly count UUIDs")
+            return bytes(data)
+
+        return generate_custom
+    if generator not in POOL_GENERATORS:
+        raise ValueError(f"generator must be one of {POOL_GENERATORS} or a callable")
+    if generator == "v7":
+        return UUIDv7Generator().generate_batch_bytes
+    if generator == "v6":
+        return UUIDv6Generator().generate_batch_bytes
+    if generator == "v5":
+        if not isinstance(config.namespace, str) or not config.namespace:
+            raise ValueError("the v5 generator requires a namespace")
+        if not callable(config.name_source):
+            raise ValueError("the v5 generator requires a name_source callable")
+        hasher = NamespaceHasher(uuid.uuid5(uuid.NAMESPACE_DNS, config.namespace))
+        name_source = config.name_source
+
+        def generate_named(count: int) -> bytes:
+            data = hasher.hash_batch(name_source(count))
+            if len(data) != count * 16:
+                raise ValueError("name_source must return exactly count names")
+            return data
+
+        return generate_named
+    return generate_uuid4_bytes
+
+
+def _format_record(data: bytes, output_format: str) -> PoolItem:
+    if output_format == "bytes":
+        return data
+    if output_format == "uuid":
+        return uuid.UUID(bytes=data)
+    return format_uuid_buffer(data, output_format)[0]
+
+
+def _item_bytes(item: PoolItem) -> bytes:
+    if isinstance(item, uuid.UUID):
+        return item.bytes
+    if isinstance(item, (bytes, bytearray)):
+        if len(item) != 16:
+            raise ValueError("bytes items must be 16 bytes long")
+        return bytes(item)
+    if isinstance(item, str):
+        return uuid.UUID(item).bytes
+    raise ValueError("items must be UUIDs, 16-byte values or UUID strings")
+
+
+class ExpirySegments:
+    def __init__(self, segment_seconds: float):
+        self.segment_seconds = segment_seconds
+        self.segments: deque = deque()
+
+    def record(self, end_seq: int, now: float):
+        if self.segments and now - self.segments[-1][2] < self.segment_seconds:
+            segment = self.segments[-1]
+            segment[0] = end_seq
+            segment[1] = now
+        else:
+            self.segments.append([end_seq, now, now])
+
+    def expired_until(self, head_seq: int, cutoff: float) -> int:
+        expired_seq = head_seq
+        segments = self.segments
+        while segments:
+            end_seq, newest, _ = segments[0]
+            if end_seq <= head_seq:
+                segments.popleft()
+            elif newest < cutoff:
+                expired_seq = end_seq
+                segments.popleft()
+            else:
+                break
+        return expired_seq
+
+    def truncate(self, tail_seq: int):
+        for segment in self.segments:
+            segment[0] = min(segment[0], tail_seq)
+
+    def clear(self):
+        self.segments.clear()
+
+
+class UUIDSlabRing:
+    SLOT_SIZE = 16
+
+    def __init__(
+        self,
+        capacity: int,
+        lock: Optional[threading.Lock] = None,
+        output_format: str = "bytes",
+    ):
+        if not isinstance(capacity, int) or capacity < 1:
+            raise ValueError("capacity must be a positive integer")
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"output_format must be one of {OUTPUT_FORMATS}")
+        self.capacity = capacity
+        self.output_format = output_format
+        self.slots = bytearray(capacity * self.SLOT_SIZE)
+        self.items: Optional[List[PoolItem]] = (
+            None if output_format == "bytes" else [None] * capacity
+        )
+        self.head = 0
+        self.tail = 0
+        self.lock = lock or threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+
+    @property
+    def count(self) -> int:
+        return self.tail - self.head
+
+    def qsize(self) -> int:
+        return self.tail - self.head
+
+    def empty(self) -> bool:
+        return self.tail == self.head
+
+    def full(self) -> bool:
+        return self.tail - self.head >= self.capacity
+
+    def push_locked(self, data: bytes, items: Optional[List[PoolItem]] = None) -> int:
+        added = min(self.capacity - self.count, len(data) // self.SLOT_SIZE)
+        if added <= 0:
+            return 0
+        start = self.tail % self.capacity
+        first = min(added, self.capacity - start)
+        size = self.SLOT_SIZE
+        self.slots[start * size : (start + first) * size] = data[: first * size]
+        if first < added:
+            self.slots[: (added - first) * size] = data[first * size : added * size]
+        if self.items is not None:
+            if items is None:
+                items = format_uuid_buffer(data[: added * size], self.output_format)
+            self.items[start : start + first] = items[:first]
+            if first < added:
+                self.items[: added - first] = items[first:added]
+        self.tail += added
+        self.not_empty.notify(added)
+        return added
+
+    def take_locked(self, count: int) -> bytes:
+        taken = min(count, self.count)
+        if taken <= 0:
+            return b""
+        start = self.head % self.capacity
+        first = min(taken, self.capacity - start)
+        size = self.SLOT_SIZE
+        data = bytes(self.slots[start * size : (start + first) * size])
+        if first < taken:
+            data += self.slots[: (taken - first) * size]
+        self.head += taken
+        return data
+
+    def _items_from_head(self, count: int) -> List[PoolItem]:
+        start = self.head % self.capacity
+        first = min(count, self.capacity - start)
+        items = self.items[start : start + first]
+        if first < count:
+            items += self.items[: count - first]
+        return items
+
+    def take_items_locked(self, count: int) -> List[PoolItem]:
+        if self.items is None:
+            return format_uuid_buffer(self.take_locked(count), "bytes")
+        taken = min(count, self.count)
+        if taken <= 0:
+            return []
+        items = self._items_from_head(taken)
+        self.head += taken
+        return items
+
+    def drop_until_locked(self, seq: int) -> int:
+        dropped = max(0, min(seq, self.tail) - self.head)
+        self.head += dropped
+        return dropped
+
+    def clear_locked(self):
+        self.head = self.tail
+
+    def resize_locked(self, capacity: int) -> int:
+        if not isinstance(capacity, int) or capacity < 1:
+            raise ValueError("capacity must be a positive integer")
+        kept = min(self.count, capacity)
+        evicted = self.count - kept
+        items = None if self.items is None else self._items_from_head(kept)
+        data = self.take_locked(kept)
+        self.capacity = capacity
+        self.slots = bytearray(capacity * self.SLOT_SIZE)
+        if self.items is not None:
+            self.items = [None] * capacity
+        self.tail = self.head
+        self.push_locked(data, items)
+        return evicted
+
+    def put_nowait(self, uuid_obj: uuid.UUID):
+        with self.lock:
+            if not self.push_locked(uuid_obj.bytes):
+                raise Full
+
+    def get_nowait(self) -> uuid.UUID:
+        return self.get(block=False)
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> uuid.UUID:
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        with self.not_empty:
+            if block and not self.not_empty.wait_for(lambda: self.tail > self.head, timeout):
+                raise Empty
+            data = self.take_locked(1)
+        if not data:
+            raise Empty
+        return uuid.UUID(bytes=data)
 
 
 class UUIDPool:
-    def __init__(self, config: Optional[PoolConfig] = None):
+    def __init__(
+        self, config: Optional[PoolConfig] = None, metrics: Optional[MetricsRegistry] = None
+    ):
         self.config = config or PoolConfig()
-        self.pool: Queue = Queue(maxsize=self.config.max_size)
+        if self.config.storage not in STORAGE_MODES:
+            raise ValueError(f"storage must be one of {STORAGE_MODES}")
+        if not isinstance(self.config.thread_cache_size, int) or self.config.thread_cache_size < 0:
+            raise ValueError("thread_cache_size must be a non-negative integer")
+        if self.config.thread_cache_size and self.config.ttl_seconds:
+            raise ValueError("thread_cache_size cannot be combined with ttl_seconds")
+        self._generate_bytes = _batch_generator(self.config)
+        self._format = self.config.output_format
+        self._local = threading.local()
+        self._magazines: set = set()
+        self._retired: deque = deque()
+        self._withdrawn = 0
         self.stats = PoolStats(
             current_size=0,
             total_generated=0,
@@ -41,108 +437,480 @@ class UUIDPool:
             eviction_count=0,
         )
         self.lock = threading.Lock()
-        self._uuid_timestamps: Dict[str, float] = {}
+        self._not_empty = threading.Condition(self.lock)
+        self._slab = self.config.storage == "slab"
+        if self._slab:
+            self.pool = UUIDSlabRing(
+                self.config.max_size, lock=self.lock, output_format=self._format
+            )
+        else:
+            self.pool = Queue(maxsize=self.config.max_size)
+        self._head_seq = 0
+        self._tail_seq = 0
+        self._expiry = ExpirySegments(
+            (self.config.ttl_seconds or 0.0) / max(1, self.config.eviction_segments)
+        )
+        self._wakeup = threading.Event()
+        self._low_water_level = int(self.config.max_size * self.config.refill_threshold)
+        self._rate_checked_at = time.monotonic()
+        self._rate_consumed = 0
         self._running = True
+        self._stopped = threading.Event()
+        self._refill_thread: Optional[threading.Thread] = None
+        self._last_tick_at = time.monotonic()
+        self._tick_due_at = self._last_tick_at
+        self.diagnostics = (
+            RefillDiagnostics(self.config.diagnostics_size) if self.config.diagnostics else None
+        )
+        if self.config.watchdog_interval is not None and self.config.watchdog_interval <= 0:
+            raise ValueError("watchdog_interval must be positive or None")
+        if self.config.refill_stall_seconds <= 0:
+            raise ValueError("refill_stall_seconds must be positive")
+        self.instrument(metrics)
 
         if self.config.prefill:
             self._prefill_pool()
 
         self._start_refill_thread()
+        if self.config.watchdog_interval:
+            self._start_watchdog()
+
+    def instrument(self, metrics: Optional[MetricsRegistry] = None, **labels: str):
+        instrument_methods(self, metrics, "pool", POOL_OPERATIONS, **labels)
 
     def _prefill_pool(self):
-        for _ in range(self.config.min_size):
-            self._generate_and_add()
+        self._refill(self.config.min_size)
 
-    def _generate_and_add(self) -> bool:
-        try:
-            new_uuid = uuid.uuid4()
-            uuid_str = str(new_uuid)
-            self.pool.put_nowait(new_uuid)
-            self._uuid_timestamps[uuid_str] = time.time()
-            with self.lock:
-                self.stats.total_generated += 1
-                self.stats.current_size = self.pool.qsize()
-            return True
-        except Exception:
-            return False
+    def _refill(self, count: int):
+        if count <= 0:
+            return
+        started = time.perf_counter()
+        if self._slab:
+            data = self._generate_bytes(count)
+            added = self._add_slab_bytes(data, self._slab_items(data))
+        else:
+            added = self._add_items(format_uuid_buffer(self._generate_bytes(count), self._format))
+        diagnostics = self.diagnostics
+        if diagnostics is not None:
+            diagnostics.generation_seconds += time.perf_counter() - started
+            diagnostics.generated += added
+
+    def _slab_items(self, data: bytes) -> Optional[List[PoolItem]]:
+        if self.pool.items is None:
+            return None
+        return format_uuid_buffer(data, self._format)
+
+    def _add_slab_bytes(self, data: bytes, items: Optional[List[PoolItem]] = None) -> int:
+        with self.lock:
+            added = self.pool.push_locked(data, items)
+            self._mark_inserted(self.pool.tail)
+            self.stats.total_generated += added
+            self.stats.current_size = self.pool.count
+        return added
+
+    def _mark_inserted(self, end_seq: int):
+        if self.config.ttl_seconds:
+            self._expiry.record(end_seq, time.monotonic())
+
+    def _add_items(self, items: List[PoolItem]) -> int:
+        added = 0
+        for item in items:
+            try:
+                self.pool.put_nowait(item)
+            except Full:
+                break
+            added += 1
+        if not added:
+            return 0
+        with self.lock:
+            self._tail_seq += added
+            self._mark_inserted(self._tail_seq)
+            self.stats.total_generated += added
+            self.stats.current_size = self.pool.qsize()
+            self._not_empty.notify(added)
+        return added
 
     def _start_refill_thread(self):
         def refill_worker():
             while self._running:
-                try:
-                    current_size = self.pool.qsize()
-                    threshold = int(self.config.max_size * self.config.refill_threshold)
-
-                    if current_size < threshold:
-                        needed = min(
-                            self.config.refill_batch_size,
-                            self.config.max_size - current_size,
-                        )
-                        for _ in range(needed):
-                            self._generate_and_add()
-                        with self.lock:
-                            self.stats.refill_count += 1
-
-                    if self.config.ttl_seconds:
-                        self._evict_expired()
-
-                    time.sleep(0.1)
-                except Exception:
-                    pass
+                self._wakeup.clear()
+                if self.diagnostics is None:
+                    self._wakeup.wait(self._run_refill_tick())
+                else:
+                    self._diagnosed_refill_tick()
+
+        self._refill_thread = threading.Thread(target=refill_worker, daemon=True)
+        self._refill_thread.start()
+
+    def _run_refill_tick(self) -> float:
+        self._last_tick_at = self._tick_due_at = time.monotonic()
+        try:
+            if self._retired:
+                self._drain_retired()
+            delay = self._refill_tick()
+        except Exception as exc:
+            with self.lock:
+                self.stats.refill_errors += 1
+            if self.diagnostics is not None:
+                self.diagnostics.record_error(exc)
+            delay = self.config.refill_interval
+        self._tick_due_at = time.monotonic() + delay
+        return delay
+
+    def _diagnosed_refill_tick(self):
+        diagnostics = self.diagnostics
+        diagnostics.begin_tick()
+        errors = self.stats.refill_errors
+        started_at = time.monotonic()
+        wall = time.perf_counter()
+        cpu = time.thread_time()
+        delay = self._run_refill_tick()
+        work = time.perf_counter() - wall
+        cpu = time.thread_time() - cpu
+        slept = time.perf_counter()
+        woken_early = self._wakeup.wait(delay)
+        slept = time.perf_counter() - slept
+        diagnostics.record(
+            RefillTick(
+                started_at=started_at,
+                work_seconds=work,
+                generation_seconds=diagnostics.generation_seconds,
+                eviction_seconds=diagnostics.eviction_seconds,
+                generated=diagnostics.generated,
+                gil_wait_seconds=max(0.0, work - cpu),
+                planned_sleep=delay,
+                slept_seconds=slept,
+                sleep_drift=slept - delay,
+                woken_early=woken_early,
+                current_size=self.pool.qsize(),
+                error=diagnostics.last_error if self.stats.refill_errors != errors else None,
+            )
+        )
 
-        thread = threading.Thread(target=refill_worker, daemon=True)
-        thread.start()
+    def _start_watchdog(self):
+        def watchdog():
+            while not self._stopped.wait(self.config.watchdog_interval):
+                self._check_refill_thread()
+
+        threading.Thread(target=watchdog, daemon=True).start()
+
+    def _check_refill_thread(self) -> bool:
+        if not self._running:
+            return False
+        thread = self._refill_thread
+        if thread is None or not thread.is_alive():
+            with self.lock:
+                self.stats.refill_restarts += 1
+            self._start_refill_thread()
+            return True
+        if (
+            self.diagnostics is not None
+            and time.monotonic() - self._tick_due_at > self.config.refill_stall_seconds
+        ):
+            frame = sys._current_frames().get(thread.ident)
+            self.diagnostics.record_stall(
+                "".join(traceback.format_stack(frame)) if frame is not None else None
+            )
+            self._tick_due_at = time.monotonic()
+        return False
+
+    def dump_diagnostics(self, filepath: Optional[str] = None) -> Dict[str, Any]:
+        if self.diagnostics is None:
+            raise RuntimeError("diagnostics are disabled; set PoolConfig.diagnostics=True")
+        stats = self.get_stats()
+        thread = self._refill_thread
+        report = {
+            "refill_thread_alive": thread is not None and thread.is_alive(),
+            "seconds_since_last_tick": time.monotonic() - self._last_tick_at,
+            "refill_errors": stats.refill_errors,
+            "refill_restarts": stats.refill_restarts,
+            "summary": self.diagnostics.summary(),
+            "ticks": [asdict(tick) for tick in self.diagnostics.snapshot()],
+        }
+        if filepath is not None:
+            with open(filepath, "w") as handle:
+                json.dump(report, handle, indent=2)
+        return report
+
+    def _refill_tick(self) -> float:
+        current_size = self.pool.qsize()
+        if self.config.adaptive_refill:
+            return self._adaptive_refill_tick(current_size)
+
+        threshold = int(self.config.max_size * self.config.refill_threshold)
+        if current_size < threshold:
+            needed = min(
+                self.config.refill_batch_size,
+                self.config.max_size - current_size,
+            )
+            self._refill(needed)
+            with self.lock:
+                self.stats.refill_count += 1
+
+        if self.config.ttl_seconds:
+            self._evict_expired()
+        return self.config.refill_interval
+
+    def _adaptive_refill_tick(self, current_size: int) -> float:
+        now = time.monotonic()
+        with self.lock:
+            consumed = self.stats.total_consumed + self._withdrawn
+        elapsed = now - self._rate_checked_at
+        if elapsed > 0:
+            sample = (consumed - self._rate_consumed) / elapsed
+            alpha = self.config.ewma_alpha
+            rate = alpha * sample + (1 - alpha) * self.stats.consumption_rate
+            self._rate_checked_at = now
+            self._rate_consumed = consumed
+        else:
+            rate = self.stats.consumption_rate
+
+        threshold = int(self.config.max_size * self.config.refill_threshold)
+        demand = int(rate * self.config.refill_horizon)
+        low_water = min(self.config.max_size, max(threshold, demand))
+        self._low_water_level = low_water
+
+        if current_size < low_water:
+            needed = min(
+                self.config.max_size - current_size,
+                max(self.config.refill_batch_size, low_water + demand - current_size),
+            )
+            self._refill(needed)
+            current_size = self.pool.qsize()
+            with self.lock:
+                self.stats.refill_count += 1
+
+        with self.lock:
+            self.stats.consumption_rate = rate
+
+        if self.config.ttl_seconds:
+            self._evict_expired()
+
+        if rate <= 0:
+            return self.config.max_refill_interval
+        headroom = max(0, current_size - low_water)
+        return min(
+            self.config.max_refill_interval,
+            max(self.config.refill_interval / 10, headroom / rate),
+        )
+
+    def _signal_low_water(self, current_size: int):
+        if (
+            self.config.adaptive_refill
+            and current_size < self._low_water_level
+            and not self._wakeup.is_set()
+        ):
+            self._wakeup.set()
 
     def _evict_expired(self):
         if not self.config.ttl_seconds:
             return
 
-        current_time = time.time()
-        expired = [
-            uuid_str
-            for uuid_str, timestamp in self._uuid_timestamps.items()
-            if current_time - timestamp > self.config.ttl_seconds
-        ]
+        start = time.perf_counter()
+        cutoff = time.monotonic() - self.config.ttl_seconds
+        with self.lock:
+            if self._slab:
+                expired_seq = self._expiry.expired_until(self.pool.head, cutoff)
+                evicted_count = self.pool.drop_until_locked(expired_seq)
+            else:
+                expired_seq = self._expiry.expired_until(self._head_seq, cutoff)
+                evicted_count = 0
+                try:
+                    for _ in range(expired_seq - self._head_seq):
+                        self.pool.get_nowait()
+                        evicted_count += 1
+                except Empty:
+                    pass
+                self._head_seq += evicted_count
+            elapsed = time.perf_counter() - start
+            self.stats.eviction_count += evicted_count
+            self.stats.eviction_ticks += 1
+            self.stats.last_eviction_seconds = elapsed
+            self.stats.total_eviction_seconds += elapsed
+            self.stats.current_size = self.pool.qsize()
+        if self.diagnostics is not None:
+            self.diagnostics.eviction_seconds += elapsed
 
-        temp_queue = Queue()
-        evicted_count = 0
+    def _take_slab_bytes(
+        self, count: int, timeout: Optional[float], record_stats: bool = True
+    ) -> bytes:
+        return b"".join(self._take_slab(count, timeout, record_stats, self.pool.take_locked))
 
-        try:
-            while True:
-                item = self.pool.get_nowait()
-                if str(item) not in expired:
-                    temp_queue.put_nowait(item)
+    def _take_slab_items(
+        self, count: int, timeout: Optional[float], record_stats: bool = True
+    ) -> List[PoolItem]:
+        chunks = self._take_slab(count, timeout, record_stats, self.pool.take_items_locked)
+        if len(chunks) == 1:
+            return chunks[0]
+        return [item for chunk in chunks for item in chunk]
+
+    def _take_slab(
+        self,
+        count: int,
+        timeout: Optional[float],
+        record_stats: bool,
+        take: Callable[[int], Union[bytes, List[PoolItem]]],
+    ) -> list:
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        ring = self.pool
+        chunks = []
+        remaining = count
+        with ring.not_empty:
+            while remaining:
+                if ring.tail == ring.head:
+                    self._signal_low_water(0)
+                if not ring.not_empty.wait_for(lambda: ring.tail > ring.head, timeout):
+                    if record_stats:
+                        self.stats.cache_misses += 1
+                    break
+                chunk = take(remaining)
+                taken = len(chunk) if isinstance(chunk, list) else len(chunk) // ring.SLOT_SIZE
+                chunks.append(chunk)
+                remaining -= taken
+                if record_stats:
+                    self.stats.total_consumed += taken
+                    self.stats.cache_hits += taken
                 else:
-                    evicted_count += 1
-                    self._uuid_timestamps.pop(str(item), None)
-        except Empty:
-            pass
+                    self._withdrawn += taken
+                    break
+            self.stats.current_size = ring.count
+        self._signal_low_water(self.stats.current_size)
+        return chunks
+
+    def get_bytes(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        if self._slab:
+            return self._take_slab_bytes(1, timeout) or None
+        item = self.get(timeout=timeout)
+        return _item_bytes(item) if item else None
+
+    def get_batch_bytes(self, count: int, timeout: Optional[float] = None) -> bytes:
+        if not isinstance(count, int) or count < 1:
+            raise ValueError("count must be a positive integer")
+        if self._slab:
+            return self._take_slab_bytes(count, timeout)
+        return b"".join(_item_bytes(item) for item in self.get_batch(count, timeout=timeout))
 
-        while not temp_queue.empty():
-            self.pool.put_nowait(temp_queue.get())
+    def get_array(self, count: int, timeout: Optional[float] = None) -> UUIDArray:
+        return UUIDArray(self.get_batch_bytes(count, timeout=timeout))
 
+    def _magazine(self) -> _ThreadMagazine:
+        owner = getattr(self._local, "owner", None)
+        if owner is not None:
+            return owner.magazine
+        self._drain_retired()
+        magazine = _ThreadMagazine()
+        owner = _MagazineOwner(magazine)
+        weakref.finalize(owner, self._retired.append, magazine)
+        self._local.owner = owner
         with self.lock:
-            self.stats.eviction_count += evicted_count
+            self._magazines.add(magazine)
+        return magazine
+
+    def _drain_retired(self):
+        while self._retired:
+            try:
+                magazine = self._retired.popleft()
+            except IndexError:
+                break
+            with self.lock:
+                self._magazines.discard(magazine)
+                self.stats.total_consumed += magazine.hits
+                self.stats.cache_hits += magazine.hits
+                self.stats.cache_misses += magazine.misses
+                items, magazine.items = magazine.items, []
+            if items:
+                self._restock(items)
+
+    def _restock(self, items: List[PoolItem]) -> int:
+        if self._slab:
+            with self.lock:
+                added = self.pool.push_locked(
+                    b"".join(_item_bytes(item) for item in items), items
+                )
+                self._withdrawn -= added
+                self.stats.current_size = self.pool.count
+            return added
+        added = 0
+        for item in items:
+            try:
+                self.pool.put_nowait(item)
+            except Full:
+                break
+            added += 1
+        with self.lock:
+            self._tail_seq += added
+            self._withdrawn -= added
             self.stats.current_size = self.pool.qsize()
+            self._not_empty.notify(added)
+        return added
 
-    def get(self, timeout: Optional[float] = None) -> Optional[uuid.UUID]:
+    def _take_block(self, count: int, timeout: Optional[float]) -> List[PoolItem]:
+        if self._slab:
+            return self._take_slab_items(count, timeout, record_stats=False)
+        if self.config.adaptive_refill and self.pool.empty():
+            self._signal_low_water(0)
+        with self._not_empty:
+            items = self._dequeue_locked(count, timeout)
+            self._withdrawn += len(items)
+            self.stats.current_size = self.pool.qsize()
+        if not items:
+            self._signal_low_water(0)
+            return []
+        self._signal_low_water(self.stats.current_size)
+        return items
+
+    def _dequeue_locked(self, count: int, timeout: Optional[float]) -> List[PoolItem]:
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        if not self._not_empty.wait_for(lambda: not self.pool.empty(), timeout):
+            return []
+        items = []
         try:
-            uuid_obj = self.pool.get(timeout=timeout)
-            uuid_str = str(uuid_obj)
-            self._uuid_timestamps.pop(uuid_str, None)
-            with self.lock:
+            while len(items) < count:
+                items.append(self.pool.get_nowait())
+        except Empty:
+            pass
+        self._head_seq += len(items)
+        return items
+
+    def _get_cached(self, timeout: Optional[float]) -> Optional[PoolItem]:
+        magazine = self._magazine()
+        items = magazine.items
+        if not items:
+            items = self._take_block(self.config.thread_cache_size, timeout)
+            if not items:
+                magazine.misses += 1
+                return None
+            items.reverse()
+            magazine.items = items
+        magazine.hits += 1
+        return items.pop()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[PoolItem]:
+        if self.config.thread_cache_size:
+            return self._get_cached(timeout)
+        if self._slab:
+            items = self._take_slab_items(1, timeout)
+            return items[0] if items else None
+        if self.config.adaptive_refill and self.pool.empty():
+            self._signal_low_water(0)
+        with self._not_empty:
+            items = self._dequeue_locked(1, timeout)
+            if items:
                 self.stats.total_consumed += 1
                 self.stats.cache_hits += 1
-                self.stats.current_size = self.pool.qsize()
-            return uuid_obj
-        except Empty:
-            with self.lock:
+            else:
                 self.stats.cache_misses += 1
-            return None
+            self.stats.current_size = self.pool.qsize()
+        self._signal_low_water(self.stats.current_size if items else 0)
+        return items[0] if items else None
 
-    def get_batch(self, count: int, timeout: Optional[float] = None) -> List[uuid.UUID]:
+    def get_batch(self, count: int, timeout: Optional[float] = None) -> List[PoolItem]:
         if not isinstance(count, int) or count < 1:
             raise ValueError("count must be a positive integer")
+        if self._slab:
+            return self._take_slab_items(count, timeout)
         results = []
         for _ in range(count):
             uuid_obj = self.get(timeout=timeout)
@@ -152,53 +920,106 @@ class UUIDPool:
                 break
         return results
 
-    def put(self, uuid_obj: uuid.UUID) -> bool:
+    def put(self, uuid_obj: PoolItem) -> bool:
+        if self._slab:
+            data = _item_bytes(uuid_obj)
+            items = self._slab_items(data)
+            with self.lock:
+                added = self.pool.push_locked(data, items)
+                self._mark_inserted(self.pool.tail)
+                self.stats.current_size = self.pool.count
+            return added == 1
         try:
             if self.pool.qsize() < self.config.max_size:
+                if self._format != "uuid" or not isinstance(uuid_obj, uuid.UUID):
+                    uuid_obj = _format_record(_item_bytes(uuid_obj), self._format)
                 self.pool.put_nowait(uuid_obj)
-                self._uuid_timestamps[str(uuid_obj)] = time.time()
                 with self.lock:
+                    self._tail_seq += 1
+                    self._mark_inserted(self._tail_seq)
                     self.stats.current_size = self.pool.qsize()
+                    self._not_empty.notify()
                 return True
             return False
         except Exception:
             return False
 
+    def put_array(self, uuids: UUIDArray) -> int:
+        if not isinstance(uuids, UUIDArray):
+            raise ValueError("uuids must be a UUIDArray")
+        if self._slab:
+            data = bytes(uuids)
+            items = self._slab_items(data)
+            with self.lock:
+                added = self.pool.push_locked(data, items)
+                self._mark_inserted(self.pool.tail)
+                self.stats.current_size = self.pool.count
+            return added
+        added = 0
+        for uuid_obj in uuids:
+            if not self.put(uuid_obj):
+                break
+            added += 1
+        return added
+
     def get_stats(self) -> PoolStats:
+        self._drain_retired()
         with self.lock:
             self.stats.current_size = self.pool.qsize()
-            return PoolStats(
-                current_size=self.stats.current_size,
-                total_generated=self.stats.total_generated,
-                total_consumed=self.stats.total_consumed,
-                cache_hits=self.stats.cache_hits,
-                cache_misses=self.stats.cache_misses,
-                refill_count=self.stats.refill_count,
-                eviction_count=self.stats.eviction_count,
+            if not self._magazines:
+                return replace(self.stats)
+            hits = sum(magazine.hits for magazine in self._magazines)
+            return replace(
+                self.stats,
+                total_consumed=self.stats.total_consumed + hits,
+                cache_hits=self.stats.cache_hits + hits,
+                cache_misses=self.stats.cache_misses
+                + sum(magazine.misses for magazine in self._magazines),
+                thread_cached=sum(len(magazine.items) for magazine in self._magazines),
             )
 
     def get_hit_rate(self) -> float:
-        total_requests = self.stats.cache_hits + self.stats.cache_misses
-        return self.stats.cache_hits / total_requests if total_requests > 0 else 0.0
+        stats = self.get_stats()
+        total_requests = stats.cache_hits + stats.cache_misses
+        return stats.cache_hits / total_requests if total_requests > 0 else 0.0
 
     def clear(self):
-        while not self.pool.empty():
-            try:
-                self.pool.get_nowait()
-            except Empty:
-                break
-        self._uuid_timestamps.clear()
         with self.lock:
+            for magazine in self._magazines:
+                magazine.items = []
+        if self._slab:
+            with self.lock:
+                self.pool.clear_locked()
+                self._expiry.clear()
+                self.stats.current_size = 0
+            return
+        with self.lock:
+            while not self.pool.empty():
+                try:
+                    self.pool.get_nowait()
+                except Empty:
+                    break
+            self._head_seq = self._tail_seq
+            self._expiry.clear()
             self.stats.current_size = 0
 
     def shutdown(self):
         self._running = False
+        self._stopped.set()
+        self._wakeup.set()
         self.clear()
 
     def update_capacity(self, new_max_size: int):
         if not isinstance(new_max_size, int) or new_max_size < self.config.min_size:
             raise ValueError("new_max_size must be >= min_size")
         with self.lock:
+            if self._slab:
+                self.stats.eviction_count += self.pool.resize_locked(new_max_size)
+                self._expiry.truncate(self.pool.tail)
+                self.config.max_size = new_max_size
+                self._low_water_level = int(new_max_size * self.config.refill_threshold)
+                self.stats.current_size = self.pool.count
+                return
             new_queue = Queue(maxsize=new_max_size)
             evicted = 0
             try:
@@ -208,40 +1029,614 @@ class UUIDPool:
                         new_queue.put_nowait(item)
                     else:
                         evicted += 1
-                        self._uuid_timestamps.pop(str(item), None)
             except Empty:
                 pass
+            self._tail_seq -= evicted
+            self._expiry.truncate(self._tail_seq)
             self.pool = new_queue
             self.config.max_size = new_max_size
+            self._low_water_level = int(new_max_size * self.config.refill_threshold)
             self.stats.eviction_count += evicted
             self.stats.current_size = self.pool.qsize()
+            self._not_empty.notify_all()
 
     def update_refill_threshold(self, threshold: float):
         if not (0 < threshold <= 1):
             raise ValueError("threshold must be between 0 and 1")
         self.config.refill_threshold = threshold
+        self._low_water_level = int(self.config.max_size * threshold)
+
+
+class SharedUUIDPool:
+    SLOT_SIZE = 16
+    POLL_INTERVAL = 0.001
+    _MAGIC = 0x5555494450304C31
+    _HEADER = struct.Struct("<16Q")
+    _FIELD = struct.Struct("<Q")
+    (
+        _MAGIC_FIELD,
+        _CAPACITY,
+        _HEAD,
+        _TAIL,
+        _TOTAL_GENERATED,
+        _TOTAL_CONSUMED,
+        _CACHE_HITS,
+        _CACHE_MISSES,
+        _REFILL_COUNT,
+        _EVICTION_COUNT,
+        _PRODUCER_PID,
+        _RUNNING,
+        _TRACKER_PID,
+        _REFILL_ERRORS,
+        _REFILL_RESTARTS,
+        _LAST_REFILL_TICK,
+    ) = range(16)
+
+    def __init__(
+        self,
+        name: str,
+        config: Optional[PoolConfig] = None,
+        create: bool = False,
+        claim_size: int = 1,
+        metrics: Optional[MetricsRegistry] = None,
+    ):
+        if fcntl is None:
+            raise RuntimeError("SharedUUIDPool requires POSIX file locking (fcntl)")
+        if not isinstance(name, str) or not name:
+            raise ValueError("name must be a non-empty string")
+        if not isinstance(claim_size, int) or claim_size < 1:
+            raise ValueError("claim_size must be a positive integer")
+        self.name = name
+        self.config = config or PoolConfig()
+        self._generate_bytes = _batch_generator(self.config)
+        if self.config.ttl_seconds:
+            raise ValueError("ttl_seconds is not supported by SharedUUIDPool")
+        if self.config.watchdog_interval is not None and self.config.watchdog_interval <= 0:
+            raise ValueError("watchdog_interval must be positive or None")
+        self.claim_size = claim_size
+        self.is_producer = create
+        self.lock = threading.Lock()
+        self._local = b""
+        self._running = True
+        self._stopped = threading.Event()
+        self.diagnostics = (
+            RefillDiagnostics(self.config.diagnostics_size)
+            if create and self.config.diagnostics
+            else None
+        )
+        self._lock_file = open(
+            os.path.join(tempfile.gettempdir(), f"{name}.uuidpool.lock"), "a+b"
+        )
+
+        self._shm = None
+        try:
+            if create:
+                self._create_segment()
+            else:
+                self._attach_segment()
+        except BaseException:
+            if self._shm is not None:
+                self._shm.close()
+                if create:
+                    self._shm.unlink()
+            self._lock_file.close()
+            raise
+        self.capacity = self._read(self._CAPACITY)
+        self.instrument(metrics)
+
+        if create:
+            if self.config.prefill:
+                self._refill(self.config.min_size)
+            self._start_refill_thread()
+            if self.config.watchdog_interval:
+                self._start_watchdog()
+
+    def instrument(self, metrics: Optional[MetricsRegistry] = None, **labels: str):
+        labels.setdefault("pool", self.name)
+        instrument_methods(self, metrics, "shared_pool", SHARED_POOL_OPERATIONS, **labels)
+
+    def _create_segment(self):
+        capacity = self.config.max_size
+        self._shm = shared_memory.SharedMemory(
+            name=self.name, create=True, size=self._HEADER.size + capacity * self.SLOT_SIZE
+        )
+        header = [0] * 16
+        header[self._MAGIC_FIELD] = self._MAGIC
+        header[self._CAPACITY] = capacity
+        header[self._PRODUCER_PID] = os.getpid()
+        header[self._RUNNING] = 1
+        header[self._TRACKER_PID] = self._tracker_pid()
+        self._HEADER.pack_into(self._shm.buf, 0, *header)
+
+    def _attach_segment(self):
+        if _SHM_ACCEPTS_TRACK:
+            self._shm = shared_memory.SharedMemory(name=self.name, track=False)
+        else:
+            self._shm = shared_memory.SharedMemory(name=self.name)
+            tracker_pid = self._tracker_pid()
+            if not tracker_pid or tracker_pid != self._read(self._TRACKER_PID):
+                resource_tracker.unregister(self._shm._name, "shared_memory")
+        if self._read(self._MAGIC_FIELD) != self._MAGIC:
+            raise ValueError(f"shared memory block {self.name!r} is not a UUID pool")
+
+    @staticmethod
+    def _tracker_pid() -> int:
+        if _SHM_ACCEPTS_TRACK:
+            return 0
+        tracker = getattr(resource_tracker, "_resource_tracker", None)
+        return getattr(tracker, "_pid", None) or 0
+
+    def _read(self, field: int) -> int:
+        return self._FIELD.unpack_from(self._shm.buf, field * 8)[0]
+
+    def _write(self, field: int, value: int):
+        self._FIELD.pack_into(self._shm.buf, field * 8, value)
+
+    def _add(self, field: int, delta: int):
+        self._write(field, self._read(field) + delta)
+
+    def _acquire(self):
+        self.lock.acquire()
+        fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX)
+
+    def _release(self):
+        fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+        self.lock.release()
+
+    def _slot_offset(self, seq: int) -> int:
+        return self._HEADER.size + (seq % self.capacity) * self.SLOT_SIZE
+
+    def _push_locked(self, data: bytes) -> int:
+        head, tail = self._read(self._HEAD), self._read(self._TAIL)
+        added = min(self.capacity - (tail - head), len(data) // self.SLOT_SIZE)
+        if added <= 0:
+            return 0
+        buf = self._shm.buf
+        size = self.SLOT_SIZE
+        start = self._slot_offset(tail)
+        first = min(added, self.capacity - tail % self.capacity)
+        buf[start : start + first * size] = data[: first * size]
+        if first < added:
+            offset = self._HEADER.size
+            buf[offset : offset + (added - first) * size] = data[first * size : added * size]
+        self._write(self._TAIL, tail + added)
+        return added
+
+    def _claim_locked(self, count: int) -> bytes:
+        head, tail = self._read(self._HEAD), self._read(self._TAIL)
+        taken = min(count, tail - head)
+        if taken <= 0:
+            return b""
+        buf = self._shm.buf
+        start = self._slot_offset(head)
+        first = min(taken, self.capacity - head % self.capacity)
+        data = bytes(buf[start : start + first * self.SLOT_SIZE])
+        if first < taken:
+            offset = self._HEADER.size
+            data += bytes(buf[offset : offset + (taken - first) * self.SLOT_SIZE])
+        self._write(self._HEAD, head + taken)
+        self._add(self._TOTAL_CONSUMED, taken)
+        self._add(self._CACHE_HITS, taken)
+        return data
+
+    def _refill(self, count: int):
+        if count <= 0:
+            return
+        data = self._generate_bytes(count)
+        self._acquire()
+        try:
+            self._add(self._TOTAL_GENERATED, self._push_locked(data))
+        finally:
+            self._release()
+
+    def _start_refill_thread(self):
+        def refill_worker():
+            while self._running:
+                try:
+                    self._refill_tick()
+                except Exception as exc:
+                    self._acquire()
+                    try:
+                        self._add(self._REFILL_ERRORS, 1)
+                    finally:
+                        self._release()
+                    if self.diagnostics is not None:
+                        self.diagnostics.record_error(exc)
+                time.sleep(self.config.refill_interval)
+
+        self._refill_thread = threading.Thread(target=refill_worker, daemon=True)
+        self._refill_thread.start()
+
+    def _refill_tick(self):
+        self._write(self._LAST_REFILL_TICK, time.time_ns())
+        current_size = self.qsize()
+        threshold = int(self.capacity * self.config.refill_threshold)
+        if current_size < threshold:
+            self._refill(min(self.config.refill_batch_size, self.capacity - current_size))
+            self._acquire()
+            try:
+                self._add(self._REFILL_COUNT, 1)
+            finally:
+                self._release()
+
+    def _start_watchdog(self):
+        def watchdog():
+            while not self._stopped.wait(self.config.watchdog_interval):
+                self._check_refill_thread()
+
+        threading.Thread(target=watchdog, daemon=True).start()
+
+    def _check_refill_thread(self) -> bool:
+        if not self._running or self._refill_thread.is_alive():
+            return False
+        self._acquire()
+        try:
+            self._add(self._REFILL_RESTARTS, 1)
+        finally:
+            self._release()
+        self._start_refill_thread()
+        return True
+
+    def seconds_since_refill_tick(self) -> Optional[float]:
+        last_tick = self._read(self._LAST_REFILL_TICK)
+        if not last_tick:
+            return None
+        return max(0.0, (time.time_ns() - last_tick) / 1e9)
+
+    def qsize(self) -> int:
+        return self._read(self._TAIL) - self._read(self._HEAD)
+
+    def _take(self, count: int, timeout: Optional[float]) -> bytes:
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        chunks = []
+        remaining = count
+        with self.lock:
+            if self._local:
+                local_taken = min(remaining, len(self._local) // self.SLOT_SIZE)
+                chunks.append(self._local[: local_taken * self.SLOT_SIZE])
+                self._local = self._local[local_taken * self.SLOT_SIZE :]
+                remaining -= local_taken
+        while remaining:
+            self._acquire()
+            try:
+                data = self._claim_locked(max(remaining, self.claim_size))
+                if not data and (deadline is not None and time.monotonic() >= deadline):
+                    self._add(self._CACHE_MISSES, 1)
+            finally:
+                self._release()
+            if data:
+                wanted = remaining * self.SLOT_SIZE
+                chunks.append(data[:wanted])
+                remaining -= min(remaining, len(data) // self.SLOT_SIZE)
+                if len(data) > wanted:
+                    with self.lock:
+                        self._local += data[wanted:]
+                continue
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            time.sleep(self.POLL_INTERVAL)
+        return b"".join(chunks)
+
+    def get_bytes(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        return self._take(1, timeout) or None
+
+    def get_batch_bytes(self, count: int, timeout: Optional[float] = None) -> bytes:
+        if not isinstance(count, int) or count < 1:
+            raise ValueError("count must be a positive integer")
+        return self._take(count, timeout)
+
+    def get(self, timeout: Optional[float] = None) -> Optional[PoolItem]:
+        data = self._take(1, timeout)
+        return _format_record(data, self.config.output_format) if data else None
+
+    def get_batch(self, count: int, timeout: Optional[float] = None) -> List[PoolItem]:
+        return format_uuid_buffer(self.get_batch_bytes(count, timeout), self.config.output_format)
+
+    def get_array(self, count: int, timeout: Optional[float] = None) -> UUIDArray:
+        return UUIDArray(self.get_batch_bytes(count, timeout))
+
+    def put(self, uuid_obj: PoolItem) -> bool:
+        data = _item_bytes(uuid_obj)
+        self._acquire()
+        try:
+            return self._push_locked(data) == 1
+        finally:
+            self._release()
+
+    def get_stats(self) -> PoolStats:
+        self._acquire()
+        try:
+            values = self._HEADER.unpack_from(self._shm.buf, 0)
+        finally:
+            self._release()
+        return PoolStats(
+            current_size=values[self._TAIL] - values[self._HEAD],
+            total_generated=values[self._TOTAL_GENERATED],
+            total_consumed=values[self._TOTAL_CONSUMED],
+            cache_hits=values[self._CACHE_HITS],
+            cache_misses=values[self._CACHE_MISSES],
+            refill_count=values[self._REFILL_COUNT],
+            eviction_count=values[self._EVICTION_COUNT],
+            refill_errors=values[self._REFILL_ERRORS],
+            refill_restarts=values[self._REFILL_RESTARTS],
+        )
+
+    def get_hit_rate(self) -> float:
+        stats = self.get_stats()
+        total_requests = stats.cache_hits + stats.cache_misses
+        return stats.cache_hits / total_requests if total_requests > 0 else 0.0
+
+    def clear(self):
+        self._acquire()
+        try:
+            self._write(self._HEAD, self._read(self._TAIL))
+        finally:
+            self._release()
+        with self.lock:
+            self._local = b""
+
+    def shutdown(self):
+        self._running = False
+        self._stopped.set()
+        if self.is_producer:
+            self._refill_thread.join(timeout=1.0)
+            self.clear()
+            self._write(self._RUNNING, 0)
+        self._shm.close()
+        if self.is_producer:
+            self._shm.unlink()
+            try:
+                os.unlink(self._lock_file.name)
+            except OSError:
+                pass
+        self._lock_file.close()
+
+
+class AsyncUUIDPool:
+    def __init__(self, config: Optional[PoolConfig] = None):
+        self.config = config or PoolConfig()
+        self._generate_bytes = _batch_generator(self.config)
+        self.pool = UUIDSlabRing(self.config.max_size)
+        self.stats = PoolStats(
+            current_size=0,
+            total_generated=0,
+            total_consumed=0,
+            cache_hits=0,
+            cache_misses=0,
+            refill_count=0,
+            eviction_count=0,
+        )
+        self._expiry = ExpirySegments(
+            (self.config.ttl_seconds or 0.0) / max(1, self.config.eviction_segments)
+        )
+        self._waiters: deque = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._refill_task: Optional[asyncio.Task] = None
+        self._running = False
+
+    async def __aenter__(self) -> "AsyncUUIDPool":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.shutdown()
+
+    async def start(self):
+        if self._running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._running = True
+        if self.config.prefill:
+            self._refill(self.config.min_size)
+        self._refill_task = self._loop.create_task(self._refill_loop())
+
+    def _push(self, data: bytes, generated: bool = True) -> int:
+        ring = self.pool
+        with ring.lock:
+            added = ring.push_locked(data)
+        if self.config.ttl_seconds:
+            self._expiry.record(ring.tail, time.monotonic())
+        if generated:
+            self.stats.total_generated += added
+        self.stats.current_size = ring.count
+        for _ in range(added):
+            if not self._wake_one_waiter():
+                break
+        return added
+
+    def _wake_one_waiter(self) -> bool:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return True
+        return False
+
+    def _refill(self, count: int):
+        if count > 0:
+            self._push(self._generate_bytes(count))
+
+    def _evict_expired(self):
+        start = time.perf_counter()
+        cutoff = time.monotonic() - self.config.ttl_seconds
+        evicted_count = self.pool.drop_until_locked(
+            self._expiry.expired_until(self.pool.head, cutoff)
+        )
+        elapsed = time.perf_counter() - start
+        self.stats.eviction_count += evicted_count
+        self.stats.eviction_ticks += 1
+        self.stats.last_eviction_seconds = elapsed
+        self.stats.total_eviction_seconds += elapsed
+        self.stats.current_size = self.pool.count
+
+    async def _refill_loop(self):
+        while self._running:
+            try:
+                self._wakeup.clear()
+                current_size = self.pool.count
+                threshold = int(self.config.max_size * self.config.refill_threshold)
+                if current_size < threshold or self._waiters:
+                    self._refill(
+                        min(self.config.refill_batch_size, self.config.max_size - current_size)
+                    )
+                    self.stats.refill_count += 1
+                if self.config.ttl_seconds:
+                    self._evict_expired()
+                await asyncio.wait_for(self._wakeup.wait(), self.config.refill_interval)
+            except asyncio.TimeoutError:
+                pass
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.stats.refill_errors += 1
+                await asyncio.sleep(self.config.refill_interval)
+
+    def _take_available(self, count: int) -> bytes:
+        data = self.pool.take_locked(count)
+        taken = len(data) // UUIDSlabRing.SLOT_SIZE
+        self.stats.total_consumed += taken
+        self.stats.cache_hits += taken
+        self.stats.current_size = self.pool.count
+        if self.pool.count < self.config.max_size * self.config.refill_threshold:
+            self._wakeup.set()
+        return data
+
+    async def _take(self, count: int, timeout: Optional[float]) -> bytes:
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        if not self._running:
+            await self.start()
+        deadline = None if timeout is None else self._loop.time() + timeout
+        chunks = []
+        remaining = count
+        while remaining:
+            data = self._take_available(remaining)
+            if data:
+                chunks.append(data)
+                remaining -= len(data) // UUIDSlabRing.SLOT_SIZE
+                continue
+            wait_for = None if deadline is None else deadline - self._loop.time()
+            if wait_for is not None and wait_for <= 0:
+                self.stats.cache_misses += 1
+                break
+            waiter = self._loop.create_future()
+            self._waiters.append(waiter)
+            self._wakeup.set()
+            try:
+                await asyncio.wait_for(waiter, wait_for)
+            except asyncio.TimeoutError:
+                self.stats.cache_misses += 1
+                break
+        return b"".join(chunks)
+
+    async def aget(self, timeout: Optional[float] = None) -> Optional[PoolItem]:
+        data = await self._take(1, timeout)
+        return _format_record(data, self.config.output_format) if data else None
+
+    async def aget_bytes(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        return await self._take(1, timeout) or None
+
+    async def aget_batch(
+        self, count: int, timeout: Optional[float] = None
+    ) -> List[PoolItem]:
+        if not isinstance(count, int) or count < 1:
+            raise ValueError("count must be a positive integer")
+        return format_uuid_buffer(await self._take(count, timeout), self.config.output_format)
+
+    def get_nowait(self) -> Optional[PoolItem]:
+        data = self.pool.take_locked(1)
+        if not data:
+            self.stats.cache_misses += 1
+            return None
+        self.stats.total_consumed += 1
+        self.stats.cache_hits += 1
+        self.stats.current_size = self.pool.count
+        return _format_record(data, self.config.output_format)
+
+    def put(self, uuid_obj: PoolItem) -> bool:
+        return self._push(_item_bytes(uuid_obj), generated=False) == 1
+
+    def feed_threadsafe(self, data: bytes):
+        if self._loop is None:
+            raise RuntimeError("pool has not been started")
+        self._loop.call_soon_threadsafe(self._push, data)
+
+    def get_stats(self) -> PoolStats:
+        self.stats.current_size = self.pool.count
+        return replace(self.stats)
+
+    def get_hit_rate(self) -> float:
+        total_requests = self.stats.cache_hits + self.stats.cache_misses
+        return self.stats.cache_hits / total_requests if total_requests > 0 else 0.0
+
+    def clear(self):
+        self.pool.clear_locked()
+        self._expiry.clear()
+        self.stats.current_size = 0
+
+    async def shutdown(self):
+        self._running = False
+        if self._refill_task is not None:
+            self._refill_task.cancel()
+            try:
+                await self._refill_task
+            except asyncio.CancelledError:
+                pass
+            self._refill_task = None
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.cancel()
+        self._waiters.clear()
+        self.clear()
 
 
 class UUIDPoolManager:
-    def __init__(self):
+    def __init__(self, metrics: Optional[MetricsRegistry] = None):
+        self.metrics = metrics
         self.pools: Dict[str, UUIDPool] = {}
+        self.shared_pools: Dict[str, SharedUUIDPool] = {}
         self.lock = threading.Lock()
 
     def get_pool(self, name: str, config: Optional[PoolConfig] = None) -> UUIDPool:
         with self.lock:
             if name not in self.pools:
-                self.pools[name] = UUIDPool(config)
+                pool = UUIDPool(config, metrics=NULL_REGISTRY)
+                pool.instrument(self.metrics, pool=name)
+                self.pools[name] = pool
             return self.pools[name]
 
+    def get_shared_pool(
+        self,
+        name: str,
+        config: Optional[PoolConfig] = None,
+        create: bool = False,
+        claim_size: int = 1,
+    ) -> SharedUUIDPool:
+        with self.lock:
+            if name not in self.shared_pools:
+                self.shared_pools[name] = SharedUUIDPool(
+                    name, config, create=create, claim_size=claim_size, metrics=self.metrics
+                )
+            return self.shared_pools[name]
+
     def remove_pool(self, name: str):
         with self.lock:
             if name in self.pools:
                 self.pools[name].shutdown()
                 del self.pools[name]
+            if name in self.shared_pools:
+                self.shared_pools[name].shutdown()
+                del self.shared_pools[name]
 
     def get_all_stats(self) -> Dict[str, PoolStats]:
         with self.lock:
-            return {name: pool.get_stats() for name, pool in self.pools.items()}
+            stats = {name: pool.get_stats() for name, pool in self.shared_pools.items()}
+            stats.update({name: pool.get_stats() for name, pool in self.pools.items()})
+            return stats
 
 
 if __name__ == "__main__":
@@ -257,3 +1652,21 @@ if __name__ == "__main__":
 
     pool.shutdown()
 
+    diagnosed = UUIDPool(
+        PoolConfig(
+            min_size=100,
+            max_size=1000,
+            refill_interval=0.01,
+            diagnostics=True,
+            watchdog_interval=0.05,
+        )
+    )
+    diagnosed.get_batch(900)
+    time.sleep(0.2)
+    summary = diagnosed.dump_diagnostics()["summary"]
+    print(
+        f"Refill ticks: {summary['ticks']}, generated {summary['generated']}, "
+        f"max sleep drift {summary['max_sleep_drift'] * 1000:.2f} ms"
+    )
+    diagnosed.shutdown()
+
@@ -0,0 +1,302 @@
+import binascii
+import mmap
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+
+from uuid_analysis import (
+    CollisionDetector,
+    DistributionAccumulator,
+    DistributionStats,
+    StreamingUUIDAnalyzer,
+)
+from uuid_array import RECORD_SIZE, UUIDArray
+from uuid_utils import parse_uuids_batch
+
+SCAN_FORMATS = ("binary", "text")
+SCAN_TASKS = ("validate", "analyze")
+
+_CANONICAL_LINE = (
+    rb"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
+_CANONICAL_LINES_PATTERN = re.compile(
+    rb"(?:" + _CANONICAL_LINE + rb"\r?\n)*(?:" + _CANONICAL_LINE + rb"\r?)?"
+)
+_TEXT_LINE_SIZE = 37
+
+
+@dataclass
+class ScanStats:
+    records: int = 0
+    valid: int = 0
+    invalid: int = 0
+    chunks: int = 0
+    bytes_scanned: int = 0
+    bytes_checked: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def throughput_mb_per_second(self) -> Optional[float]:
+        if not self.bytes_checked or self.elapsed_seconds <= 0:
+            return None
+        return self.bytes_checked / self.elapsed_seconds / 1_000_000
+
+    def merge(self, other: "ScanStats") -> "ScanStats":
+        self.records += other.records
+        self.valid += other.valid
+        self.invalid += other.invalid
+        self.chunks += other.chunks
+        self.bytes_scanned += other.bytes_scanned
+        self.bytes_checked += other.bytes_checked
+        return self
+
+
+def _decode_text(data: bytes, strict: bool, pack: bool = True) -> Tuple[bytes, int, int]:
+    if _CANONICAL_LINES_PATTERN.fullmatch(data):
+        records = data.count(b"\n") + (1 if data and not data.endswith(b"\n") else 0)
+        if not pack:
+            return b"", records, 0
+        return binascii.a2b_hex(data.translate(None, b"-\r\n")), records, 0
+    lines = [line.strip() for line in data.decode("latin-1").split("\n")]
+    lines = [line for line in lines if line]
+    mask, values = parse_uuids_batch(lines, strict)
+    invalid = mask.count(0)
+    if not pack:
+        return b"", len(lines) - invalid, invalid
+    packed = b"".join(
+        value.to_bytes(RECORD_SIZE, "big") for valid, value in zip(mask, values) if valid
+    )
+    return packed, len(lines) - invalid, invalid
+
+
+class UUIDFileScanner:
+    def __init__(
+        self,
+        filepath: str,
+        file_format: str = "text",
+        chunk_records: int = 1 << 16,
+        strict: bool = False,
+    ):
+        if file_format not in SCAN_FORMATS:
+            raise ValueError(f"file_format must be one of {SCAN_FORMATS}")
+        if not isinstance(chunk_records, int) or chunk_records < 1:
+            raise ValueError("chunk_records must be a positive integer")
+        self.filepath = filepath
+        self.file_format = file_format
+        self.chunk_records = chunk_records
+        self.strict = strict
+        self.invalid_count = 0
+        self._file = open(filepath, "rb")
+        self.size = os.fstat(self._file.fileno()).st_size
+        self._map = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+        )
+
+    def __enter__(self) -> "UUIDFileScanner":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                pass
+            self._map = None
+        self._file.close()
+
+    def _align(self, position: int) -> int:
+        if position <= 0:
+            return 0
+        if position >= self.size:
+            return self.size
+        if self.file_format == "binary":
+            return position - position % RECORD_SIZE
+        newline = self._map.find(b"\n", position - 1)
+        return self.size if newline == -1 else newline + 1
+
+    def spans(self, parts: int) -> List[Tuple[int, int]]:
+        if not isinstance(parts, int) or parts < 1:
+            raise ValueError("parts must be a positive integer")
+        bounds = sorted({self._align(self.size * i // parts) for i in range(parts + 1)})
+        return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+    def _chunk_ranges(self, start: int, end: int) -> Iterator[Tuple[int, int]]:
+        record_size = RECORD_SIZE if self.file_format == "binary" else _TEXT_LINE_SIZE
+        step = self.chunk_records * record_size
+        while start < end:
+            stop = min(end, self._align(start + step)) if start + step < end else end
+            if stop <= start:
+                stop = end
+            yield start, stop
+            start = stop
+
+    def iter_chunks(self, start: int = 0, end: Optional[int] = None) -> Iterator[UUIDArray]:
+        self.invalid_count = 0
+        if self._map is None:
+            return
+        end = self.size if end is None else end
+        view = memoryview(self._map)
+        try:
+            for chunk_start, chunk_end in self._chunk_ranges(start, end):
+                if self.file_format == "binary":
+                    usable = chunk_end - (chunk_end - chunk_start) % RECORD_SIZE
+                    if usable < chunk_end:
+                        self.invalid_count += 1
+                    yield UUIDArray(view[chunk_start:usable])
+                else:
+                    packed, _, invalid = _decode_text(
+                        self._map[chunk_start:chunk_end], self.strict
+                    )
+                    self.invalid_count += invalid
+                    yield UUIDArray(packed)
+        finally:
+            view.release()
+
+    def _scan_stats(self, start: int, end: int) -> ScanStats:
+        stats = ScanStats()
+        if self._map is None:
+            return stats
+        for chunk_start, chunk_end in self._chunk_ranges(start, end):
+            stats.chunks += 1
+            stats.bytes_scanned += chunk_end - chunk_start
+            if self.file_format == "binary":
+                valid = (chunk_end - chunk_start) // RECORD_SIZE
+                invalid = 1 if (chunk_end - chunk_start) % RECORD_SIZE else 0
+            else:
+                _, valid, invalid = _decode_text(
+                    self._map[chunk_start:chunk_end], self.strict, pack=False
+                )
+                stats.bytes_checked += chunk_end - chunk_start
+            stats.valid += valid
+            stats.invalid += invalid
+            stats.records += valid + invalid
+        return stats
+
+    def _analyze_span(
+        self, start: int, end: int, top_k: int, anomaly_threshold: float
+    ) -> StreamingUUIDAnalyzer:
+        analyzer = StreamingUUIDAnalyzer(top_k, anomaly_threshold)
+        for chunk in self.iter_chunks(start, end):
+            analyzer.feed(chunk)
+        analyzer.invalid_count += self.invalid_count
+        return analyzer
+
+    def _parallel(self, task: str, workers: int, *args) -> List:
+        spans = self.spans(workers * 4)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _scan_span,
+                    self.filepath,
+                    self.file_format,
+                    self.chunk_records,
+                    self.strict,
+                    task,
+                    start,
+                    end,
+                    *args,
+                )
+                for start, end in spans
+            ]
+            return [future.result() for future in futures]
+
+    def validate(self, workers: int = 1) -> ScanStats:
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("workers must be a positive integer")
+        started = time.perf_counter()
+        if workers == 1:
+            stats = self._scan_stats(0, self.size)
+        else:
+            stats = ScanStats()
+            for partial in self._parallel("validate", workers):
+                stats.merge(partial)
+        stats.elapsed_seconds = time.perf_counter() - started
+        return stats
+
+    def analyze(
+        self, workers: int = 1, top_k: int = 100, anomaly_threshold: float = 2.0
+    ) -> StreamingUUIDAnalyzer:
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("workers must be a positive integer")
+        if workers == 1:
+            return self._analyze_span(0, self.size, top_k, anomaly_threshold)
+        analyzer = StreamingUUIDAnalyzer(top_k, anomaly_threshold)
+        for partial in self._parallel("analyze", workers, top_k, anomaly_threshold):
+            analyzer.merge(partial)
+        return analyzer
+
+    def detect_collisions(
+        self, mode: str = "exact", error_rate: float = 0.001
+    ) -> CollisionDetector:
+        record_size = RECORD_SIZE if self.file_format == "binary" else _TEXT_LINE_SIZE
+        detector = CollisionDetector(
+            mode, error_rate, expected_items=max(1, self.size // record_size)
+        )
+        for chunk in self.iter_chunks():
+            detector.feed(chunk)
+        return detector
+
+    def analyze_distribution(
+        self, backend: str = "auto", collision_mode: str = "exact", error_rate: float = 0.001
+    ) -> DistributionStats:
+        record_size = RECORD_SIZE if self.file_format == "binary" else _TEXT_LINE_SIZE
+        accumulator = DistributionAccumulator(
+            backend, collision_mode, error_rate, expected_items=max(1, self.size // record_size)
+        )
+        for chunk in self.iter_chunks():
+            accumulator.feed(chunk)
+        return accumulator.result()
+
+
+def _scan_span(
+    filepath: str,
+    file_format: str,
+    chunk_records: int,
+    strict: bool,
+    task: str,
+    start: int,
+    end: int,
+    *args,
+):
+    if task not in SCAN_TASKS:
+        raise ValueError(f"task must be one of {SCAN_TASKS}")
+    with UUIDFileScanner(filepath, file_format, chunk_records, strict) as scanner:
+        if task == "validate":
+            return scanner._scan_stats(start, end)
+        return scanner._analyze_span(start, end, *args)
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    from uuid_utils import generate_uuid4_bytes
+
+    records = 200000
+    raw = generate_uuid4_bytes(records)
+    with tempfile.TemporaryDirectory() as directory:
+        binary_path = os.path.join(directory, "ids.bin")
+        text_path = os.path.join(directory, "ids.txt")
+        UUIDArray(raw).tofile(binary_path)
+        with open(text_path, "wb") as handle:
+            handle.write(UUIDArray(raw).to_text())
+
+        for path, file_format in [(binary_path, "binary"), (text_path, "text")]:
+            with UUIDFileScanner(path, file_format) as scanner:
+                stats = scanner.validate()
+                throughput = stats.throughput_mb_per_second
+                print(
+                    f"{file_format}: {stats.valid} valid, {stats.invalid} invalid, "
+                    + ("checked from file size" if throughput is None else f"{throughput:.0f} MB/s")
+                )
+                detector = scanner.detect_collisions()
+                print(f"  collisions: {detector.collision_count}")
+
+        with UUIDFileScanner(text_path, "text") as scanner:
+            analyzer = scanner.analyze(workers=2)
+            print(f"  analyzed: {analyzer.total}, entropy {analyzer.entropy_mean:.4f}")
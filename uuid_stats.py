@@ -0,0 +1,13 @@
+import math
+from typing import Sequence
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    if not sorted_values:
+        raise ValueError("sorted_values must not be empty")
+    if not (0 <= fraction <= 1):
+        raise ValueError("fraction must be between 0 and 1")
+    position = (len(sorted_values) - 1) * fraction
+    lower = math.floor(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
@@ -1,15 +1,132 @@
+import hashlib
+import os
+import re
+import struct
+import threading
+import time
 import uuid
-from typing import Optional
+from contextlib import nullcontext
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple, Union
 
+OUTPUT_FORMATS = ("uuid", "bytes", "hex", "upper_hex", "str")
 
-def is_valid_uuid(uuid_string: str) -> bool:
-    if not isinstance(uuid_string, str):
-        return False
+_UUID4_VERSION_TABLE = bytes((b & 0x0F) | 0x40 for b in range(256))
+_RFC_4122_VARIANT_TABLE = bytes((b & 0x3F) | 0x80 for b in range(256))
+_CANONICAL_UUID_PATTERN = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
+_HEX_UUID_PATTERN = re.compile(r"[0-9a-fA-F]{32}")
+_LENIENT_UUID_PATTERN = re.compile(r"[0-9a-fA-F{}_+xXurnid:\s-]+")
+_UNIX_TO_GREGORIAN_TICKS = 0x01B21DD213814000
+_UUID7_COUNTER_BITS = 42
+_UUID7_COUNTER_MASK = (1 << _UUID7_COUNTER_BITS) - 1
+_UUID7_SEED_MASK = (1 << (_UUID7_COUNTER_BITS - 1)) - 1
+_NAME_BASED_VERSION_TABLES = {
+    version: bytes((b & 0x0F) | (version << 4) for b in range(256)) for version in (3, 5)
+}
+
+
+class NamespaceHasher:
+    def __init__(self, namespace: uuid.UUID, version: int = 5):
+        if not isinstance(namespace, uuid.UUID):
+            raise ValueError("namespace must be a UUID")
+        if version not in _NAME_BASED_VERSION_TABLES:
+            raise ValueError("version must be 3 or 5")
+        self.namespace = namespace
+        self.version = version
+        if version == 5:
+            self._primed = hashlib.sha1(namespace.bytes, usedforsecurity=False)
+        else:
+            self._primed = hashlib.md5(namespace.bytes, usedforsecurity=False)
+        self._version_table = _NAME_BASED_VERSION_TABLES[version]
+
+    def hash_bytes(self, name: str) -> bytes:
+        digest = self._primed.copy()
+        digest.update(name.encode("utf-8"))
+        raw = bytearray(digest.digest()[:16])
+        raw[6] = (raw[6] & 0x0F) | (self.version << 4)
+        raw[8] = (raw[8] & 0x3F) | 0x80
+        return bytes(raw)
+
+    def hash(self, name: str) -> uuid.UUID:
+        return uuid.UUID(bytes=self.hash_bytes(name))
+
+    def hash_batch(self, names: Iterable[str]) -> bytes:
+        copy = self._primed.copy
+        buffer = bytearray()
+        for name in names:
+            digest = copy()
+            digest.update(name.encode("utf-8"))
+            buffer += digest.digest()[:16]
+        buffer[6::16] = buffer[6::16].translate(self._version_table)
+        buffer[8::16] = buffer[8::16].translate(_RFC_4122_VARIANT_TABLE)
+        return bytes(buffer)
+
+
+@lru_cache(maxsize=128)
+def _dns_namespace_hasher(namespace: str) -> NamespaceHasher:
+    return NamespaceHasher(uuid.uuid5(uuid.NAMESPACE_DNS, namespace))
+
+
+def _parse_uuid_int(uuid_string: str, strict: bool) -> Optional[int]:
+    length = len(uuid_string)
+    if length == 36:
+        if _CANONICAL_UUID_PATTERN.fullmatch(uuid_string):
+            return int(uuid_string.replace("-", ""), 16)
+    elif length == 32 and not strict:
+        if _HEX_UUID_PATTERN.fullmatch(uuid_string):
+            return int(uuid_string, 16)
+    if strict or length < 32:
+        return None
+    if uuid_string.isascii() and not _LENIENT_UUID_PATTERN.fullmatch(uuid_string):
+        return None
     try:
-        uuid.UUID(uuid_string)
-        return True
+        return uuid.UUID(uuid_string).int
     except (ValueError, TypeError):
+        return None
+
+
+def _split_uuid_lines(values: Union[List[str], bytes, bytearray, memoryview]) -> List[str]:
+    if isinstance(values, (bytes, bytearray, memoryview)):
+        lines = bytes(values).decode("latin-1").split("\n")
+        if lines and not lines[-1]:
+            lines.pop()
+        return [line[:-1] if line.endswith("\r") else line for line in lines]
+    return values
+
+
+def is_valid_uuid(uuid_string: str, strict: bool = False) -> bool:
+    if not isinstance(uuid_string, str):
         return False
+    return _parse_uuid_int(uuid_string, strict) is not None
+
+
+def is_valid_uuid_batch(
+    values: Union[List[str], bytes, bytearray, memoryview], strict: bool = False
+) -> bytearray:
+    return parse_uuids_batch(values, strict)[0]
+
+
+def parse_uuids_batch(
+    values: Union[List[str], bytes, bytearray, memoryview], strict: bool = False
+) -> Tuple[bytearray, List[int]]:
+    lines = _split_uuid_lines(values)
+    mask = bytearray(len(lines))
+    parsed = [0] * len(lines)
+    canonical = _CANONICAL_UUID_PATTERN.fullmatch
+    for i, line in enumerate(lines):
+        if not isinstance(line, str):
+            continue
+        if len(line) == 36 and canonical(line):
+            value = int(line.replace("-", ""), 16)
+        else:
+            value = _parse_uuid_int(line, strict)
+            if value is None:
+                continue
+        mask[i] = 1
+        parsed[i] = value
+    return mask, parsed
 
 
 def generate_user_id() -> uuid.UUID:
@@ -49,17 +166,238 @@ def generate_api_key() -> str:
 def generate_namespace_uuid(namespace: str, name: str) -> uuid.UUID:
     if not isinstance(namespace, str) or not isinstance(name, str):
         raise ValueError("namespace and name must be strings")
-    namespace_uuid = uuid.uuid5(uuid.NAMESPACE_DNS, namespace)
-    return uuid.uuid5(namespace_uuid, name)
+    return _dns_namespace_hasher(namespace).hash(name)
+
+
+def generate_uuid4_bytes(count: int) -> bytes:
+    if not isinstance(count, int) or count < 1:
+        raise ValueError("count must be a positive integer")
+    buffer = bytearray(os.urandom(count * 16))
+    buffer[6::16] = buffer[6::16].translate(_UUID4_VERSION_TABLE)
+    buffer[8::16] = buffer[8::16].translate(_RFC_4122_VARIANT_TABLE)
+    return bytes(buffer)
+
+
+def format_uuid_buffer(
+    buffer: Union[bytes, bytearray, memoryview], output_format: str = "uuid"
+) -> List:
+    if len(buffer) % 16:
+        raise ValueError("buffer length must be a multiple of 16")
+    if output_format == "bytes":
+        raw = bytes(buffer)
+        return [raw[i : i + 16] for i in range(0, len(raw), 16)]
+    if output_format == "uuid":
+        raw = bytes(buffer)
+        return [uuid.UUID(bytes=raw[i : i + 16]) for i in range(0, len(raw), 16)]
+    hex_str = buffer.hex()
+    if output_format == "hex":
+        return [hex_str[i : i + 32] for i in range(0, len(hex_str), 32)]
+    if output_format == "upper_hex":
+        hex_str = hex_str.upper()
+        return [hex_str[i : i + 32] for i in range(0, len(hex_str), 32)]
+    if output_format == "str":
+        return [
+            f"{hex_str[i:i + 8]}-{hex_str[i + 8:i + 12]}-{hex_str[i + 12:i + 16]}-"
+            f"{hex_str[i + 16:i + 20]}-{hex_str[i + 20:i + 32]}"
+            for i in range(0, len(hex_str), 32)
+        ]
+    raise ValueError(f"output_format must be one of {OUTPUT_FORMATS}")
+
+
+def generate_uuid4_batch(count: int, output_format: str = "uuid") -> List:
+    return format_uuid_buffer(generate_uuid4_bytes(count), output_format)
+
+
+class UUIDv7Generator:
+    def __init__(self, thread_safe: bool = True):
+        self._lock = threading.Lock() if thread_safe else nullcontext()
+        self._last_ms = 0
+        self._counter = 0
+
+    def _reserve(self, count: int) -> Tuple[int, int]:
+        now_ms = time.time_ns() // 1_000_000
+        with self._lock:
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                self._counter = int.from_bytes(os.urandom(6), "big") & _UUID7_SEED_MASK
+            timestamp_ms = self._last_ms
+            counter = self._counter
+            end = counter + count
+            self._last_ms += end >> _UUID7_COUNTER_BITS
+            self._counter = end & _UUID7_COUNTER_MASK
+        return timestamp_ms, counter
+
+    def generate_batch_bytes(self, count: int) -> bytes:
+        if not isinstance(count, int) or count < 1:
+            raise ValueError("count must be a positive integer")
+        timestamp_ms, counter = self._reserve(count)
+        words = []
+        append = words.append
+        for value, tail in enumerate(struct.unpack(f">{count}I", os.urandom(4 * count)), counter):
+            append(
+                ((timestamp_ms + (value >> _UUID7_COUNTER_BITS)) << 16)
+                | 0x7000
+                | ((value >> 30) & 0xFFF)
+            )
+            append(0x8000000000000000 | ((value & 0x3FFFFFFF) << 32) | tail)
+        return struct.pack(f">{2 * count}Q", *words)
+
+    def _generate_int(self) -> int:
+        timestamp_ms, counter = self._reserve(1)
+        return (
+            ((timestamp_ms + (counter >> _UUID7_COUNTER_BITS)) << 80)
+            | (0x7 << 76)
+            | (((counter >> 30) & 0xFFF) << 64)
+            | (0x2 << 62)
+            | ((counter & 0x3FFFFFFF) << 32)
+            | int.from_bytes(os.urandom(4), "big")
+        )
+
+    def generate_bytes(self) -> bytes:
+        return self._generate_int().to_bytes(16, "big")
+
+    def generate(self) -> uuid.UUID:
+        return uuid.UUID(int=self._generate_int())
+
+    def generate_batch(self, count: int, output_format: str = "uuid") -> List:
+        return format_uuid_buffer(self.generate_batch_bytes(count), output_format)
+
+
+class UUIDv6Generator:
+    def __init__(
+        self, node: Optional[int] = None, clock_seq: Optional[int] = None, thread_safe: bool = True
+    ):
+        if node is None:
+            node = int.from_bytes(os.urandom(6), "big") | (1 << 40)
+        if clock_seq is None:
+            clock_seq = int.from_bytes(os.urandom(2), "big") & 0x3FFF
+        if not isinstance(node, int) or not 0 <= node < (1 << 48):
+            raise ValueError("node must be a 48-bit integer")
+        if not isinstance(clock_seq, int) or not 0 <= clock_seq < (1 << 14):
+            raise ValueError("clock_seq must be a 14-bit integer")
+        self.node = node
+        self.clock_seq = clock_seq
+        self._low = 0x8000000000000000 | (clock_seq << 48) | node
+        self._lock = threading.Lock() if thread_safe else nullcontext()
+        self._last_ticks = 0
+
+    def _reserve(self, count: int) -> int:
+        ticks = time.time_ns() // 100 + _UNIX_TO_GREGORIAN_TICKS
+        with self._lock:
+            if ticks <= self._last_ticks:
+                ticks = self._last_ticks + 1
+            self._last_ticks = ticks + count - 1
+        return ticks
+
+    def generate_batch_bytes(self, count: int) -> bytes:
+        if not isinstance(count, int) or count < 1:
+            raise ValueError("count must be a positive integer")
+        start = self._reserve(count)
+        low = self._low
+        words = []
+        append = words.append
+        for ticks in range(start, start + count):
+            append(((ticks >> 12) << 16) | 0x6000 | (ticks & 0xFFF))
+            append(low)
+        return struct.pack(f">{2 * count}Q", *words)
+
+    def generate_bytes(self) -> bytes:
+        return self.generate_batch_bytes(1)
 
+    def generate(self) -> uuid.UUID:
+        return uuid.UUID(bytes=self.generate_batch_bytes(1))
 
-def uuid_from_string(uuid_string: str) -> Optional[uuid.UUID]:
+    def generate_batch(self, count: int, output_format: str = "uuid") -> List:
+        return format_uuid_buffer(self.generate_batch_bytes(count), output_format)
+
+
+_UUID7_GENERATOR = UUIDv7Generator()
+_UUID6_GENERATOR = UUIDv6Generator()
+
+
+def generate_uuid7() -> uuid.UUID:
+    return _UUID7_GENERATOR.generate()
+
+
+def generate_uuid7_bytes(count: int) -> bytes:
+    return _UUID7_GENERATOR.generate_batch_bytes(count)
+
+
+def generate_uuid7_batch(count: int, output_format: str = "uuid") -> List:
+    return _UUID7_GENERATOR.generate_batch(count, output_format)
+
+
+def generate_uuid6() -> uuid.UUID:
+    return _UUID6_GENERATOR.generate()
+
+
+def generate_uuid6_bytes(count: int) -> bytes:
+    return _UUID6_GENERATOR.generate_batch_bytes(count)
+
+
+def generate_uuid6_batch(count: int, output_format: str = "uuid") -> List:
+    return _UUID6_GENERATOR.generate_batch(count, output_format)
+
+
+def uuid7_from_entropy(timestamp_ms: int, entropy: bytes) -> uuid.UUID:
+    if not isinstance(timestamp_ms, int) or not 0 <= timestamp_ms < (1 << 48):
+        raise ValueError("timestamp_ms must be a 48-bit integer")
+    if len(entropy) != 10:
+        raise ValueError("entropy must be 10 bytes")
+    raw = bytearray(timestamp_ms.to_bytes(6, "big") + bytes(entropy))
+    raw[6] = (raw[6] & 0x0F) | 0x70
+    raw[8] = (raw[8] & 0x3F) | 0x80
+    return uuid.UUID(bytes=bytes(raw))
+
+
+def uuid7_timestamp_ms(uuid_obj: uuid.UUID) -> int:
+    return uuid_obj.int >> 80
+
+
+def generate_user_ids(count: int) -> List[uuid.UUID]:
+    return generate_uuid4_batch(count, "uuid")
+
+
+def generate_session_tokens(count: int) -> List[str]:
+    return generate_uuid4_batch(count, "hex")
+
+
+def generate_api_keys(count: int) -> List[str]:
+    return generate_uuid4_batch(count, "hex")
+
+
+def generate_transaction_ids(count: int) -> List[str]:
+    return generate_uuid4_batch(count, "upper_hex")
+
+
+def generate_short_ids(count: int, length: int = 8) -> List[str]:
+    if not isinstance(length, int) or length < 1 or length > 32:
+        raise ValueError("length must be an integer between 1 and 32")
+    return [token[:length] for token in generate_uuid4_batch(count, "hex")]
+
+
+def generate_secure_tokens(count: int, length: int = 32) -> List[str]:
+    if not isinstance(length, int) or length < 16 or length > 64:
+        raise ValueError("length must be an integer between 16 and 64")
+    return [token[:length] for token in generate_uuid4_batch(count, "hex")]
+
+
+def generate_filenames(count: int, extension: str = "txt") -> List[str]:
+    if not extension or not isinstance(extension, str):
+        raise ValueError("extension must be a non-empty string")
+    return [
+        f"file_{token[:8]}.{extension}"
+        for token in generate_uuid4_batch(count, "hex")
+    ]
+
+
+def uuid_from_string(uuid_string: str, strict: bool = False) -> Optional[uuid.UUID]:
     if not isinstance(uuid_string, str):
         return None
-    try:
-        return uuid.UUID(uuid_string)
-    except (ValueError, TypeError):
+    value = _parse_uuid_int(uuid_string, strict)
+    if value is None:
         return None
+    return uuid.UUID(int=value)
 
 
 def uuid_from_bytes(uuid_bytes: bytes) -> Optional[uuid.UUID]:
@@ -83,3 +421,6 @@ if __name__ == "__main__":
     print(f"Short ID: {generate_short_id(12)}")
     print(f"Secure Token: {generate_secure_token()}")
     print(f"Valid UUID check: {is_valid_uuid(str(test_uuid))}")
+    print(f"Batch session tokens: {generate_session_tokens(3)}")
+    print(f"UUIDv7: {generate_uuid7()}")
+    print(f"UUIDv6: {generate_uuid6()}")